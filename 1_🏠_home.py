@@ -2,6 +2,8 @@ import streamlit as st
 import pandas as pd
 from PIL import Image
 from utils import resource_path  # Importa a função centralizada
+from data_store import load_sheet
+from export_service import FORMATS, export_queue, serialize
 
 # Configurando Página (usa resource_path para encontrar o ícone)
 st.set_page_config(
@@ -27,12 +29,11 @@ st.markdown('''Painel para Acompanhamento de Metas Estratégicas - OKR's''')
 st.markdown('''Painel de Resultados BI Até 2024 https://app.powerbi.com/view?r=eyJrIjoiYjM0YTU4OWItNGEwOS00MGZkLWE1NGMtYTQyZWM5OGYzYjNiIiwidCI6Ijk5MWEwMGM5LTY1ZGUtNDFjMS04YzUxLTI3N2Q4YzEwZmNkYSJ9''')
 # CEBEÇALHO FIM
 
-# COMO FAZER PRA VIR DE EXCEL
-excel_home = resource_path("planilha_home.xlsx")
+# COMO FAZER PRA VIR DE EXCEL (snapshot do planilha_home.xlsx)
 ordem_meses = ["Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho", "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"]
 
 try:
-    df_original = pd.read_excel(excel_home)
+    df_original = load_sheet("home")
     if all(col in df_original.columns for col in ['OBJETIVOS', 'ANO', 'MÊS']):
         df_original['MÊS'] = df_original['MÊS'].apply(lambda x: str(x).capitalize() if not pd.isna(x) else "")
         df_original['ANO'] = df_original['ANO'].apply(lambda x: str(int(x)) if not pd.isna(x) else "")
@@ -63,10 +64,19 @@ try:
         st.markdown(f"Dados do Mês Selecionado: {mes_selecionado}" if mes_selecionado != "Todos" else "Dados de Todos os Meses")
         
         csv_file = "planilha_home.csv"
-        df_filtered.to_csv(csv_file, index=False, encoding='utf-8')
         st.markdown("### Objetivos e Indicadores Estratégicos")
         st.dataframe(df_filtered, use_container_width=True)
-        st.success(f"Planilha salva como '{csv_file}'!")
+        col_csv, col_parquet, col_export, _ = st.columns([1, 1, 1, 3])
+        col_csv.download_button("⬇️ Baixar CSV", data=lambda: serialize(df_filtered, ".csv"),
+                                file_name=csv_file, mime=FORMATS[".csv"])
+        col_parquet.download_button("⬇️ Baixar Parquet", data=lambda: serialize(df_filtered, ".parquet"),
+                                    file_name="planilha_home.parquet", mime=FORMATS[".parquet"])
+        # O arquivo na pasta do app é compartilhado: só é gravado quando pedido (em segundo plano)
+        col_export.button("💾 Exportar CSV", key="exportar_planilha_home",
+                          on_click=export_queue.submit, args=(df_filtered, csv_file))
+        ultima_exportacao = export_queue.status(csv_file)
+        if ultima_exportacao:
+            st.caption(f"Última exportação de '{csv_file}': {ultima_exportacao[0]}")
     else:
         st.warning("As colunas 'OBJETIVOS', 'ANO' e 'MÊS' não foram encontradas na planilha. Nenhum filtro será aplicado.")
 except FileNotFoundError:
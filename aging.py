@@ -0,0 +1,70 @@
+"""
+Faixas de aging das solicitações de assistência técnica ("Dias em Aberto").
+
+As bordas das faixas (SLAs) ficam em aging_buckets.json, ao lado das planilhas,
+para que a equipe de operações possa alterá-las sem mexer no código:
+
+    {"edges": [15, 30, 45, 60]}
+
+gera as faixas 0-15, 15-30, 30-45, 45-60 e >60 (limite superior incluso).
+Cada linha recebe o número da sua faixa numa única passada (np.digitize); as
+contagens e as tabelas de detalhamento saem desses códigos.
+"""
+import json
+import os
+
+import numpy as np
+
+from utils import resource_path
+
+CONFIG_FILE = "aging_buckets.json"
+DEFAULT_EDGES = (15, 30, 45, 60)
+
+
+def load_edges(path=None):
+    """
+    Bordas das faixas lidas de `path` (padrão: aging_buckets.json).
+    Sem arquivo, usa DEFAULT_EDGES; JSON malformado, conteúdo que não seja um
+    objeto ou bordas inválidas geram ValueError.
+    """
+    path = path or resource_path(CONFIG_FILE)
+    if not os.path.exists(path):
+        return DEFAULT_EDGES
+    with open(path, encoding="utf-8") as f:
+        config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError(f'Configuração de aging inválida em {path}: esperado um objeto '
+                         f'{{"edges": [...]}}, encontrado {type(config).__name__}')
+    edges = config.get("edges", DEFAULT_EDGES)
+    if not isinstance(edges, (list, tuple)):
+        raise ValueError(f"Bordas de aging inválidas em {path}: {edges!r} "
+                         "(use uma lista de números positivos em ordem crescente)")
+    edges = tuple(edges)
+    if not edges or any(not isinstance(e, (int, float)) or e <= 0 for e in edges) \
+            or any(a >= b for a, b in zip(edges, edges[1:])):
+        raise ValueError(f"Bordas de aging inválidas em {path}: {list(edges)} "
+                         "(use números positivos em ordem crescente)")
+    return edges
+
+def _fmt(value):
+    return f"{value:g}"
+
+def bucket_labels(edges):
+    """Rótulos das faixas: ["0-15", "15-30", ..., ">60"]."""
+    bounds = (0,) + tuple(edges)
+    labels = [f"{_fmt(lo)}-{_fmt(hi)}" for lo, hi in zip(bounds, bounds[1:])]
+    return labels + [f">{_fmt(edges[-1])}"]
+
+def assign_buckets(days, edges):
+    """
+    Código da faixa de cada valor de `days`: 0 para [0, e1], k para (ek, ek+1]
+    e len(edges) acima da última borda; -1 para vazios e valores negativos.
+    """
+    days = np.asarray(days, dtype=float)
+    codes = np.digitize(days, edges, right=True)
+    codes[np.isnan(days) | (days < 0)] = -1
+    return codes
+
+def bucket_counts(codes, edges):
+    """Quantidade de linhas em cada faixa (uma contagem por rótulo)."""
+    return np.bincount(codes[codes >= 0], minlength=len(edges) + 1)
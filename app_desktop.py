@@ -4,19 +4,90 @@ import os
 if getattr(sys, 'frozen', False):
     sys.path.append(sys._MEIPASS)
 
-import threading
+import socket
 import subprocess
+import threading
 import time
+import urllib.error
+import urllib.request
 import webview
 from utils import resource_path  # Agora deverá funcionar
+from data_store import ensure_snapshots
+
+HEALTH_PATH = "/_stcore/health"  # responde "ok" quando o servidor do Streamlit está pronto
+STARTUP_TIMEOUT = 60  # segundos
+
+
+def free_port():
+    """Porta TCP livre na máquina local (escolhida pelo sistema operacional)."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
 
-def start_streamlit():
+def start_streamlit(port):
+    """Inicia o servidor do Streamlit em segundo plano e retorna o processo."""
     home_file = resource_path("1_🏠_home.py")
-    subprocess.run(["streamlit", "run", home_file])
+    # Empacotado pelo PyInstaller, usa o executável "streamlit" do PATH (como antes)
+    command = ["streamlit"] if getattr(sys, 'frozen', False) else [sys.executable, "-m", "streamlit"]
+    return subprocess.Popen(command + [
+        "run", home_file,
+        "--server.port", str(port),
+        "--server.address", "127.0.0.1",
+        "--server.headless", "true",
+    ])
+
+def wait_until_ready(process, url, timeout=STARTUP_TIMEOUT):
+    """
+    Consulta o endpoint de saúde com espera crescente (50 ms até 1 s) até o servidor
+    responder. Levanta RuntimeError se o processo terminar ou o tempo acabar.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"O Streamlit terminou durante a inicialização (código {process.returncode}).")
+        try:
+            with urllib.request.urlopen(url + HEALTH_PATH, timeout=1) as response:
+                if response.status == 200:
+                    return
+        except (urllib.error.URLError, ConnectionError, TimeoutError):
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+    raise RuntimeError(f"O Streamlit não respondeu em {timeout} s.")
+
+def warm_cache():
+    """Gera os snapshots das planilhas enquanto o servidor sobe (a primeira página abre sem ler o Excel)."""
+    inicio = time.perf_counter()
+    try:
+        for path in ensure_snapshots():
+            print(f"[INFO] Snapshot gerado: {path}")
+        print(f"[INFO] Dados pré-carregados em {time.perf_counter() - inicio:.2f} s")
+    except Exception as e:
+        print(f"[AVISO] Não foi possível pré-carregar os dados: {e}")
+
+def stop_streamlit(process, timeout=10):
+    """Encerra o servidor ao fechar a janela (e força, se ele não sair a tempo)."""
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
 
 if __name__ == '__main__':
-    t = threading.Thread(target=start_streamlit, daemon=True)
-    t.start()
-    time.sleep(5)  # Ajuste o tempo se necessário
-    webview.create_window("Dashboard de Pós-Obra", "http://localhost:8501")
-    webview.start()
+    inicio = time.perf_counter()
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+
+    warm = threading.Thread(target=warm_cache, daemon=True)
+    warm.start()
+    server = start_streamlit(port)
+    try:
+        wait_until_ready(server, url)
+        print(f"[INFO] Streamlit pronto em {url} após {time.perf_counter() - inicio:.2f} s")
+        webview.create_window("Dashboard de Pós-Obra", url)
+        webview.start()
+    finally:
+        stop_streamlit(server)
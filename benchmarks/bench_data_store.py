@@ -0,0 +1,59 @@
+"""
+Benchmark do armazenamento colunar (data_store).
+
+Para cada aba compara:
+  - Excel:  leitura direta com pd.read_excel (caminho antigo das páginas)
+  - Frio:   primeira carga, sem snapshot (leitura do Excel + tipagem + gravação do Parquet)
+  - Quente: carga a partir do snapshot Parquet já existente
+
+Uso:
+    python benchmarks/bench_data_store.py [repetições]
+"""
+import os
+import shutil
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+import data_store
+from utils import resource_path
+
+
+def _timeit(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(repeat=3):
+    rows = []
+    for name, (book, sheet, read_kwargs) in data_store.SHEETS.items():
+        def legacy():
+            return pd.read_excel(resource_path(book), sheet_name=sheet, **read_kwargs)
+
+        def cold():
+            shutil.rmtree(data_store.SNAPSHOT_DIR, ignore_errors=True)
+            data_store._manifest = None
+            return data_store.load_sheet(name)
+
+        t_excel = _timeit(legacy, repeat)
+        t_cold = _timeit(cold, 1)
+        t_warm = _timeit(lambda: data_store.load_sheet(name), repeat)
+        rows.append({
+            "Aba": name,
+            "Excel (s)": round(t_excel, 4),
+            "Frio (s)": round(t_cold, 4),
+            "Quente (s)": round(t_warm, 4),
+            "Ganho (x)": round(t_excel / t_warm, 1) if t_warm else float("nan"),
+        })
+    print(pd.DataFrame(rows).to_string(index=False))
+    print("\nObs.: a carga fria gera os snapshots de todas as abas do mesmo arquivo.")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
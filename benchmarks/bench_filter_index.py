@@ -0,0 +1,96 @@
+"""
+Benchmark dos filtros do painel de Assistência Técnica (filter_index.FilterIndex).
+
+Replica a aba engenharia para tamanhos crescentes e compara a cadeia original
+de `.isin` (uma cópia do DataFrame por filtro ativo, com `.astype(str)` no N°)
+com a máscara única do índice. Falha se as linhas selecionadas divergirem.
+
+Uso:
+    python benchmarks/bench_filter_index.py [fator máximo de replicação]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from data_store import load_sheet
+from filter_index import FilterIndex
+from warranty_parser import split_sistema_falha
+
+COLUMNS = ["N°", "Responsável", "FCR", "Empreendimento", "Unidade", "Bloco", "Status",
+           "Garantia Solicitada", "Sistema Construtivo", "Tipo de Falha"]
+
+
+def legacy_filter(df, sel):
+    """Cópia da cadeia original de filtros da página."""
+    out = df.copy()
+    if sel["Ano"]:
+        out = out[out["Data de Abertura"].dt.year.isin(sel["Ano"])]
+    if sel["Mês"]:
+        out = out[out["Data de Abertura"].dt.month.isin(sel["Mês"])]
+    if sel["N°"]:
+        out = out[out["N°"].astype(str).isin([str(x) for x in sel["N°"]])]
+    for col in COLUMNS[1:]:
+        if sel[col]:
+            out = out[out[col].isin(sel[col])]
+    return out
+
+def build_index(df):
+    columns = {
+        "Ano": df["Data de Abertura"].dt.year.astype("Int64"),
+        "Mês": df["Data de Abertura"].dt.month.astype("Int64"),
+    }
+    columns.update({col: df[col] for col in COLUMNS})
+    return FilterIndex(columns)
+
+def load_engenharia():
+    df = load_sheet("engenharia")
+    df.columns = df.columns.str.strip().str.replace(r"\s+", " ", regex=True)
+    df["Data de Abertura"] = pd.to_datetime(df["Data de Abertura"], format="%d/%m/%Y", errors="coerce")
+    df[["Sistema Construtivo", "Tipo de Falha"]] = split_sistema_falha(df["Garantia Solicitada"])
+    return df
+
+def random_selections(index, rng, n):
+    """Seleções aleatórias com 0 a 3 filtros ativos (1 a 3 valores cada)."""
+    names = ["Ano", "Mês"] + COLUMNS
+    for _ in range(n):
+        sel = {name: [] for name in names}
+        for name in rng.choice(names, size=rng.integers(0, 4), replace=False):
+            options = index.options(name)
+            if options:
+                picks = rng.choice(len(options), size=min(len(options), rng.integers(1, 4)), replace=False)
+                sel[name] = [options[i] for i in picks]
+        yield sel
+
+def main():
+    max_factor = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    base = load_engenharia()
+    rng = np.random.default_rng(0)
+    print(f"{'linhas':>10} {'índice (s)':>11} {'isin (ms)':>10} {'máscara (ms)':>13} {'ganho':>7}")
+    factor = 1
+    while factor <= max_factor:
+        df = pd.concat([base] * factor, ignore_index=True)
+        t0 = time.perf_counter()
+        index = build_index(df)
+        t_build = time.perf_counter() - t0
+
+        t_legacy = t_index = 0.0
+        for sel in random_selections(index, rng, 20):
+            t0 = time.perf_counter()
+            expected = legacy_filter(df, sel)
+            t_legacy += time.perf_counter() - t0
+            t0 = time.perf_counter()
+            result = index.apply(df, sel)
+            t_index += time.perf_counter() - t0
+            if not result.index.equals(expected.index):
+                raise SystemExit(f"Divergência com {len(df)} linhas para a seleção {sel}")
+        print(f"{len(df):>10} {t_build:>11.3f} {t_legacy / 20 * 1e3:>10.2f} "
+              f"{t_index / 20 * 1e3:>13.2f} {t_legacy / t_index:>6.1f}x")
+        factor *= 10
+
+if __name__ == "__main__":
+    main()
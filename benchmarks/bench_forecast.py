@@ -0,0 +1,72 @@
+"""
+Benchmark e verificação do Calendário de Previsão de Gastos de Manutenção.
+
+Compara o laço original (um np.select com sete condições por ano) com a matriz
+de maintenance.forecast_matrix para carteiras e horizontes crescentes, e falha
+se algum valor divergir. Também confere uma taxa e uma curva diferentes.
+
+Uso:
+    python benchmarks/bench_forecast.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from maintenance import forecast_matrix
+
+
+def legacy_forecast(df, forecast_years):
+    """Cópia do laço original da página financeira."""
+    previsao_table = df[['Custo de Construção', 'Entrega_Year']].copy()
+    for year in forecast_years:
+        diff = year - previsao_table['Entrega_Year']
+        conditions = [
+            (diff < 0),
+            (diff <= 1),
+            (diff == 2),
+            (diff == 3),
+            (diff == 4),
+            (diff == 5),
+            (diff > 5)
+        ]
+        choices = [0, 0.5, 0.2, 0.1, 0.1, 0.1, 0.0]
+        fator = np.select(conditions, choices, default=0)
+        previsao_table[f'Previsão ({year})'] = df['Custo de Construção'] * 0.015 * fator
+    return previsao_table.drop(columns=['Custo de Construção', 'Entrega_Year']).to_numpy()
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'empreend.':>10} {'anos':>5} {'laço (ms)':>10} {'matriz (ms)':>12} {'ganho':>7}")
+    for n_rows, n_years in [(30, 10), (300, 35), (3_000, 60), (30_000, 100)]:
+        df = pd.DataFrame({
+            "Custo de Construção": rng.uniform(1e6, 5e7, n_rows),
+            "Entrega_Year": pd.Series(rng.integers(2015, 2025 + n_years, n_rows), dtype=float)
+                              .mask(rng.random(n_rows) < 0.05),
+        })
+        years = list(range(2025, 2025 + n_years))
+
+        t0 = time.perf_counter()
+        expected = legacy_forecast(df, years)
+        t_legacy = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        result = forecast_matrix(df["Custo de Construção"], df["Entrega_Year"], years)
+        t_matrix = time.perf_counter() - t0
+        if not np.allclose(result, expected, equal_nan=True):
+            raise SystemExit(f"Divergência com {n_rows} empreendimentos x {n_years} anos")
+        print(f"{n_rows:>10} {n_years:>5} {t_legacy * 1e3:>10.2f} {t_matrix * 1e3:>12.2f} "
+              f"{t_legacy / t_matrix:>6.1f}x")
+
+    # Outra taxa e outra curva: 2% com 40/30/20/10 nos quatro primeiros anos
+    custom = forecast_matrix([1000.0, 1000.0, np.nan], [2025, np.nan, 2024], [2024, 2025, 2026, 2029], 0.02,
+                             (0.4, 0.3, 0.2, 0.1))
+    expected = np.array([[0, 8, 6, 0], [0, 0, 0, 0], [np.nan] * 4])
+    if not np.allclose(custom, expected, equal_nan=True):
+        raise SystemExit(f"Curva personalizada incorreta: {custom}")
+
+if __name__ == "__main__":
+    main()
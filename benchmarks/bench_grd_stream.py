@@ -0,0 +1,77 @@
+"""
+Benchmark e verificação da leitura em streaming da grd_Listagem (excel_stream.py).
+
+Compara a leitura original (pd.read_excel com skiprows=1 e todas as 55 colunas,
+tipadas por data_store._typed) com excel_stream.read_columns (openpyxl read_only,
+só as colunas de data_store.SHEET_COLUMNS, convertidas durante a leitura):
+  - valores das colunas usadas (falha se algum divergir);
+  - tempo de leitura;
+  - pico de memória alocada durante a leitura (tracemalloc);
+  - memória do DataFrame resultante.
+
+Uso:
+    python benchmarks/bench_grd_stream.py [repetições]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from data_store import SHEET_COLUMNS, SHEETS, _typed
+from excel_stream import read_columns
+from utils import resource_path
+
+NAME = "grd_Listagem"
+
+
+def read_legacy(path, sheet, read_kwargs):
+    return _typed(pd.read_excel(path, sheet_name=sheet, **read_kwargs))
+
+def read_streamed(path, sheet, read_kwargs):
+    return read_columns(path, sheet, SHEET_COLUMNS[NAME], read_kwargs.get("skiprows", 0) + 1)
+
+def measure(func, repeats, *args):
+    """(resultado, tempo médio em s, pico de memória em MB)."""
+    inicio = time.perf_counter()
+    for _ in range(repeats):
+        result = func(*args)
+    elapsed = (time.perf_counter() - inicio) / repeats
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(f"[ERRO] {message}")
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    workbook, sheet, read_kwargs = SHEETS[NAME]
+    path = resource_path(workbook)
+
+    legacy, t_legacy, peak_legacy = measure(read_legacy, repeats, path, sheet, read_kwargs)
+    streamed, t_stream, peak_stream = measure(read_streamed, repeats, path, sheet, read_kwargs)
+
+    columns = list(SHEET_COLUMNS[NAME])
+    check(len(streamed) == len(legacy), f"{len(streamed)} linhas; esperado {len(legacy)}")
+    for col in columns:
+        expected = legacy[col]
+        result = streamed[col].astype(expected.dtype)
+        check(result.equals(expected), f"Coluna {col!r} diverge da leitura original")
+    print(f"[OK] {len(streamed)} linhas, {len(columns)} colunas iguais à leitura original")
+    print(f"Tipos: {', '.join(f'{col}={dtype}' for col, dtype in streamed.dtypes.items())}")
+
+    mem_legacy = legacy.memory_usage(deep=True).sum() / 1e6
+    mem_projected = legacy[columns].memory_usage(deep=True).sum() / 1e6
+    mem_stream = streamed.memory_usage(deep=True).sum() / 1e6
+    print(f"Leitura:          original {t_legacy:.2f} s | streaming {t_stream:.2f} s")
+    print(f"Pico de memória:  original {peak_legacy:.1f} MB | streaming {peak_stream:.1f} MB")
+    print(f"DataFrame:        original {mem_legacy:.2f} MB ({legacy.shape[1]} colunas; "
+          f"{mem_projected:.2f} MB só nas usadas) | streaming {mem_stream:.2f} MB")
@@ -0,0 +1,63 @@
+"""
+Benchmark da despesa real por empreendimento (aba Manutenção).
+
+Mede, na base real, o laço original (empreendimento x código x linhas da
+grd_Listagem) e o índice de maintenance.build_service_index. A igualdade dos
+totais é verificada em tests/test_maintenance.py.
+
+Uso:
+    python benchmarks/bench_maintenance.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from data_store import load_sheets
+from maintenance import build_service_index, real_spend_by_enterprise
+
+
+def legacy_real_spend(df_departamento, df_grd):
+    """Cópia do cálculo original da página financeira (ver tests/test_maintenance.py)."""
+    result = []
+    for _, row in df_departamento.iterrows():
+        empreendimento = row['Empreendimento']
+        real_val = 0
+        for serv in df_grd["Cód. Alternativo Serviço"].dropna().unique():
+            serv_clean = serv.strip().upper()
+            if serv_clean == "ADM":
+                continue
+            if serv_clean in empreendimento.upper():
+                mask = df_grd["Cód. Alternativo Serviço"].astype(str).apply(lambda x: serv_clean in x.strip().upper())
+                real_val += df_grd.loc[mask, "Valor Conv."].sum()
+        result.append(real_val)
+    return np.array(result, dtype=float)
+
+def main():
+    df_departamento, df_grd = load_sheets("departamento", "grd_Listagem")
+    df_grd.columns = df_grd.columns.str.strip()
+    empreendimentos = df_departamento["Empreendimento"]
+
+    start = time.perf_counter()
+    old = legacy_real_spend(df_departamento, df_grd)
+    t_old = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = build_service_index(df_grd, empreendimentos)
+    t_index = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = real_spend_by_enterprise(index, empreendimentos)
+    t_new = time.perf_counter() - start
+
+    print(f"Laço original:           {t_old:.4f} s")
+    print(f"Montagem do índice:      {t_index:.4f} s (uma vez por versão dos dados)")
+    print(f"Consulta por rerun:      {t_new:.6f} s")
+    print(f"{len(empreendimentos)} empreendimentos: total original {old.sum():,.2f} | índice {new.sum():,.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark e verificação do importador da pesquisa de satisfação (dry-run).
+
+Confere a leitura da página salva em fixtures/resultado_pesquisa.html (métricas,
+notas por pergunta, nota com vírgula, texto quebrado em várias linhas), grava
+as abas importadas num diretório temporário e as lê de volta por load_sheet
+(e confere que elas são descartadas quando o Excel muda).
+Depois mede a leitura da página; o importador antigo esperava 12 s fixos
+(time.sleep) além do carregamento, o que é mostrado como referência.
+
+Uso:
+    python benchmarks/bench_nps_import.py [repetições]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_store
+from nps_import import import_nps, parse_resultado
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "resultado_pesquisa.html")
+LEGACY_SLEEPS = 10 + 2  # segundos de time.sleep no importador antigo
+
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(f"[ERRO] {message}")
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with open(FIXTURE, encoding="utf-8") as f:
+        page_html = f.read()
+
+    df_metrics, df_questions = parse_resultado(page_html)
+    check(df_metrics["Valor"].tolist() == ["124", "22 (17.74 %)", "4.51"], f"Métricas: {df_metrics['Valor'].tolist()}")
+    check(df_questions["Nota"].tolist() == [4.64, 4.50, 4.50, 4.41], f"Notas: {df_questions['Nota'].tolist()}")
+    check(df_questions["Pergunta"].iloc[3]
+          == "Que nota você daria para o tempo de resposta até o atendimento da Assistência Técnica?",
+          f"Pergunta: {df_questions['Pergunta'].iloc[3]!r}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_store.IMPORTS_DIR = tmp
+        excel_nps = data_store.load_sheet("NPS")
+        import_nps(page_html)
+        nps = data_store.load_sheet("NPS")
+        check(nps.equals(df_questions), "Aba NPS gravada difere da página lida")
+        check(data_store.load_sheet("NPS_metricas")["Valor"].tolist() == df_metrics["Valor"].tolist(),
+              "Aba NPS_metricas gravada difere da página lida")
+
+        # Excel atualizado depois da importação: a aba importada é descartada
+        meta_path = os.path.join(tmp, "NPS.json")
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump({**meta, "sha256": "outra-versao"}, f)
+        check(data_store.load_sheet("NPS").equals(excel_nps) and not os.path.exists(os.path.join(tmp, "NPS.parquet")),
+              "Aba NPS importada não expirou com a mudança do Excel")
+        check(data_store.clear_imported_sheets() == ["NPS_metricas"], "Importações não foram limpas")
+        check(os.listdir(tmp) == [], f"Arquivos restantes: {os.listdir(tmp)}")
+    print("[OK] Página de exemplo e gravação da aba NPS conferem.")
+
+    inicio = time.perf_counter()
+    for _ in range(repeats):
+        parse_resultado(page_html)
+    elapsed = (time.perf_counter() - inicio) / repeats
+    print(f"Leitura da página (dry-run): {elapsed * 1000:.2f} ms por execução")
+    print(f"Importador antigo: {LEGACY_SLEEPS} s só de pausas fixas por execução")
@@ -0,0 +1,110 @@
+"""
+Benchmark e verificação do cubo de agregação do painel de assistência técnica (olap_cube.py).
+
+Para várias seleções de filtros, compara os dados dos gráficos tirados do cubo
+(contagem por AnoMes, Ano, Empreendimento e Status; MTTC por Empreendimento)
+com os groupbys originais da página sobre as linhas filtradas, e falha se algo
+divergir. Depois mede os dois caminhos na base real e numa base replicada
+`fator` vezes: o tempo do cubo não cresce com o número de solicitações.
+
+Uso:
+    python benchmarks/bench_olap_cube.py [fator]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from engenharia_store import load_engenharia
+from olap_cube import build_cube, mean_closing_time, rollup, slice_cube
+
+STATUS_PIE = ["Improcedente", "Concluída"]
+
+
+def legacy_charts(df_filtered):
+    """Cópia dos agrupamentos dos gráficos da página (um groupby por gráfico)."""
+    df_filtered = df_filtered.copy()
+    df_filtered["AnoMes"] = df_filtered["Data de Abertura"].dt.to_period("M").astype(str)
+    df_pyramid = df_filtered.copy()
+    df_pyramid["Ano"] = df_pyramid["Data de Abertura"].dt.year
+    return {
+        "AnoMes": df_filtered.groupby("AnoMes").size(),
+        "Ano": df_pyramid.groupby("Ano").size().sort_index(),
+        "Empreendimento": df_filtered.groupby("Empreendimento").size(),
+        "Status (rosca)": df_filtered[df_filtered["Status"].isin(STATUS_PIE)].groupby("Status").size(),
+        "Status": df_filtered.groupby("Status").size(),
+        "MTTC": df_filtered[df_filtered["Encerramento"].notna()]
+            .groupby("Empreendimento")["Tempo de Encerramento"].mean(),
+    }
+
+def cube_charts(cube_filtered):
+    return {
+        "AnoMes": rollup(cube_filtered, "AnoMes"),
+        "Ano": rollup(cube_filtered, "Ano"),
+        "Empreendimento": rollup(cube_filtered, "Empreendimento"),
+        "Status (rosca)": rollup(cube_filtered[cube_filtered["Status"].isin(STATUS_PIE)], "Status"),
+        "Status": rollup(cube_filtered, "Status"),
+        "MTTC": mean_closing_time(cube_filtered, "Empreendimento"),
+    }
+
+def filter_rows(df, selections):
+    """Filtro original: máscara por isin em cada coluna selecionada."""
+    columns = {"Ano": df["Data de Abertura"].dt.year, "Mês": df["Data de Abertura"].dt.month}
+    mask = np.ones(len(df), dtype=bool)
+    for name, selected in selections.items():
+        if selected:
+            mask &= columns.get(name, df.get(name)).isin(selected).to_numpy()
+    return df[mask]
+
+def compare(name, df, cube, selections):
+    expected = legacy_charts(filter_rows(df, selections))
+    result = cube_charts(slice_cube(cube, selections))
+    for chart, series in expected.items():
+        got = result[chart]
+        check(list(got.index) == list(series.index), f"{name} / {chart}: chaves {list(got.index)[:5]}")
+        check(np.allclose(got.to_numpy(dtype=float), series.to_numpy(dtype=float), equal_nan=True),
+              f"{name} / {chart}: valores divergentes")
+    print(f"[OK] {name}: {len(filter_rows(df, selections))} solicitações, gráficos conferem")
+
+def timed(func, repeats=5):
+    inicio = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - inicio) / repeats
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(f"[ERRO] {message}")
+
+
+if __name__ == "__main__":
+    fator = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    df = load_engenharia()
+    cube = build_cube(df)
+    print(f"Cubo: {len(cube)} linhas para {len(df)} solicitações")
+
+    empreendimentos = df["Empreendimento"].dropna().unique().tolist()
+    anos = sorted(df["Data de Abertura"].dt.year.dropna().unique().tolist())
+    cases = {
+        "Sem filtros": {},
+        "Empreendimentos + Status": {"Empreendimento": empreendimentos[:3], "Status": ["Concluída", "Improcedente"]},
+        "Ano + Mês": {"Ano": anos[-1:], "Mês": [1, 2, 3, 4, 5, 6]},
+        "Tipo de Falha + Responsável": {"Tipo de Falha": df["Tipo de Falha"].dropna().unique().tolist()[:20],
+                                        "Responsável": df["Responsável"].dropna().unique().tolist()[:5]},
+        "Seleção sem linhas": {"Empreendimento": ["(inexistente)"]},
+    }
+    for name, selections in cases.items():
+        compare(name, df, cube, selections)
+
+    selections = cases["Empreendimentos + Status"]
+    big = pd.concat([df] * fator, ignore_index=True)
+    big_cube = build_cube(big)
+    for label, data, data_cube in [("base real", df, cube), (f"base x{fator}", big, big_cube)]:
+        t_legacy = timed(lambda: legacy_charts(filter_rows(data, selections)))
+        t_cube = timed(lambda: cube_charts(slice_cube(data_cube, selections)))
+        print(f"{label} ({len(data)} linhas): groupbys {t_legacy * 1000:.1f} ms | "
+              f"cubo {t_cube * 1000:.1f} ms ({t_legacy / t_cube:.1f}x)")
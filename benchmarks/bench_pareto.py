@@ -0,0 +1,89 @@
+"""
+Benchmark e verificação da classificação ABC (pareto.py).
+
+Compara pareto.classify_abc com a versão original da página de Sistemas
+Construtivos (laço em Python sobre a série ordenada) em contagens aleatórias,
+nas contagens reais por Grupo/Sistema Construtivo e nos custos ("Valor Conv.")
+da grd_Listagem por serviço, e falha se alguma classe divergir.
+
+Uso:
+    python benchmarks/bench_pareto.py [n_itens]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from data_store import load_sheet
+from engenharia_store import load_engenharia
+from pareto import abc_table, classify_abc
+from warranty_parser import split_grupo_sistema
+
+
+def legacy_classify_abc(series):
+    """Cópia de classify_abc da página de Sistemas Construtivos."""
+    s_sorted = series.sort_values(ascending=False)
+    total = s_sorted.sum()
+    cum_sum = s_sorted.cumsum()
+    categories = {}
+    for idx, value in s_sorted.items():
+        perc = cum_sum[idx] / total
+        if perc <= 0.7:
+            categories[idx] = "A"
+        elif perc <= 0.9:
+            categories[idx] = "B"
+        else:
+            categories[idx] = "C"
+    return categories
+
+def compare(name, series):
+    with np.errstate(invalid="ignore"):  # total zero: a versão original divide 0 por 0
+        expected = legacy_classify_abc(series)
+    result = classify_abc(series)
+    check(list(result.index) == list(series.index), f"{name}: índice não alinhado à entrada")
+    diff = [idx for idx in series.index if result[idx] != expected[idx]]
+    check(not diff, f"{name}: {len(diff)} classes divergentes, ex.: {diff[:5]}")
+    print(f"[OK] {name}: {len(series)} itens, classes {result.value_counts().to_dict()}")
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(f"[ERRO] {message}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    rng = np.random.default_rng(7)
+
+    # Valores distintos: com empates, a ordem entre itens iguais do sort original não é estável
+    counts = pd.Series(rng.permutation(n) + 1, index=[f"item {i}" for i in range(n)])
+    compare("Contagens aleatórias", counts)
+    compare("Série vazia", pd.Series([], dtype="int64"))
+    compare("Total zero", pd.Series([0, 0, 0], index=list("xyz")))
+
+    df_eng = load_engenharia()
+    df_eng[["Grupo Construtivo", "Sistema Construtivo"]] = split_grupo_sistema(df_eng["Garantia Solicitada"])
+    for col in ["Grupo Construtivo", "Sistema Construtivo"]:
+        counts_col = df_eng[col].value_counts()
+        counts_col = counts_col[counts_col > 0]
+        ranks = counts_col.rank(method="first")
+        # Desempata somando uma fração da posição (mesma ordem nas duas versões)
+        compare(f"Incidências por {col}", counts_col + ranks / (len(ranks) + 1))
+
+    df_grd = load_sheet("grd_Listagem")
+    table = abc_table(df_grd, "Cód. Alternativo Serviço", "Valor Conv.")
+    compare("Custo por serviço (grd_Listagem)", table["Valor"])
+    check(np.isclose(table["Valor"].sum(), df_grd["Valor Conv."].sum()), "abc_table: total de custo")
+    check(table["Participação Acumulada"].is_monotonic_increasing, "abc_table: acumulado fora de ordem")
+
+    inicio = time.perf_counter()
+    legacy_classify_abc(counts)
+    t_legacy = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    classify_abc(counts)
+    t_new = time.perf_counter() - inicio
+    print(f"{n} itens: original {t_legacy * 1000:.1f} ms | vetorizado {t_new * 1000:.1f} ms "
+          f"({t_legacy / t_new:.0f}x)")
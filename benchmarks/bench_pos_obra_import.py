@@ -0,0 +1,90 @@
+"""
+Benchmark e verificação do importador de solicitações do portal Pós Obra.
+
+Confere a leitura da página salva em fixtures/tabsolics.html (pesquisa como
+<svg> e como <i>, área comum, encerramento só para concluída/improcedente,
+linha de detalhe ignorada) e o upsert por N° no conjunto de engenharia
+(novas, alteradas, colunas derivadas e changelog). Depois mede a
+leitura de uma tabela sintética com n linhas; o importador antigo esperava até
+2 s por linha sem pesquisa, o que é mostrado como referência.
+
+Uso:
+    python benchmarks/bench_pos_obra_import.py [n_linhas]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from engenharia_store import derive, normalize_import, upsert
+from pos_obra_import import SURVEY_DONE, SURVEY_PENDING, parse_solicitacoes
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "tabsolics.html")
+
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(f"[ERRO] {message}")
+
+def synthetic_page(n_rows):
+    """Página com n linhas no formato da tabela tabsolics (metade com pesquisa realizada)."""
+    icons = ['<svg class="svg-inline--fa fa-check fa-w-16 text-success"></svg>',
+             '<svg class="svg-inline--fa fa-times fa-w-11 text-danger"></svg>']
+    rows = "".join(
+        f"<tr><td>{n}</td><td>RESIDENCIAL {n % 40}</td><td>{n % 300}</td><td>A</td><td>José Renato</td>"
+        f"<td>01/02/2025</td><td>03/02/2025</td><td>Concluída</td><td>Sistemas Elétricos</td>"
+        f"<td>{icons[n % 2]}</td></tr>"
+        for n in range(n_rows, 0, -1)
+    )
+    return f"<html><body><table id='tabsolics'><tbody>{rows}</tbody></table></body></html>"
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+
+    with open(FIXTURE, encoding="utf-8") as f:
+        df = parse_solicitacoes(f.read())
+    check(df["N°"].tolist() == [625, 624, 623, 622], f"N° lidos: {df['N°'].tolist()}")
+    check(df["Pesquisa"].tolist() == [SURVEY_DONE, SURVEY_DONE, SURVEY_PENDING, SURVEY_PENDING],
+          f"Pesquisa: {df['Pesquisa'].tolist()}")
+    check(df["Encerramento"].tolist() == ["12/03/2025", "", "", "06/03/2025"],
+          f"Encerramento: {df['Encerramento'].tolist()}")
+    check(df.loc[1, ["Unidade", "Bloco"]].tolist() == ["Área Comum", "Área Comum"], "Área comum")
+    check(df.loc[0, "Garantia Solicitada"] == "Revestimentos Cerâmicos: Destacamentos (Falha de Execução)",
+          f"Garantia: {df.loc[0, 'Garantia Solicitada']!r}")
+    check(df.loc[0, "Status"] == "Concluída", f"Status: {df.loc[0, 'Status']!r}")
+
+    incoming = normalize_import(df)
+    check(incoming["Garantia Solicitada"].iloc[0] == "Revestimentos Cerâmicos - Destacamentos (Falha de Execução)",
+          "Garantia deveria seguir a convenção da planilha (\" - \")")
+    # Planilha com 623 ainda aberta e 622 igual à página; 624 e 625 ainda não importadas
+    base = incoming[incoming["N°"].isin(["623", "622"])].reset_index(drop=True)
+    base.loc[0, ["Encerramento", "Status"]] = [pd.NaT, "Em andamento"]
+    base["FCR"] = "Não"
+    base = base.join(derive(base))
+    incoming.loc[incoming["N°"] == "623", ["Encerramento", "Status"]] = [pd.Timestamp("2025-03-10"), "Concluída"]
+    merged, touched, changelog = upsert(base, incoming)
+    check(merged["N°"].tolist() == ["625", "624", "623", "622"], f"Conjunto final: {merged['N°'].tolist()}")
+    check(sorted(touched) == ["623", "624", "625"], f"Linhas tocadas: {touched}")
+    check(changelog[changelog["Alteração"] == "Alterada"][["N°", "Coluna", "Depois"]].values.tolist()
+          == [["623", "Encerramento", "10/03/2025"], ["623", "Status", "Concluída"]],
+          f"Changelog: {changelog.values.tolist()}")
+    check(merged.loc[2, "Tempo de Encerramento"] == 4, "Tempo de Encerramento da linha alterada")
+    check(merged.loc[3, "FCR"] == "Não" and merged.loc[0, "Tipo de Falha"] == "Destacamentos (Falha de Execução)",
+          "Colunas da planilha e derivadas das linhas novas")
+    _, touched, changelog = upsert(merged, incoming)
+    check(not touched and changelog.empty, "Reimportar a mesma página não deveria mudar nada")
+    print("[OK] Página de exemplo e upsert por N° conferem.")
+
+    page = synthetic_page(n)
+    inicio = time.perf_counter()
+    df = parse_solicitacoes(page)
+    elapsed = time.perf_counter() - inicio
+    check(len(df) == n, f"Esperadas {n} linhas, lidas {len(df)}")
+    pending = int((df["Pesquisa"] == SURVEY_PENDING).sum())
+    print(f"Leitura com lxml de {n} linhas: {elapsed:.3f} s")
+    print(f"Importador antigo: pelo menos {pending * 2 / 60:.0f} min só de espera "
+          f"({pending} linhas sem pesquisa x 2 s)")
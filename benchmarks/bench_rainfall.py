@@ -0,0 +1,66 @@
+"""
+Benchmark e verificação da correlação chuva × solicitações (rainfall.py).
+
+Compara rainfall.lagged_correlation, que calcula todas as correlações de uma vez,
+com a conta feita grupo a grupo (Series.shift + Series.corr para cada defasagem)
+por Sistema Construtivo e por Empreendimento, e falha se algum valor divergir.
+Também confere que o formato long da aba calendariodechuvas bate com a planilha.
+
+Uso:
+    python benchmarks/bench_rainfall.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from data_store import load_sheet
+from engenharia_store import load_engenharia
+from olap_cube import build_cube
+from rainfall import LAGS, lagged_correlation, monthly_counts, process_calendario_de_chuvas, rain_by_month
+
+
+def loop_correlation(counts, rain, lags=LAGS):
+    """Correlação grupo a grupo, defasagem a defasagem, com Series.corr."""
+    months = pd.period_range(counts.index[0] - max(lags), counts.index[-1], freq="M")
+    rain = rain.reindex(months)
+    result = {}
+    for group in counts.columns:
+        series = counts[group].reindex(months)
+        result[group] = [series.corr(rain.shift(lag)) for lag in lags]
+    return pd.DataFrame.from_dict(result, orient="index")
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(f"[ERRO] {message}")
+
+
+if __name__ == "__main__":
+    df_wide = load_sheet("calendariodechuvas")
+    df_chuva = process_calendario_de_chuvas(df_wide)
+    rain = rain_by_month(df_chuva)
+    check(rain[pd.Period("2023-10", freq="M")] == 444.2, "Chuva de out/2023 fora do lugar")
+    check(len(rain) == pd.to_numeric(df_wide.iloc[:, 1:].stack(), errors="coerce").notna().sum(),
+          "Meses com chuva não batem com a planilha")
+    print(f"[OK] Chuva: {len(rain)} meses, de {rain.index.min()} a {rain.index.max()}")
+
+    cube = build_cube(load_engenharia())
+    for by in ["Sistema Construtivo", "Empreendimento"]:
+        counts = monthly_counts(cube, by)
+        corr, _ = lagged_correlation(counts, rain)
+        expected = loop_correlation(counts, rain)
+        check(np.allclose(corr.to_numpy(), expected.to_numpy(), equal_nan=True, atol=1e-12),
+              f"{by}: correlações divergentes")
+
+        inicio = time.perf_counter()
+        loop_correlation(counts, rain)
+        t_loop = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        lagged_correlation(counts, rain)
+        t_new = time.perf_counter() - inicio
+        print(f"[OK] {by}: {counts.shape[1]} grupos x {len(LAGS)} defasagens conferem | "
+              f"grupo a grupo {t_loop * 1000:.1f} ms | vetorizado {t_new * 1000:.1f} ms ({t_loop / t_new:.0f}x)")
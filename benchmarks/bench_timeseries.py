@@ -0,0 +1,58 @@
+"""
+Micro-benchmark da curva acumulada (timeseries.cumulative_series).
+
+Compara a soma filtrada mês a mês (laço original do gráfico Planejado x Real)
+com ordenação + cumsum + searchsorted, para tamanhos crescentes de quadro e de
+horizonte, e falha se os valores divergirem.
+
+Uso:
+    python benchmarks/bench_timeseries.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from timeseries import cumulative_series
+
+
+def legacy_cumulative(df, months):
+    """Cópia do laço original da página financeira."""
+    vals = []
+    for m in months:
+        vals.append(df.loc[df['Previsao_dt'] <= m, 'Previsão Mão de Obra'].fillna(0).sum())
+    return np.array(vals)
+
+def main():
+    rng = np.random.default_rng(0)
+    rows = []
+    for n_rows, n_months in [(30, 24), (1_000, 60), (10_000, 120), (100_000, 360)]:
+        dates = pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, n_months * 31, n_rows), unit="D")
+        df = pd.DataFrame({
+            "Previsao_dt": pd.Series(dates).mask(rng.random(n_rows) < 0.05),
+            "Previsão Mão de Obra": pd.Series(rng.uniform(1_000, 10_000, n_rows)).mask(rng.random(n_rows) < 0.05),
+        })
+        months = pd.date_range("2020-01-01", periods=n_months, freq="MS")
+
+        start = time.perf_counter()
+        old = legacy_cumulative(df, months)
+        t_old = time.perf_counter() - start
+
+        start = time.perf_counter()
+        new = cumulative_series(df["Previsao_dt"], df["Previsão Mão de Obra"], months).to_numpy()
+        t_new = time.perf_counter() - start
+
+        if not np.allclose(old, new):
+            raise SystemExit(f"[ERRO] Curvas divergentes para {n_rows} linhas x {n_months} meses.")
+        rows.append({"Linhas": n_rows, "Meses": n_months, "Laço (s)": round(t_old, 4),
+                     "searchsorted (s)": round(t_new, 5), "Ganho (x)": round(t_old / t_new, 1)})
+    print(pd.DataFrame(rows).to_string(index=False))
+    print("[OK] Curvas idênticas em todos os cenários.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark e verificação do classificador de períodos de garantia.
+
+Compara warranty_periods.classify_warranty_period com a versão original
+(relativedelta linha a linha) em datas aleatórias, incluindo fins de mês,
+horários e datas vazias, e falha se alguma classificação divergir.
+
+Uso:
+    python benchmarks/bench_warranty_periods.py [n_linhas]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+
+from warranty_periods import classify_warranty_period
+
+
+def legacy_classify_period_doc(cvco_date, doc_date):
+    """Cópia de classify_period_doc da página financeira."""
+    if pd.isnull(cvco_date) or pd.isnull(doc_date):
+        return "Sem Data"
+    cvco_dt = pd.to_datetime(cvco_date).to_pydatetime()
+    doc_dt = pd.to_datetime(doc_date).to_pydatetime()
+    delta = relativedelta(doc_dt, cvco_dt)
+    diff_months = delta.years * 12 + delta.months
+    if diff_months < 0:
+        return "Antes de CVCO"
+    if diff_months <= 3:
+        return "Despesas Pós Entrega"
+    elif diff_months <= 12:
+        return "Despesas 1° Ano"
+    elif diff_months <= 24:
+        return "Despesas 2° Ano"
+    elif diff_months <= 36:
+        return "Despesas 3° Ano"
+    elif diff_months <= 48:
+        return "Despesas 4° Ano"
+    elif diff_months <= 60:
+        return "Despesas 5° Ano"
+    else:
+        return "Despesas após 5 Anos"
+
+def random_dates(rng, n):
+    days = rng.integers(0, 365 * 12, n)
+    dates = pd.Timestamp("2014-01-01") + pd.to_timedelta(days, unit="D")
+    # Força fins de mês e alguns horários, que são os casos delicados do relativedelta
+    month_end = rng.random(n) < 0.3
+    dates = dates.where(~month_end, dates + pd.offsets.MonthEnd(0))
+    with_time = rng.random(n) < 0.2
+    dates = dates.where(~with_time, dates + pd.to_timedelta(rng.integers(0, 86_400, n), unit="s"))
+    return pd.Series(dates).mask(rng.random(n) < 0.05)
+
+def main(n=20_000):
+    rng = np.random.default_rng(42)
+    cvco = random_dates(rng, n)
+    doc = random_dates(rng, n)
+
+    start = time.perf_counter()
+    old = np.array([legacy_classify_period_doc(c, d) for c, d in zip(cvco, doc)], dtype=object)
+    t_old = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = classify_warranty_period(cvco, doc)
+    t_new = time.perf_counter() - start
+
+    mismatches = np.flatnonzero(old != new)
+    if mismatches.size:
+        sample = pd.DataFrame({"CVCO": cvco, "Documento": doc, "Original": old, "Vetorizado": new}).iloc[mismatches[:20]]
+        print(sample.to_string())
+        raise SystemExit(f"[ERRO] {mismatches.size} classificações divergentes.")
+
+    today = pd.Timestamp.today()
+    old_today = [legacy_classify_period_doc(c, today) for c in cvco]
+    new_today = classify_warranty_period(cvco, today)
+    if list(old_today) != list(new_today):
+        raise SystemExit("[ERRO] Classificação em relação a hoje divergente.")
+
+    print(f"relativedelta por linha: {t_old:.4f} s")
+    print(f"NumPy vetorizado:        {t_new:.4f} s ({t_old / t_new:.0f}x)")
+    print(f"[OK] {n} linhas com classificação idêntica.")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,80 @@
+"""
+Cache de dados compartilhado entre todas as sessões do Streamlit (mesmo processo).
+
+Cada entrada guarda uma única cópia em memória, associada à chave da versão dos
+dados (hash do base2025.xlsx, ver data_store.snapshot_key). A leitura sempre
+devolve cópias, para que alterações feitas pelas páginas (novas colunas,
+filtros in-place) não corrompam a versão compartilhada.
+"""
+import threading
+
+import pandas as pd
+
+
+def _copy(value):
+    """Cópia profunda de DataFrames/Series, inclusive dentro de tuplas, listas e dicts."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=True)
+    if isinstance(value, tuple):
+        return tuple(_copy(v) for v in value)
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    return value
+
+
+class SharedDataCache:
+    """
+    Cache nome -> (chave, valor) com contadores de acertos/falhas.
+    Quando a chave muda (nova versão da planilha), o valor é recarregado.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._loading = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name, key, loader):
+        """
+        Retorna uma cópia do valor de `name` para a versão `key`,
+        chamando `loader()` apenas na primeira vez (por processo) ou quando a chave muda.
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == key:
+                self.hits += 1
+                return _copy(entry[1])
+            name_lock = self._loading.setdefault(name, threading.Lock())
+
+        # Um único carregamento por nome, mesmo com várias sessões pedindo ao mesmo tempo
+        with name_lock:
+            with self._lock:
+                entry = self._entries.get(name)
+                if entry is not None and entry[0] == key:
+                    self.hits += 1
+                    return _copy(entry[1])
+                self.misses += 1
+            value = loader()
+            with self._lock:
+                self._entries[name] = (key, value)
+        return _copy(value)
+
+    def invalidate(self, name=None):
+        """Descarta a entrada `name` (ou todas, se `name` for None)."""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def stats(self):
+        """Contadores para exibição: acertos, falhas e entradas em memória."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": sorted(self._entries)}
+
+
+# Instância única do processo (os módulos importados sobrevivem aos reruns do Streamlit)
+shared_cache = SharedDataCache()
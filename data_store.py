@@ -0,0 +1,351 @@
+"""
+Armazenamento colunar das planilhas do painel.
+
+As abas do Excel são lidas pelo openpyxl uma única vez por versão do arquivo e
+gravadas como snapshots Parquet tipados. Cada snapshot é identificado pelo hash
+(SHA-256) do arquivo; o mtime/tamanho registrados no manifesto evitam recalcular
+o hash a cada acesso. Todas as páginas devem ler os dados por `load_sheet`.
+
+Abas grandes com poucas colunas usadas (ver SHEET_COLUMNS) são lidas em
+streaming por excel_stream.py: só essas colunas entram no snapshot, já com
+tipos compactos (categóricas para códigos e grupos, inteiros reduzidos).
+
+Ao carregar, cada aba recebe os tipos declarados em schema.py (categóricas,
+inteiros reduzidos, datas).
+
+Abas gravadas por importadores (ex.: NPS, ver nps_import.py) ficam em
+.snapshots/imports, acompanhadas de um .json com o hash do Excel no momento da
+importação e o horário dela. Enquanto o Excel for o mesmo, a importação tem
+prioridade sobre a aba de mesmo nome; quando o Excel muda (alguém atualizou a
+aba na planilha), a importação fica mais antiga que ele e é descartada.
+
+Uso pela linha de comando:
+    python data_store.py                        # gera/atualiza os snapshots
+    python data_store.py --limpar-importacoes   # apaga as abas importadas
+"""
+import argparse
+import datetime as dt
+import hashlib
+import json
+import os
+import shutil
+
+import pandas as pd
+
+from excel_stream import read_columns
+from schema import apply_schema
+from utils import resource_path
+
+WORKBOOK = "base2025.xlsx"
+HOME_WORKBOOK = "planilha_home.xlsx"
+SNAPSHOT_DIR = resource_path(".snapshots")
+MANIFEST_FILE = os.path.join(SNAPSHOT_DIR, "manifest.json")
+IMPORTS_DIR = os.path.join(SNAPSHOT_DIR, "imports")
+SNAPSHOT_VERSION = 2  # incrementar quando o conteúdo dos snapshots mudar (força a regeração)
+
+# Nome lógico da aba -> (arquivo, aba no Excel, argumentos extras do read_excel)
+SHEETS = {
+    "departamento":       (WORKBOOK, "departamento", {}),
+    "engenharia":         (WORKBOOK, "engenharia", {}),
+    "grd_Listagem":       (WORKBOOK, "grd_Listagem", {"skiprows": 1}),  # primeira linha mesclada
+    "administrativo":     (WORKBOOK, "administrativo", {}),
+    "calendariodechuvas": (WORKBOOK, "calendariodechuvas", {}),
+    "NPS":                (WORKBOOK, "NPS", {}),
+    "home":               (HOME_WORKBOOK, 0, {}),
+}
+
+# Abas lidas em streaming, só com as colunas usadas pelas páginas: nome lógico -> {coluna: tipo}
+# (tipos em excel_stream.py). "Valor Conv." fica em float64: os totais em R$ são exibidos com centavos.
+SHEET_COLUMNS = {
+    "grd_Listagem": {
+        "Data Documento": "date",
+        "Documento": "int",
+        "Descrição Projeto": "category",
+        "Cód. Alternativo Serviço": "category",
+        "Descrição Grupo": "category",
+        "Descrição Item": "str",
+        "Valor Conv.": "float",
+    },
+}
+
+# Cache em memória do manifesto: caminho do arquivo -> {mtime_ns, size, sha256}
+_manifest = None
+
+
+# ================================
+# Identificação da versão do arquivo
+# ================================
+def _file_sha256(path):
+    """Calcula o SHA-256 do arquivo em blocos de 1 MB."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _read_manifest():
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_FILE, encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            _manifest = {}
+    return _manifest
+
+def _write_manifest(manifest):
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    tmp_path = f"{MANIFEST_FILE}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, MANIFEST_FILE)
+
+def workbook_fingerprint(workbook=WORKBOOK):
+    """
+    Retorna {"mtime_ns", "size", "sha256"} do arquivo Excel.
+    O hash só é recalculado quando o mtime ou o tamanho mudam.
+    Levanta FileNotFoundError se o arquivo não existir.
+    """
+    path = resource_path(workbook)
+    stat = os.stat(path)
+    manifest = _read_manifest()
+    entry = manifest.get(workbook)
+    if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+        return entry
+    entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": _file_sha256(path)}
+    manifest[workbook] = entry
+    _write_manifest(manifest)
+    return entry
+
+def snapshot_key(workbook=WORKBOOK):
+    """Chave da versão atual do arquivo (hash), útil como argumento de funções cacheadas."""
+    return workbook_fingerprint(workbook)["sha256"]
+
+
+# ================================
+# Tipagem das colunas
+# ================================
+def _is_datetime_value(value):
+    return isinstance(value, (dt.datetime, dt.date, pd.Timestamp))
+
+def _coerce_mixed_column(col):
+    """
+    Colunas "object" com tipos misturados não podem ir para o Parquet:
+      - se houver datas, tudo vira datetime64 (textos lidos como DD/MM/YYYY);
+      - se houver apenas números, vira numérico;
+      - caso contrário, vira texto (mantendo os vazios como nulos).
+    """
+    values = col.dropna()
+    if values.empty:
+        return col
+    types = set(values.map(type))
+    if types <= {str}:
+        return col
+    if any(_is_datetime_value(v) for v in values):
+        is_text = col.map(lambda v: isinstance(v, str))
+        as_dates = pd.to_datetime(col.where(~is_text), errors="coerce")
+        from_text = pd.to_datetime(col.where(is_text), format="%d/%m/%Y", errors="coerce")
+        return as_dates.fillna(from_text)
+    if types <= {int, float, bool}:
+        return pd.to_numeric(col, errors="coerce")
+    return col.map(lambda v: v if pd.isna(v) else str(v))
+
+def _typed(df):
+    """Garante nomes de colunas em texto e colunas com um único tipo."""
+    df.columns = df.columns.astype(str)
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = _coerce_mixed_column(df[col])
+    return df
+
+
+# ================================
+# Snapshots
+# ================================
+def _snapshot_dir(workbook, sha256):
+    stem = os.path.splitext(os.path.basename(workbook))[0]
+    return os.path.join(SNAPSHOT_DIR, f"{stem}-{sha256[:16]}v{SNAPSHOT_VERSION}")
+
+def _snapshot_path(name):
+    workbook = SHEETS[name][0]
+    return os.path.join(_snapshot_dir(workbook, snapshot_key(workbook)), f"{name}.parquet")
+
+def build_snapshot(workbook=WORKBOOK):
+    """
+    Lê (openpyxl) todas as abas conhecidas de `workbook` e grava um Parquet por aba.
+    Snapshots de versões anteriores do mesmo arquivo são removidos.
+    Retorna a lista de arquivos gerados.
+    """
+    sha256 = snapshot_key(workbook)
+    target = _snapshot_dir(workbook, sha256)
+    os.makedirs(target, exist_ok=True)
+
+    written = []
+    with pd.ExcelFile(resource_path(workbook)) as xls:
+        for name, (book, sheet, read_kwargs) in SHEETS.items():
+            if book != workbook:
+                continue
+            if name in SHEET_COLUMNS:
+                # Cabeçalho logo após as linhas puladas (skiprows) do read_excel
+                header_row = read_kwargs.get("skiprows", 0) + 1
+                df = read_columns(resource_path(workbook), sheet, SHEET_COLUMNS[name], header_row)
+            else:
+                df = _typed(pd.read_excel(xls, sheet_name=sheet, **read_kwargs))
+            path = os.path.join(target, f"{name}.parquet")
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+            written.append(path)
+
+    prefix = os.path.basename(target).rsplit("-", 1)[0] + "-"
+    for entry in os.listdir(SNAPSHOT_DIR):
+        old = os.path.join(SNAPSHOT_DIR, entry)
+        if entry.startswith(prefix) and old != target and os.path.isdir(old):
+            shutil.rmtree(old, ignore_errors=True)
+    return written
+
+def ensure_snapshots():
+    """
+    Gera os snapshots que estiverem faltando ou desatualizados (ex.: na inicialização
+    do aplicativo). Retorna a lista de arquivos gerados.
+    """
+    written = []
+    for book in sorted({book for book, _, _ in SHEETS.values()}):
+        names = [name for name, (b, _, _) in SHEETS.items() if b == book]
+        if any(not os.path.exists(_snapshot_path(name)) for name in names):
+            written += build_snapshot(book)
+    return written
+
+def _import_path(name):
+    return os.path.join(IMPORTS_DIR, f"{name}.parquet")
+
+def _import_meta_path(name):
+    return os.path.join(IMPORTS_DIR, f"{name}.json")
+
+def _import_source(name):
+    """Arquivo Excel que a aba importada `name` substitui (abas só de importação: o WORKBOOK)."""
+    return SHEETS[name][0] if name in SHEETS else WORKBOOK
+
+def save_imported_sheet(name, df):
+    """
+    Grava `df` como a aba `name` vinda de um importador (substitui a aba do Excel
+    enquanto o Excel não mudar). Registra o hash do Excel e o horário da importação.
+    """
+    os.makedirs(IMPORTS_DIR, exist_ok=True)
+    path = _import_path(name)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    _typed(df.copy()).to_parquet(tmp_path, index=False)
+    meta = {"workbook": _import_source(name), "sha256": snapshot_key(_import_source(name)),
+            "imported_at": dt.datetime.now().isoformat(timespec="seconds")}
+    meta_tmp_path = f"{_import_meta_path(name)}.{os.getpid()}.tmp"
+    with open(meta_tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    os.replace(meta_tmp_path, _import_meta_path(name))
+    os.replace(tmp_path, path)
+    return path
+
+def _drop_import(name):
+    for path in (_import_path(name), _import_meta_path(name)):
+        if os.path.exists(path):
+            os.remove(path)
+
+def _current_import(name):
+    """
+    Caminho da aba importada `name`, se ela ainda vale para o Excel atual; None caso
+    contrário. Importações feitas sobre outra versão do Excel (ou sem o .json de
+    origem) são apagadas.
+    """
+    path = _import_path(name)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(_import_meta_path(name), encoding="utf-8") as f:
+            meta = json.load(f)
+        current = meta["sha256"] == snapshot_key(_import_source(name))
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        current = False
+    if not current:
+        _drop_import(name)
+        return None
+    return path
+
+def imported_sheets():
+    """{nome: metadados} das abas importadas gravadas (válidas ou não para o Excel atual)."""
+    if not os.path.isdir(IMPORTS_DIR):
+        return {}
+    result = {}
+    for entry in sorted(os.listdir(IMPORTS_DIR)):
+        name, ext = os.path.splitext(entry)
+        if ext == ".parquet":
+            try:
+                with open(_import_meta_path(name), encoding="utf-8") as f:
+                    result[name] = json.load(f)
+            except (FileNotFoundError, ValueError):
+                result[name] = {}
+    return result
+
+def clear_imported_sheets():
+    """Apaga todas as abas importadas (as páginas voltam a ler as abas do Excel). Retorna os nomes."""
+    names = list(imported_sheets())
+    for name in names:
+        _drop_import(name)
+    return names
+
+def load_sheet(name, compact=True):
+    """
+    Carrega a aba `name` (ver SHEETS) a partir do snapshot Parquet,
+    gerando-o antes caso o arquivo Excel tenha mudado. Uma versão importada
+    da aba (ver save_imported_sheet) tem prioridade enquanto o Excel for o
+    mesmo da importação.
+    Com `compact`, aplica os tipos de schema.SCHEMAS; sem ele, devolve os
+    tipos gravados no snapshot (ex.: para alterar valores antes de tipar).
+    """
+    imported = _current_import(name)
+    if imported:
+        df = pd.read_parquet(imported)
+    elif name not in SHEETS:
+        raise KeyError(f"Aba desconhecida: {name!r}. Abas disponíveis: {list(SHEETS)}")
+    else:
+        path = _snapshot_path(name)
+        if not os.path.exists(path):
+            build_snapshot(SHEETS[name][0])
+        df = pd.read_parquet(path)
+    return apply_schema(name, df) if compact else df
+
+def sheet_memory_report():
+    """
+    Memória (MB) de cada aba carregada com e sem os tipos de schema.py, mais a linha de total.
+    Abas que não puderem ser carregadas ficam de fora.
+    """
+    rows = []
+    for name in SHEETS:
+        try:
+            raw = load_sheet(name, compact=False)
+        except (FileNotFoundError, KeyError, ValueError):
+            continue
+        before = raw.memory_usage(deep=True).sum() / 1e6
+        after = apply_schema(name, raw.copy()).memory_usage(deep=True).sum() / 1e6
+        rows.append((name, len(raw), before, after))
+    report = pd.DataFrame(rows, columns=["Aba", "Linhas", "Sem esquema (MB)", "Com esquema (MB)"])
+    total = report[["Linhas", "Sem esquema (MB)", "Com esquema (MB)"]].sum()
+    report.loc[len(report)] = ["Total", int(total["Linhas"]), total["Sem esquema (MB)"], total["Com esquema (MB)"]]
+    report["Redução"] = 1 - report["Com esquema (MB)"] / report["Sem esquema (MB)"]
+    return report.round({"Sem esquema (MB)": 3, "Com esquema (MB)": 3, "Redução": 3})
+
+def load_sheets(*names):
+    """Atalho para carregar várias abas de uma vez, na ordem pedida."""
+    return tuple(load_sheet(name) for name in names)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera os snapshots Parquet das planilhas do painel.")
+    parser.add_argument("--limpar-importacoes", action="store_true",
+                        help="apaga as abas importadas (ex.: NPS) e volta a usar as do Excel")
+    args = parser.parse_args()
+    if args.limpar_importacoes:
+        for name in clear_imported_sheets():
+            print(f"[INFO] Aba importada removida: {name}")
+    else:
+        for book in sorted({book for book, _, _ in SHEETS.values()}):
+            for path in build_snapshot(book):
+                print(f"[INFO] Snapshot gerado: {path}")
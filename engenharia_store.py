@@ -0,0 +1,234 @@
+"""
+Solicitações de assistência (aba engenharia) com as importações do portal Pós Obra.
+
+O conjunto de dados é a aba engenharia do base2025.xlsx (snapshot Parquet, ver
+data_store.py) com as importações aplicadas por cima, como upsert pelo N°:
+solicitações novas são acrescentadas e as existentes recebem os valores mais
+recentes do portal (mudança de status, encerramento preenchido etc.).
+
+Arquivos:
+  - engenharia_deltas.parquet:    último valor importado de cada N° tocado
+  - engenharia_changelog.parquet: o que cada importação mudou, célula a célula
+  - engenharia_store.json:        versão atual das importações
+  - .snapshots/engenharia-<hash>-v<versão>.parquet: conjunto materializado,
+    com as colunas derivadas ("Tempo de Encerramento", "Dias em Aberto",
+    "Sistema Construtivo" e "Tipo de Falha")
+
+Uma importação só recalcula as colunas derivadas das linhas que mudou. Quando o
+base2025.xlsx muda, o conjunto é remontado a partir da nova aba e dos deltas.
+As páginas devem usar `dataset_key()` como chave de cache (ela muda com o
+arquivo e com cada importação). `load_engenharia` entrega o conjunto com os
+tipos de schema.py (categóricas); o upsert trabalha sobre os tipos originais.
+"""
+import datetime as dt
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_store import SNAPSHOT_DIR, load_sheet, snapshot_key
+from schema import apply_schema
+from utils import resource_path
+from warranty_parser import split_sistema_falha
+
+DELTAS_FILE = "engenharia_deltas.parquet"
+CHANGELOG_FILE = "engenharia_changelog.parquet"
+META_FILE = "engenharia_store.json"
+
+KEY = "N°"
+# Colunas vindas do portal (ver pos_obra_import.COLUMNS); "FCR" só existe na planilha
+TRACKED_COLUMNS = ["Empreendimento", "Unidade", "Bloco", "Responsável", "Data de Abertura",
+                   "Encerramento", "Status", "Pesquisa", "Garantia Solicitada"]
+DATE_COLUMNS = ["Data de Abertura", "Encerramento"]
+DERIVED_COLUMNS = ["Tempo de Encerramento", "Dias em Aberto", "Sistema Construtivo", "Tipo de Falha"]
+CHANGELOG_COLUMNS = ["Importação", "N°", "Alteração", "Coluna", "Antes", "Depois"]
+
+
+# ================================
+# Versão
+# ================================
+def _read_meta():
+    try:
+        with open(resource_path(META_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {"version": 0}
+
+def _write_meta(meta):
+    path = resource_path(META_FILE)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp_path, path)
+
+def dataset_key():
+    """Chave dos dados de engenharia: hash do base2025.xlsx + versão das importações."""
+    return f"{snapshot_key()}-v{_read_meta()['version']}"
+
+def _write_parquet(df, path):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+# ================================
+# Normalização e colunas derivadas
+# ================================
+def _keys(values):
+    return pd.Series(values).astype(str).str.strip()
+
+def normalize_import(scraped):
+    """
+    Converte a tabela do portal para as convenções da aba engenharia: N° em texto,
+    datas DD/MM/YYYY em datetime e "Sistema: Falha" como "Sistema - Falha".
+    """
+    df = scraped[scraped[KEY].notna()].copy()
+    df[KEY] = _keys(df[KEY])
+    for col in DATE_COLUMNS:
+        df[col] = pd.to_datetime(df[col], format="%d/%m/%Y", errors="coerce")
+    df["Garantia Solicitada"] = df["Garantia Solicitada"].str.replace(": ", " - ", regex=False)
+    return df.drop_duplicates(KEY).reset_index(drop=True)
+
+def derive(df, today=None):
+    """Colunas derivadas das linhas de `df` (mesmo índice)."""
+    today = pd.Timestamp(today or dt.date.today())
+    tempo = (df["Encerramento"] - df["Data de Abertura"]).dt.days
+    derived = pd.DataFrame({
+        "Tempo de Encerramento": tempo,
+        "Dias em Aberto": np.where(df["Encerramento"].isna(), (today - df["Data de Abertura"]).dt.days, tempo),
+    }, index=df.index)
+    split = split_sistema_falha(df["Garantia Solicitada"])
+    for col in split.columns:
+        derived[col] = split[col].astype(object)
+    return derived
+
+def refresh_open_days(df, today=None):
+    """Atualiza "Dias em Aberto" apenas das solicitações ainda abertas (muda a cada dia)."""
+    today = pd.Timestamp(today or dt.date.today())
+    open_rows = df["Encerramento"].isna()
+    df.loc[open_rows, "Dias em Aberto"] = (today - df.loc[open_rows, "Data de Abertura"]).dt.days
+    return df
+
+
+# ================================
+# Upsert
+# ================================
+def upsert(base, incoming):
+    """
+    Aplica `incoming` (normalizada) sobre `base` pelo N°. Retorna
+    (conjunto atualizado, N° das linhas tocadas, changelog desta aplicação sem "Importação").
+    """
+    base_keys = pd.Index(_keys(base[KEY]))
+    positions = base_keys.get_indexer(incoming[KEY])
+    existing = positions >= 0
+
+    old = base.iloc[positions[existing]][TRACKED_COLUMNS].reset_index(drop=True)
+    new = incoming.loc[existing, TRACKED_COLUMNS].reset_index(drop=True)
+    same = (old == new) | (old.isna() & new.isna())
+    changed_rows = ~same.all(axis=1).to_numpy()
+
+    log = []
+    for row in np.flatnonzero(changed_rows):
+        key = incoming.loc[existing, KEY].iloc[row]
+        for col in np.array(TRACKED_COLUMNS)[~same.iloc[row].to_numpy()]:
+            log.append((key, "Alterada", col, old.at[row, col], new.at[row, col]))
+    added = incoming[~existing]
+    log += [(key, "Nova", "", None, None) for key in added[KEY]]
+    changelog = pd.DataFrame(log, columns=CHANGELOG_COLUMNS[1:])
+    for col in ["Antes", "Depois"]:
+        changelog[col] = changelog[col].map(_log_value).astype(object)
+
+    result = base.copy()
+    update_positions = positions[existing][changed_rows]
+    for col in TRACKED_COLUMNS:
+        result.iloc[update_positions, result.columns.get_loc(col)] = new.loc[changed_rows, col].to_numpy()
+    result = pd.concat([added.reindex(columns=base.columns), result], ignore_index=True)
+
+    touched = np.concatenate([np.arange(len(added)), update_positions + len(added)])
+    if touched.size:
+        rows = result.iloc[touched]
+        result.loc[rows.index, DERIVED_COLUMNS] = derive(rows)
+    return result, incoming[KEY][~existing].tolist() + incoming.loc[existing, KEY][changed_rows].tolist(), changelog
+
+def _log_value(value):
+    if value is None or pd.isna(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.strftime("%d/%m/%Y")
+    return str(value)
+
+
+# ================================
+# Conjunto materializado
+# ================================
+def _dataset_path(version):
+    return os.path.join(SNAPSHOT_DIR, f"engenharia-{snapshot_key()[:16]}-v{version}.parquet")
+
+def _build(version):
+    """Aba engenharia + colunas derivadas de todas as linhas + deltas importados."""
+    base = load_sheet("engenharia", compact=False)
+    base.columns = base.columns.str.strip().str.replace(r"\s+", " ", regex=True)
+    base = base.join(derive(base))
+    deltas_path = resource_path(DELTAS_FILE)
+    if os.path.exists(deltas_path):
+        base, _, _ = upsert(base, pd.read_parquet(deltas_path))
+    _save_dataset(base, version)
+    return base
+
+def _save_dataset(df, version):
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    target = _dataset_path(version)
+    _write_parquet(df, target)
+    for entry in os.listdir(SNAPSHOT_DIR):
+        old = os.path.join(SNAPSHOT_DIR, entry)
+        if entry.startswith("engenharia-") and entry.endswith(".parquet") and old != target:
+            os.remove(old)
+
+def _load_dataset():
+    version = _read_meta()["version"]
+    path = _dataset_path(version)
+    if os.path.exists(path):
+        return pd.read_parquet(path)
+    return _build(version)
+
+def load_engenharia():
+    """Conjunto de engenharia atual (aba + importações), com as colunas derivadas e os tipos de schema.py."""
+    return apply_schema("engenharia", _load_dataset())
+
+def read_changelog():
+    """Histórico das importações (mais recentes primeiro)."""
+    path = resource_path(CHANGELOG_FILE)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=CHANGELOG_COLUMNS)
+    return pd.read_parquet(path).iloc[::-1].reset_index(drop=True)
+
+def apply_import(scraped):
+    """
+    Aplica uma tabela importada do portal (ver pos_obra_import.parse_solicitacoes).
+    Retorna o changelog desta importação (vazio se nada mudou).
+    """
+    incoming = normalize_import(scraped)
+    current = _load_dataset()
+    updated, touched, changelog = upsert(current, incoming)
+    if changelog.empty:
+        return changelog
+
+    stamp = pd.Timestamp.now().floor("s")
+    changelog.insert(0, "Importação", stamp)
+
+    deltas_path = resource_path(DELTAS_FILE)
+    deltas = pd.read_parquet(deltas_path) if os.path.exists(deltas_path) else incoming.iloc[:0]
+    touched_rows = incoming[incoming[KEY].isin(touched)]
+    deltas = pd.concat([deltas[~deltas[KEY].isin(touched)], touched_rows], ignore_index=True)
+    _write_parquet(deltas, deltas_path)
+
+    log_path = resource_path(CHANGELOG_FILE)
+    history = pd.read_parquet(log_path) if os.path.exists(log_path) else None
+    _write_parquet(changelog if history is None else pd.concat([history, changelog], ignore_index=True), log_path)
+
+    meta = _read_meta()
+    meta = {"version": meta["version"] + 1, "updated": stamp.isoformat()}
+    _save_dataset(updated, meta["version"])
+    _write_meta(meta)
+    return changelog
@@ -0,0 +1,112 @@
+"""
+Leitura em streaming de abas grandes do Excel (openpyxl em modo read_only).
+
+Em vez de carregar a aba inteira com pd.read_excel, as linhas são percorridas
+uma a uma e só as colunas pedidas são guardadas, já convertidas para o tipo
+final enquanto são lidas. Ao final, cada coluna vira um array compacto:
+  - "date":     datetime64 (textos lidos como DD/MM/YYYY);
+  - "int":      o menor tipo inteiro que comporta os valores (Int64 se houver vazios);
+  - "float":    float64;
+  - "float32":  float32;
+  - "category": categórica (códigos, grupos e outros textos muito repetidos);
+  - "str":      texto.
+Linhas em que todas as colunas pedidas estão vazias são ignoradas (como as linhas
+em branco do fim da aba no pd.read_excel).
+"""
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+
+def _to_date(value):
+    if isinstance(value, (dt.datetime, dt.date)):
+        return value
+    if isinstance(value, str):
+        try:
+            return dt.datetime.strptime(value.strip(), "%d/%m/%Y")
+        except ValueError:
+            return None
+    return None
+
+def _to_int(value):
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int):
+        return value
+    try:
+        number = float(str(value).strip().replace(",", "."))
+    except ValueError:
+        return None
+    return int(number) if number.is_integer() else None
+
+def _to_float(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).strip().replace(",", "."))
+    except ValueError:
+        return None
+
+def _to_text(value):
+    return value if isinstance(value, str) else str(value)
+
+CONVERTERS = {
+    "date": _to_date,
+    "int": _to_int,
+    "float": _to_float,
+    "float32": _to_float,
+    "category": _to_text,
+    "str": _to_text,
+}
+
+
+def _column(values, kind):
+    """Array final da coluna `kind` a partir dos valores já convertidos (None = vazio)."""
+    if kind == "date":
+        return pd.to_datetime(pd.Series(values, dtype=object), errors="coerce")
+    if kind == "int":
+        if any(v is None for v in values):
+            return pd.array(values, dtype="Int64")
+        return pd.to_numeric(pd.Series(values, dtype="int64"), downcast="integer")
+    if kind in ("float", "float32"):
+        dtype = np.float32 if kind == "float32" else np.float64
+        return np.array([np.nan if v is None else v for v in values], dtype=dtype)
+    if kind == "category":
+        return pd.Categorical(values)
+    return pd.array(values, dtype="str")
+
+def read_columns(path, sheet, columns, header_row=1):
+    """
+    Lê de `sheet` apenas as colunas de `columns` (dict nome -> tipo, ver CONVERTERS),
+    com os nomes na linha `header_row` (1 = primeira linha da aba).
+    Espaços extras nos nomes do cabeçalho são ignorados.
+    Levanta KeyError se alguma coluna pedida não existir na aba.
+    """
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet]
+        header_cells = next(ws.iter_rows(min_row=header_row, max_row=header_row, values_only=True), ())
+        header = [" ".join(str(name).split()) if name is not None else None for name in header_cells]
+        missing = [name for name in columns if name not in header]
+        if missing:
+            raise KeyError(f"Colunas não encontradas na aba {sheet!r}: {missing}")
+
+        # Só o intervalo de colunas que contém as pedidas é convertido em valores pelo openpyxl
+        first, last = min(header.index(name) for name in columns), max(header.index(name) for name in columns)
+        positions = [header.index(name) - first for name in columns]
+        rows = ws.iter_rows(min_row=header_row + 1, min_col=first + 1, max_col=last + 1, values_only=True)
+        converters = [CONVERTERS[kind] for kind in columns.values()]
+        data = [[] for _ in columns]
+        for row in rows:
+            cells = [row[pos] if pos < len(row) else None for pos in positions]
+            if all(cell is None for cell in cells):
+                continue
+            for values, convert, cell in zip(data, converters, cells):
+                values.append(None if cell is None else convert(cell))
+    finally:
+        wb.close()
+
+    return pd.DataFrame({name: _column(values, kind)
+                         for (name, kind), values in zip(columns.items(), data)})
@@ -0,0 +1,146 @@
+"""
+Exportação de tabelas das páginas para arquivos (CSV ou Parquet).
+
+As páginas não gravam mais arquivos no caminho da requisição: quando o usuário
+pede a exportação (botão "Exportar CSV"), elas entregam o DataFrame à fila de
+exportação, que grava numa thread de fundo. Os arquivos da pasta do app são
+compartilhados por todas as sessões; os dados filtrados de cada sessão saem
+pelos botões de download.
+
+Para cada arquivo vale apenas o pedido mais recente (cliques seguidos no botão
+geram uma única gravação). O conteúdo só é gravado se o hash mudou, sempre num
+arquivo temporário seguido de os.replace, para que ninguém leia um arquivo pela
+metade.
+
+O formato vem da extensão do arquivo (.csv ou .parquet); `serialize` também
+alimenta os botões de download das páginas. No CSV, as datas (datetime64) saem
+como dd/mm/aaaa; no Parquet, ficam com o tipo nativo.
+"""
+import hashlib
+import io
+import os
+import threading
+import time
+
+import pandas as pd
+
+from table_format import DATE_STRFTIME
+
+FORMATS = {
+    ".csv": "text/csv",
+    ".parquet": "application/vnd.apache.parquet",
+}
+
+
+def export_format(path):
+    """Extensão do arquivo (".csv" ou ".parquet"); ValueError para formatos não suportados."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"Formato de exportação não suportado: '{ext}' (use {', '.join(FORMATS)})")
+    return ext
+
+def serialize(df, fmt):
+    """Conteúdo do arquivo em bytes: CSV UTF-8 ou Parquet, sem o índice."""
+    fmt = fmt if fmt.startswith(".") else f".{fmt}"
+    if fmt == ".csv":
+        # Só as colunas datetime64 (o date_format do to_csv também reformataria períodos)
+        dates = {col: df[col].dt.strftime(DATE_STRFTIME)
+                 for col in df.columns if pd.api.types.is_datetime64_any_dtype(df[col])}
+        return df.assign(**dates).to_csv(index=False, encoding="utf-8").encode("utf-8")
+    if fmt == ".parquet":
+        buffer = io.BytesIO()
+        try:
+            df.to_parquet(buffer, index=False)
+        except (ValueError, TypeError):
+            # Colunas de texto com tipos misturados: exporta como texto
+            buffer = io.BytesIO()
+            mixed = [col for col in df.columns if df[col].dtype == object]
+            df.astype({col: str for col in mixed}).to_parquet(buffer, index=False)
+        return buffer.getvalue()
+    raise ValueError(f"Formato de exportação não suportado: '{fmt}'")
+
+def _file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def write_atomic(path, data):
+    """Grava `data` em `path` via arquivo temporário + os.replace."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class ExportQueue:
+    """
+    Fila de exportações com uma thread de fundo. `submit` retorna imediatamente;
+    `status` informa o resultado da última exportação de cada arquivo.
+    """
+
+    def __init__(self):
+        self._pending = {}
+        self._hashes = {}
+        self._status = {}
+        self._busy = False
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def submit(self, df, path):
+        """Agenda a exportação de `df` para `path` (substitui um pedido ainda pendente)."""
+        export_format(path)
+        path = os.path.abspath(path)
+        with self._cond:
+            self._pending[path] = df.copy()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="export-queue", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._busy = False
+                    self._cond.notify_all()
+                    self._cond.wait()
+                path, df = self._pending.popitem()
+                self._busy = True
+            self._export(path, df)
+
+    def _export(self, path, df):
+        try:
+            data = serialize(df, export_format(path))
+            digest = hashlib.sha256(data).hexdigest()
+            previous = self._hashes.get(path)
+            if previous is None and os.path.exists(path):
+                previous = _file_hash(path)
+            if digest == previous:
+                result = "sem alterações"
+            else:
+                write_atomic(path, data)
+                result = "gravado"
+            self._hashes[path] = digest
+        except Exception as e:
+            result = f"erro: {e}"
+        with self._cond:
+            self._status[path] = (result, time.time())
+
+    def status(self, path):
+        """(resultado, horário) da última exportação de `path`, ou None."""
+        with self._cond:
+            return self._status.get(os.path.abspath(path))
+
+    def flush(self, timeout=None):
+        """Espera as exportações pendentes terminarem; retorna False se o tempo acabar."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+
+# Instância única do processo, compartilhada por todas as sessões
+export_queue = ExportQueue()
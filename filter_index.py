@@ -0,0 +1,90 @@
+"""
+Índice de filtros para painéis com muitos multiselects.
+
+Para cada coluna filtrável, o índice guarda (uma vez por versão dos dados):
+  - o código de cada linha (pd.factorize, -1 para vazios);
+  - a lista de opções na ordem de aparição (igual a `.dropna().unique().tolist()`);
+  - um índice invertido: as posições das linhas de cada valor distinto.
+
+A seleção atual dos widgets vira uma única máscara booleana, combinando as
+posições dos valores escolhidos em cada coluna, sem cópias intermediárias do
+DataFrame. O índice invertido ocupa O(linhas) por coluna, mesmo em colunas
+com um valor por linha (como o N° do chamado).
+"""
+import numpy as np
+import pandas as pd
+
+
+class FilterIndex:
+    """
+    Índice de filtros sobre colunas alinhadas às linhas de um DataFrame.
+    `columns` é um dict nome do filtro -> Series/array com um valor por linha.
+    """
+
+    def __init__(self, columns):
+        self._codes = {}
+        self._options = {}
+        self._lookup = {}
+        self._order = {}
+        self._starts = {}
+        self.n_rows = None
+        for name, values in columns.items():
+            values = pd.Series(values)
+            if self.n_rows is None:
+                self.n_rows = len(values)
+            elif len(values) != self.n_rows:
+                raise ValueError(f"Coluna de filtro '{name}' com {len(values)} linhas; esperado {self.n_rows}.")
+
+            codes, uniques = pd.factorize(values)
+            options = list(uniques.tolist())
+            counts = np.bincount(codes[codes >= 0], minlength=len(options))
+            n_missing = int((codes < 0).sum())
+
+            self._codes[name] = codes
+            self._options[name] = options
+            self._lookup[name] = {value: k for k, value in enumerate(options)}
+            # Linhas ordenadas por código: as de código k ficam em order[starts[k]:starts[k + 1]]
+            self._order[name] = np.argsort(codes, kind="stable")
+            self._starts[name] = n_missing + np.concatenate(([0], np.cumsum(counts)))
+
+    def options(self, name):
+        """Valores distintos (sem vazios) da coluna, na ordem de aparição."""
+        return list(self._options[name])
+
+    def codes(self, name):
+        """Código inteiro de cada linha (-1 para vazios)."""
+        return self._codes[name]
+
+    def rows(self, name, value):
+        """Posições das linhas em que a coluna `name` vale `value`."""
+        k = self._lookup[name].get(value)
+        if k is None:
+            return np.empty(0, dtype=np.intp)
+        order, starts = self._order[name], self._starts[name]
+        return order[starts[k]:starts[k + 1]]
+
+    def mask(self, selections):
+        """
+        Máscara booleana das linhas que atendem a todas as seleções
+        (dict nome -> lista de valores; listas vazias não filtram).
+        Retorna None quando nenhuma seleção está ativa.
+        """
+        combined = None
+        for name, selected in selections.items():
+            if not selected:
+                continue
+            column_mask = np.zeros(self.n_rows, dtype=bool)
+            for value in selected:
+                column_mask[self.rows(name, value)] = True
+            if combined is None:
+                combined = column_mask
+            else:
+                combined &= column_mask
+        return combined
+
+    def apply(self, df, selections):
+        """DataFrame filtrado pelas seleções, com uma única cópia no final."""
+        mask = self.mask(selections)
+        if mask is None:
+            return df.copy()
+        return df[mask]
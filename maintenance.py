@@ -0,0 +1,142 @@
+"""
+Cálculos da aba Manutenção da página financeira.
+
+A despesa real por empreendimento relaciona os lançamentos da grd_Listagem
+(coluna "Cód. Alternativo Serviço") com os nomes dos empreendimentos da aba
+departamento por *contenção de texto*: um código de serviço pertence ao
+empreendimento quando aparece dentro do nome dele (ex.: "PORTO BELO" em
+"RESIDENCIAL PORTO BELO II"), e os lançamentos somados para o código são todos
+aqueles cujo código contém o código procurado.
+
+Em vez de varrer a grd_Listagem para cada par (empreendimento, código), o índice
+é montado uma vez por versão dos dados: os valores são somados por texto de
+código distinto e a contenção é avaliada apenas entre textos distintos.
+
+A previsão de gastos por ano (forecast_matrix) aplica a curva de garantia a
+todos os pares (empreendimento, ano) de uma vez.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+SERVICE_CODE_COL = "Cód. Alternativo Serviço"
+VALUE_COL = "Valor Conv."
+EXCLUDED_CODES = {"ADM"}  # despesas administrativas não entram em nenhum empreendimento
+
+# Previsão de gastos: orçamento de manutenção = custo de construção x taxa,
+# distribuído pelos anos de garantia após a entrega conforme a curva abaixo.
+BUDGET_RATE = 0.015
+# Fração do orçamento por ano desde a entrega (posição 0 = ano da entrega);
+# anos antes da entrega ou além da curva ficam com 0.
+WARRANTY_CURVE = (0.5, 0.5, 0.2, 0.1, 0.1, 0.1)
+
+
+def build_service_index(df_grd, empreendimentos):
+    """
+    Monta o índice código de serviço -> empreendimento.
+
+    Retorna um DataFrame com uma linha por par (Empreendimento, código) em que o
+    código está contido no nome do empreendimento, com as colunas:
+      - "Empreendimento"
+      - "Cód. Alternativo Serviço": código normalizado (strip + maiúsculas)
+      - "Valor Conv.": total dos lançamentos cujo código contém o código normalizado,
+        multiplicado pelo número de grafias distintas do código na grd_Listagem
+        (mesma contagem do laço original, que percorria os valores únicos da coluna).
+    """
+    codes = df_grd[SERVICE_CODE_COL]
+
+    # Grafias distintas de cada código normalizado (o laço antigo somava uma vez por grafia)
+    distinct = pd.Series(codes.dropna().unique()).astype(str)
+    code_weights = distinct.str.strip().str.upper().value_counts()
+    code_weights = code_weights[~code_weights.index.isin(EXCLUDED_CODES)]
+
+    # Total por texto de código distinto da grd_Listagem
+    row_text = codes.astype(str).str.strip().str.upper()
+    value_by_text = df_grd[VALUE_COL].groupby(row_text).sum()
+
+    # Total por código normalizado: soma dos textos que o contêm
+    code_totals = pd.Series(
+        {code: value_by_text[[code in text for text in value_by_text.index]].sum()
+         for code in code_weights.index},
+        dtype="float64",
+    )
+
+    # Pares (empreendimento, código) por contenção no nome do empreendimento
+    pairs = []
+    for empreendimento in pd.Series(empreendimentos).dropna().unique():
+        nome = str(empreendimento).upper()
+        for code, weight in code_weights.items():
+            if code in nome:
+                pairs.append((empreendimento, code, code_totals[code] * weight))
+    return pd.DataFrame(pairs, columns=["Empreendimento", SERVICE_CODE_COL, VALUE_COL])
+
+def real_spend_by_enterprise(service_index, empreendimentos):
+    """
+    Despesa real (grd_Listagem) para cada empreendimento de `empreendimentos`,
+    na mesma ordem; empreendimentos sem código associado ficam com 0.
+    """
+    totals = service_index.groupby("Empreendimento")[VALUE_COL].sum()
+    return pd.Series(empreendimentos).map(totals).fillna(0.0).to_numpy()
+
+def resolve_enterprise_codes(codes, df_departamento):
+    """
+    Resolve cada código de serviço distinto para o primeiro empreendimento da aba
+    departamento cujo nome (em maiúsculas) contém o código (também em maiúsculas,
+    interpretado como expressão regular, como no str.contains original).
+
+    Retorna (lookup, unresolved):
+      - lookup: DataFrame indexado pelo código, com "Data_CVCO_Ref" e "Status_Depto"
+      - unresolved: lista ordenada dos códigos sem empreendimento correspondente
+    """
+    names = df_departamento["Empreendimento"].astype("string").str.upper()
+    rows = {}
+    unresolved = []
+    for code in pd.Series(codes).dropna().unique():
+        pattern = str(code).upper()
+        try:
+            matches = names.str.contains(pattern, regex=True, na=False)
+        except re.error:
+            matches = names.str.contains(pattern, regex=False, na=False)
+        if matches.any():
+            row = df_departamento.loc[matches.to_numpy()].iloc[0]
+            rows[code] = (row["Data CVCO"], row["Status"])
+        else:
+            unresolved.append(code)
+    lookup = pd.DataFrame.from_dict(rows, orient="index", columns=["Data_CVCO_Ref", "Status_Depto"])
+    lookup["Data_CVCO_Ref"] = pd.to_datetime(lookup["Data_CVCO_Ref"], errors="coerce")
+    return lookup, sorted(map(str, unresolved))
+
+def attach_enterprise_info(df_grd, lookup):
+    """Acrescenta "Data_CVCO_Ref" e "Status_Depto" à grd_Listagem com um único join pelo código."""
+    df_grd = df_grd.drop(columns=["Data_CVCO_Ref", "Status_Depto"], errors="ignore")
+    return df_grd.join(lookup, on=SERVICE_CODE_COL)
+
+def forecast_matrix(costs, delivery_years, years, rate=BUDGET_RATE, curve=WARRANTY_CURVE):
+    """
+    Matriz (empreendimento x ano) da previsão de gastos de manutenção:
+    custo x taxa x curva[ano - ano de entrega].
+
+    A diferença de anos é montada por broadcasting e convertida em posição da
+    curva (com uma posição extra valendo 0 para fora da garantia ou sem data),
+    de modo que a curva é consultada uma única vez para a matriz inteira.
+    """
+    costs = np.asarray(costs, dtype=float)
+    delivery_years = np.asarray(delivery_years, dtype=float)
+    years = np.asarray(years, dtype=float)
+    lookup = np.append(np.asarray(curve, dtype=float), 0.0)
+
+    diff = years[np.newaxis, :] - delivery_years[:, np.newaxis]
+    inside = (diff >= 0) & (diff < len(curve))  # NaN (sem data de entrega) fica fora
+    positions = np.where(inside, diff, len(curve)).astype(np.intp)
+    return (costs * rate)[:, np.newaxis] * lookup[positions]
+
+def forecast_table(df_departamento, years, rate=BUDGET_RATE, curve=WARRANTY_CURVE):
+    """
+    Tabela do "Calendário de Previsão de Gastos de Manutenção": Empreendimento,
+    Custo de Construção e Entrega_Year, mais uma coluna "Previsão (<ano>)" por ano.
+    """
+    table = df_departamento[["Empreendimento", "Custo de Construção", "Entrega_Year"]].copy()
+    matrix = forecast_matrix(table["Custo de Construção"], table["Entrega_Year"], years, rate, curve)
+    columns = pd.DataFrame(matrix, index=table.index, columns=[f"Previsão ({year})" for year in years])
+    return pd.concat([table, columns], axis=1)
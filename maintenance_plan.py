@@ -0,0 +1,239 @@
+"""
+Armazenamento do plano de manutenção editável (aba Manutenção da página financeira).
+
+Substitui o maintenance_data.pkl, que era regravado inteiro a cada interação e
+podia ser sobrescrito por duas pessoas editando ao mesmo tempo. O plano fica num
+SQLite em modo WAL (leituras não bloqueiam a escrita) com três tabelas:
+  - plan_meta:  versão global do plano, ordem e tipos das colunas
+  - plan_rows:  uma linha por linha do plano, com a sua versão
+  - plan_cells: o valor de cada célula (linha, coluna)
+
+Salvar grava apenas as células alteradas, linha a linha, com controle de
+concorrência otimista: a linha só é atualizada se a versão lida pela sessão
+ainda for a versão gravada; caso contrário nada é gravado e PlanConflictError
+informa as linhas alteradas por outra pessoa. As leituras passam pelo cache
+compartilhado, usando a versão global como chave.
+
+As páginas usam uma única instância por processo (get_plan_store), que só
+consulta o banco para a carga inicial na primeira execução.
+"""
+import json
+import sqlite3
+import threading
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+from data_cache import shared_cache
+from utils import resource_path
+
+PLAN_DB = "maintenance_plan.db"
+LEGACY_PICKLE = "maintenance_data.pkl"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plan_meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS plan_rows (row_id INTEGER PRIMARY KEY, version INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS plan_cells (
+    row_id INTEGER NOT NULL,
+    col TEXT NOT NULL,
+    value,
+    PRIMARY KEY (row_id, col)
+);
+"""
+
+
+class PlanConflictError(Exception):
+    """Linhas do plano alteradas por outra sessão depois da leitura."""
+
+    def __init__(self, rows):
+        self.rows = sorted(rows)
+        super().__init__(f"Linhas alteradas por outro usuário: {self.rows}")
+
+
+def _scalar(value):
+    """Valor de célula em tipo aceito pelo SQLite (vazios viram NULL)."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return value
+
+def changed_rows(before, after):
+    """Índices das linhas de `after` com alguma célula diferente de `before` (ou novas)."""
+    common = after.index.intersection(before.index)
+    left = before.loc[common, after.columns]
+    right = after.loc[common]
+    differs = ~((left == right) | (left.isna() & right.isna())).all(axis=1)
+    new = after.index.difference(before.index)
+    return common[differs.to_numpy()].append(new)
+
+
+class MaintenancePlanStore:
+    """Plano de manutenção em SQLite (WAL), com versões por linha."""
+
+    def __init__(self, path=None):
+        self.path = path or resource_path(PLAN_DB)
+        self._seeded = False
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10, isolation_level=None)
+
+    def version(self):
+        """Versão global do plano (0 enquanto estiver vazio)."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM plan_meta WHERE name = 'version'").fetchone()
+        return int(row[0]) if row else 0
+
+    def load(self):
+        """
+        Retorna (plano, versões por linha, versão global). O plano é lido do banco
+        apenas quando a versão global muda; nas demais vezes vem do cache compartilhado.
+        """
+        version = self.version()
+        df, row_versions = shared_cache.get(f"plano_manutencao:{self.path}", version, self._read)
+        return df, dict(row_versions), version
+
+    def _read(self):
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN")
+            meta = dict(conn.execute("SELECT name, value FROM plan_meta").fetchall())
+            rows = conn.execute("SELECT row_id, version FROM plan_rows ORDER BY row_id").fetchall()
+            cells = conn.execute("SELECT row_id, col, value FROM plan_cells").fetchall()
+            conn.execute("COMMIT")
+        columns = json.loads(meta.get("columns", "[]"))
+        dtypes = json.loads(meta.get("dtypes", "{}"))
+        row_ids = [row_id for row_id, _ in rows]
+
+        long = pd.DataFrame(cells, columns=["row_id", "col", "value"])
+        df = long.pivot(index="row_id", columns="col", values="value") if not long.empty else pd.DataFrame()
+        df = df.reindex(index=row_ids, columns=columns)
+        df.index.name = None
+        df.columns.name = None
+        for col, dtype in dtypes.items():
+            try:
+                df[col] = df[col].astype(dtype)
+            except (TypeError, ValueError):
+                pass  # ex.: coluna inteira com célula vazia; mantém o tipo lido
+        return df, dict(rows)
+
+    def replace(self, df):
+        """Substitui o plano inteiro (ex.: "Reset Ajustes"); todas as linhas ganham nova versão."""
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._write_all(conn, df)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return self.version()
+
+    def is_empty(self):
+        """True se o plano ainda não tem nenhuma linha (leitura simples, sem lock de escrita)."""
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT 1 FROM plan_rows LIMIT 1").fetchone() is None
+
+    def seed(self, loader):
+        """
+        Grava o DataFrame retornado por `loader()` como plano inicial, apenas se o banco
+        ainda estiver vazio. `loader` só é chamado (e o lock de escrita só é pedido)
+        quando o banco está vazio; depois da primeira verificação a instância não
+        consulta mais o banco.
+        """
+        if self._seeded:
+            return
+        if self.is_empty():
+            df = loader()
+            with closing(self._connect()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    # Outra sessão pode ter semeado o plano entre a leitura e o lock
+                    if conn.execute("SELECT 1 FROM plan_rows LIMIT 1").fetchone() is None:
+                        self._write_all(conn, df)
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+        self._seeded = True
+
+    def _write_all(self, conn, df):
+        version = self._bump_version(conn)
+        conn.execute("DELETE FROM plan_cells")
+        conn.execute("DELETE FROM plan_rows")
+        conn.executemany("INSERT INTO plan_rows (row_id, version) VALUES (?, ?)",
+                         [(int(row_id), version) for row_id in df.index])
+        conn.executemany("INSERT INTO plan_cells (row_id, col, value) VALUES (?, ?, ?)",
+                         [(int(row_id), col, _scalar(value))
+                          for row_id, record in df.iterrows() for col, value in record.items()])
+        meta = {"columns": json.dumps(list(df.columns)),
+                "dtypes": json.dumps({col: str(dtype) for col, dtype in df.dtypes.items()})}
+        conn.executemany("INSERT OR REPLACE INTO plan_meta (name, value) VALUES (?, ?)", meta.items())
+
+    def save_rows(self, before, after, row_versions):
+        """
+        Grava as células de `after` que diferem de `before` (linhas com o mesmo índice).
+        `row_versions` são as versões das linhas quando a sessão leu o plano.
+        Retorna as novas versões das linhas gravadas ({} se nada mudou) ou levanta
+        PlanConflictError, sem gravar nada, se alguma linha mudou no banco nesse meio tempo.
+        """
+        rows = changed_rows(before, after)
+        if rows.empty:
+            return {}
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                version = self._bump_version(conn)
+                conflicts = []
+                for row_id in rows:
+                    expected = row_versions.get(row_id)
+                    if expected is None:
+                        cursor = conn.execute("INSERT OR IGNORE INTO plan_rows (row_id, version) VALUES (?, ?)",
+                                              (int(row_id), version))
+                    else:
+                        cursor = conn.execute("UPDATE plan_rows SET version = ? WHERE row_id = ? AND version = ?",
+                                              (version, int(row_id), expected))
+                    if cursor.rowcount == 0:
+                        conflicts.append(row_id)
+                if conflicts:
+                    raise PlanConflictError(conflicts)
+
+                cells = []
+                for row_id in rows:
+                    new = after.loc[row_id]
+                    old = before.loc[row_id] if row_id in before.index else None
+                    for col, value in new.items():
+                        if old is not None and (old[col] == value or (pd.isna(old[col]) and pd.isna(value))):
+                            continue
+                        cells.append((int(row_id), col, _scalar(value)))
+                conn.executemany("INSERT OR REPLACE INTO plan_cells (row_id, col, value) VALUES (?, ?, ?)", cells)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return {int(row_id): version for row_id in rows}
+
+    @staticmethod
+    def _bump_version(conn):
+        row = conn.execute("SELECT value FROM plan_meta WHERE name = 'version'").fetchone()
+        version = (int(row[0]) if row else 0) + 1
+        conn.execute("INSERT OR REPLACE INTO plan_meta (name, value) VALUES ('version', ?)", (str(version),))
+        return version
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_plan_store():
+    """Instância única de MaintenancePlanStore (criada na primeira chamada), compartilhada pelas sessões."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = MaintenancePlanStore()
+        return _store
@@ -0,0 +1,155 @@
+"""
+Importação do resultado da pesquisa de satisfação (NPS) do portal Pós Obra.
+
+Uma única sessão do Chrome (sem janela, por padrão) faz o login, abre
+"Pesquisa > Resultado da Pesquisa" e seleciona "Todos"; cada etapa espera a
+condição correspondente na página (elemento clicável, tabela atualizada), sem
+pausas fixas. O HTML final é lido uma vez e dele saem as métricas do topo e a
+tabela "Resultado por PERGUNTAS". As notas por pergunta são gravadas direto
+na aba NPS do armazenamento de snapshots (ver data_store.save_imported_sheet);
+as métricas, na aba NPS_metricas.
+
+Uso pela linha de comando:
+    python nps_import.py                              # acessa o portal e grava
+    python nps_import.py --html pagina.html           # grava a partir de uma página salva
+    python nps_import.py --html pagina.html --dry-run # só lê e mostra o resultado
+"""
+import argparse
+import time
+
+import pandas as pd
+from lxml import html as lxml_html
+
+from data_store import save_imported_sheet
+from portal import DEFAULT_PASSWORD, DEFAULT_USER, login, new_driver, show_all_rows
+
+RESULTS_TABLE = "tabpesquisas"
+
+_METRIC1_XPATH = "//div[@class='col-12 text-center']//span[contains(@class, 'text-success')]"
+_METRIC2_VALUE_XPATH = ("//span[contains(@class, 'text-primary') and contains(@class, 'fs-6') "
+                        "and contains(@class, 'fw-bold')]")
+_METRIC2_PERCENT_XPATH = ("//span[contains(@class, 'text-info') and contains(@class, 'fs-1') "
+                          "and contains(@class, 'fw-bold')]")
+_NOTE_XPATH = ("//span[contains(@class, 'fs-3') and contains(@class, 'fw-bold') "
+               "and contains(@class, 'me-2') and contains(@class, 'text-success')]")
+_QUESTION_XPATH = "//span[contains(@class, 'ms-3')]"
+
+
+# ================================
+# Leitura do HTML
+# ================================
+def _texts(tree, xpath):
+    return [" ".join(elem.text_content().split()) for elem in tree.xpath(xpath)]
+
+def _first(tree, xpath):
+    texts = _texts(tree, xpath)
+    return texts[0] if texts else None
+
+def parse_resultado(page_html):
+    """
+    Extrai (métricas, notas por pergunta) da página "Resultado da Pesquisa".
+    A Média Geral é a média das notas das perguntas, com 2 casas.
+    """
+    tree = lxml_html.fromstring(page_html)
+    metric1 = _first(tree, _METRIC1_XPATH)
+    metric2_value = _first(tree, _METRIC2_VALUE_XPATH)
+    metric2_percentage = _first(tree, _METRIC2_PERCENT_XPATH)
+
+    notes = pd.to_numeric(pd.Series(_texts(tree, _NOTE_XPATH), dtype=object).str.replace(",", "."),
+                          errors="coerce")
+    questions = _texts(tree, _QUESTION_XPATH)
+    size = min(len(questions), len(notes))
+    df_questions = pd.DataFrame({"Pergunta": questions[:size], "Nota": notes[:size].to_numpy()})
+
+    media_geral = notes.mean() if notes.notna().any() else None
+    df_metrics = pd.DataFrame({
+        "Métrica": ["Métrica 1", "Métrica 2", "Média Geral"],
+        "Valor": [
+            metric1,
+            f"{metric2_value} {metric2_percentage}" if metric2_value and metric2_percentage else None,
+            f"{media_geral:.2f}" if media_geral is not None else None,
+        ],
+    })
+    return df_metrics, df_questions
+
+
+# ================================
+# Acesso ao portal
+# ================================
+def fetch_page(usuario=DEFAULT_USER, senha=DEFAULT_PASSWORD, headless=True, timeout=20):
+    """Abre "Resultado da Pesquisa" com todos os registros e devolve o HTML da página."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    driver = new_driver(headless)
+    wait = WebDriverWait(driver, timeout)
+    try:
+        login(driver, wait, usuario, senha)
+        wait.until(EC.element_to_be_clickable(
+            (By.XPATH, "//a[contains(@class, 'nav-link dropdown-toggle') and contains(., 'Pesquisa')]")
+        )).click()
+        wait.until(EC.element_to_be_clickable(
+            (By.XPATH, "//a[contains(@class, 'dropdown-item') and contains(., 'Resultado da Pesquisa')]")
+        )).click()
+        print("[INFO] Tela 'Resultado da Pesquisa' aberta.")
+        show_all_rows(wait, RESULTS_TABLE)
+        # Métricas e notas por pergunta já renderizadas
+        wait.until(EC.presence_of_element_located((By.XPATH, "//th[contains(., 'Perguntas')]")))
+        wait.until(EC.presence_of_element_located((By.XPATH, _NOTE_XPATH)))
+        return driver.page_source
+    finally:
+        driver.quit()
+
+
+# ================================
+# Importação
+# ================================
+def import_nps(page_html, dry_run=False, excel_path=None):
+    """
+    Lê a página e grava as abas NPS (notas por pergunta) e NPS_metricas.
+    Com `dry_run`, apenas devolve (métricas, perguntas) sem gravar nada.
+    `excel_path` também grava a planilha no formato antigo (abas "Métricas" e "Perguntas").
+    """
+    df_metrics, df_questions = parse_resultado(page_html)
+    if df_questions.empty:
+        raise ValueError("Nenhuma nota por pergunta encontrada na página.")
+    if dry_run:
+        return df_metrics, df_questions
+    save_imported_sheet("NPS", df_questions)
+    save_imported_sheet("NPS_metricas", df_metrics)
+    if excel_path:
+        with pd.ExcelWriter(excel_path, engine="openpyxl") as writer:
+            df_metrics.to_excel(writer, sheet_name="Métricas", index=False)
+            df_questions.to_excel(writer, sheet_name="Perguntas", index=False)
+    return df_metrics, df_questions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Importa o resultado da pesquisa de satisfação (NPS) do portal Pós Obra.")
+    parser.add_argument("--html", help="usa uma página HTML salva em vez de acessar o portal")
+    parser.add_argument("--dry-run", action="store_true", help="só lê e mostra o resultado, sem gravar")
+    parser.add_argument("--excel", default=None, help="também grava o resultado nesta planilha (formato antigo)")
+    parser.add_argument("--usuario", default=DEFAULT_USER)
+    parser.add_argument("--senha", default=DEFAULT_PASSWORD)
+    parser.add_argument("--com-janela", action="store_true", help="mostra a janela do Chrome")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    if args.html:
+        with open(args.html, encoding="utf-8") as f:
+            page_html = f.read()
+    else:
+        page_html = fetch_page(args.usuario, args.senha, headless=not args.com_janela)
+    try:
+        df_metrics, df_questions = import_nps(page_html, dry_run=args.dry_run, excel_path=args.excel)
+    except ValueError as e:
+        raise SystemExit(f"[ERRO] {e}")
+
+    print(df_metrics.to_string(index=False))
+    print(df_questions.to_string(index=False))
+    acao = "lido (dry-run)" if args.dry_run else "gravado na aba NPS"
+    print(f"[INFO] Resultado {acao} em {time.perf_counter() - inicio:.2f} s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Cubo de agregação das solicitações de assistência técnica.
+
+Em vez de agrupar o DataFrame filtrado a cada gráfico, as solicitações são
+agregadas uma única vez (por versão dos dados) em um cubo com uma linha por
+combinação de dimensões (AnoMes, Empreendimento, Status, Sistema Construtivo,
+Tipo de Falha, Responsável, FCR) e as medidas:
+  - Solicitações: número de linhas;
+  - Encerradas: linhas com "Encerramento" preenchido;
+  - Encerradas com Tempo: encerradas com "Tempo de Encerramento" preenchido;
+  - Tempo de Encerramento: soma do tempo de encerramento das encerradas.
+
+Os filtros dos painéis viram máscaras sobre as linhas do cubo e os gráficos
+somam as medidas pelas dimensões de interesse, então o custo não depende mais
+do número de solicitações. "Ano" e "Mês" acompanham o AnoMes (não aumentam o
+número de linhas) para que os filtros por ano/mês também sejam aplicados no cubo.
+"""
+import numpy as np
+import pandas as pd
+
+CUBE_DIMENSIONS = ["AnoMes", "Ano", "Mês", "Empreendimento", "Status", "Sistema Construtivo",
+                   "Tipo de Falha", "Responsável", "FCR"]
+CUBE_MEASURES = ["Solicitações", "Encerradas", "Encerradas com Tempo", "Tempo de Encerramento"]
+
+
+def build_cube(df, date_col="Data de Abertura"):
+    """
+    Cubo (DataFrame) com as dimensões presentes em `df` e as medidas somadas.
+    Vazios nas dimensões formam grupos próprios (somem só no rollup, como no groupby).
+    """
+    dates = df[date_col]
+    encerrada = df["Encerramento"].notna().to_numpy()
+    tempo = df["Tempo de Encerramento"].to_numpy(dtype=float)
+    com_tempo = encerrada & ~np.isnan(tempo)
+    keys = pd.DataFrame({
+        "AnoMes": dates.dt.to_period("M").astype(str),
+        "Ano": dates.dt.year,
+        "Mês": dates.dt.month,
+    }, index=df.index)
+    for dim in CUBE_DIMENSIONS[3:]:
+        if dim in df.columns:
+            keys[dim] = df[dim]
+    measures = pd.DataFrame({
+        "Solicitações": np.ones(len(df), dtype=np.int64),
+        "Encerradas": encerrada.astype(np.int64),
+        "Encerradas com Tempo": com_tempo.astype(np.int64),
+        "Tempo de Encerramento": np.where(com_tempo, tempo, 0.0),
+    }, index=df.index)
+    return (
+        pd.concat([keys, measures], axis=1)
+        .groupby(list(keys.columns), dropna=False, sort=False, observed=True)[CUBE_MEASURES].sum()
+        .reset_index()
+    )
+
+def covers(cube, selections):
+    """True se todas as seleções ativas são sobre dimensões do cubo."""
+    return all(name in cube.columns for name, selected in selections.items() if selected)
+
+def slice_cube(cube, selections):
+    """Linhas do cubo que atendem às seleções (dict dimensão -> valores; listas vazias não filtram)."""
+    mask = np.ones(len(cube), dtype=bool)
+    for name, selected in selections.items():
+        if selected:
+            mask &= cube[name].isin(selected).to_numpy()
+    return cube[mask]
+
+def rollup(cube, by, measure="Solicitações"):
+    """Soma de `measure` por `by` (grupos vazios descartados, chaves ordenadas), sem grupos zerados."""
+    totals = cube.groupby(by, observed=True)[measure].sum()
+    return totals[totals > 0]
+
+def mean_closing_time(cube, by):
+    """Tempo médio de encerramento por `by`, só nos grupos com solicitações encerradas."""
+    sums = cube.groupby(by, observed=True)[["Encerradas", "Encerradas com Tempo", "Tempo de Encerramento"]].sum()
+    sums = sums[sums["Encerradas"] > 0]
+    # Grupo só com encerradas sem tempo: média NaN, como no groupby(...).mean()
+    return sums["Tempo de Encerramento"] / sums["Encerradas com Tempo"].where(sums["Encerradas com Tempo"] > 0)
@@ -7,6 +7,9 @@ import sys
 import os
 from PIL import Image
 from utils import resource_path
+from data_store import load_sheet
+from export_service import FORMATS, export_queue, serialize
+from table_format import date_column_config, format_date
 
 # Configurando Página
 st.set_page_config(
@@ -38,20 +41,15 @@ st.markdown('''
 # CEBEÇALHO FIM ===============================================================================================================================
 
 # BASE DO EXCEL =================================================================================================================
-excel_base2025 = 'base2025.xlsx'
-
 try:
-    # Carregar a aba 'departamento' do Excel
-    df_departamento = pd.read_excel(excel_base2025, sheet_name='departamento')
+    # Carregar a aba 'departamento' (snapshot do base2025.xlsx)
+    df_departamento = load_sheet('departamento')
 
     # Garantir que as colunas "Data CVCO" e "Data Entrega de obra" estejam em formato datetime
+    # (continuam datetime: o formato dd/mm/aaaa é aplicado só na exibição, ver table_format.py)
     df_departamento['Data CVCO'] = pd.to_datetime(df_departamento['Data CVCO'], errors='coerce')
     df_departamento['Data Entrega de obra'] = pd.to_datetime(df_departamento['Data Entrega de obra'], errors='coerce')
 
-    # Formatar as colunas de data para o formato dd/mm/aaaa
-    df_departamento['Data CVCO'] = df_departamento['Data CVCO'].dt.strftime('%d/%m/%Y')  # Data no formato dd/mm/aaaa
-    df_departamento['Data Entrega de obra'] = df_departamento['Data Entrega de obra'].dt.strftime('%d/%m/%Y')  # Data no formato dd/mm/aaaa
-
     # Filtro de múltiplas seleções para 'Obra Nome' na sidebar
     obras_disponiveis = df_departamento['Empreendimento'].unique().tolist()
     obra_nome_selecionadas = st.sidebar.multiselect("Filtrar por Obra Nome:", obras_disponiveis, default=[])
@@ -74,13 +72,13 @@ try:
     df_departamento['N° Unidades'] = pd.to_numeric(df_departamento['N° Unidades'], errors='coerce')
     df_departamento['Orçamento (1,5%)'] = pd.to_numeric(df_departamento['Orçamento (1,5%)'], errors='coerce')
 
-    # Exibindo o DataFrame no Streamlit
-    st.dataframe(df_departamento, use_container_width=True)
+    # Exibindo o DataFrame no Streamlit (datas no formato dd/mm/aaaa)
+    st.dataframe(df_departamento, use_container_width=True, column_config=date_column_config(df_departamento))
 
     # Criar o gráfico de colunas para "N° Unidades" ao longo do tempo (soma acumulada)
     if 'N° Unidades' in df_departamento.columns and 'Data Entrega de obra' in df_departamento.columns:
         # Agrupar por Mês e Ano
-        df_departamento['Ano-Mês'] = pd.to_datetime(df_departamento['Data Entrega de obra']).dt.to_period('M')
+        df_departamento['Ano-Mês'] = df_departamento['Data Entrega de obra'].dt.to_period('M')
 
         # Agrupar a soma do "N° Unidades" por ano e mês
         df_unidades_mensal = df_departamento.groupby('Ano-Mês')['N° Unidades'].sum().reset_index()
@@ -135,14 +133,16 @@ try:
 
         with col1_2:
             # Exibindo o intervalo de datas selecionadas
-            data_inicio = pd.to_datetime(data_inicio).strftime('%d/%m/%Y')
-            data_fim = pd.to_datetime(data_fim).strftime('%d/%m/%Y')
-            st.write(f"Período selecionado: {data_inicio} até {data_fim}")
+            data_inicio = pd.to_datetime(data_inicio)
+            data_fim = pd.to_datetime(data_fim)
+            st.write(f"Período selecionado: {format_date(data_inicio)} até {format_date(data_fim)}")
 
             # Filtrando os dados para o gráfico de acordo com o intervalo de datas selecionado
+            # (data não escolhida: sem limite daquele lado)
+            meses = df_unidades_mensal['Ano-Mês'].dt.to_timestamp()
             df_unidades_mensal = df_unidades_mensal[
-                (df_unidades_mensal['Ano-Mês'].dt.to_timestamp() >= pd.to_datetime(data_inicio)) & 
-                (df_unidades_mensal['Ano-Mês'].dt.to_timestamp() <= pd.to_datetime(data_fim))
+                ((meses >= data_inicio) | pd.isna(data_inicio)) &
+                ((meses <= data_fim) | pd.isna(data_fim))
             ]
 
             # Convertendo a coluna 'Ano-Mês' para datetime para uso no gráfico
@@ -164,11 +164,18 @@ try:
             # Exibindo o gráfico de barras, agora com largura ajustada para ocupar as duas primeiras colunas
             st.plotly_chart(fig_acumulado, use_container_width=True)
 
-    # Salvando o conteúdo como CSV
     csv_file = 'base2025.csv'
-    df_departamento.to_csv(csv_file, index=False, encoding='utf-8')  # Salva sem o índice e com codificação UTF-8
-
-    st.success(f"Planilha salva como '{csv_file}'!")
+    col_csv, col_parquet, col_export, _ = st.columns([1, 1, 1, 3])
+    col_csv.download_button("⬇️ Baixar CSV", data=lambda: serialize(df_departamento, ".csv"),
+                            file_name=csv_file, mime=FORMATS[".csv"])
+    col_parquet.download_button("⬇️ Baixar Parquet", data=lambda: serialize(df_departamento, ".parquet"),
+                                file_name="base2025.parquet", mime=FORMATS[".parquet"])
+    # Exportando o conteúdo como CSV na pasta do app: só quando pedido (em segundo plano, só se o conteúdo mudou)
+    col_export.button("💾 Exportar CSV", key="exportar_base2025",
+                      on_click=export_queue.submit, args=(df_departamento, csv_file))
+    ultima_exportacao = export_queue.status(csv_file)
+    if ultima_exportacao:
+        st.caption(f"Última exportação de '{csv_file}': {ultima_exportacao[0]}")
 
 except FileNotFoundError:
     st.error("O arquivo Excel não foi encontrado. Por favor, verifique o caminho.")
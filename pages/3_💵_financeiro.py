@@ -3,14 +3,23 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px  # para gráficos com px.bar, px.pie, etc.
-import re
 import os
 from datetime import datetime
-from dateutil.relativedelta import relativedelta  # para cálculo de diferença em meses
 import sys
 import os
 from PIL import Image
 from utils import resource_path
+from data_store import load_sheet, sheet_memory_report
+from engenharia_store import dataset_key, load_engenharia
+from data_cache import shared_cache
+from maintenance import (
+    BUDGET_RATE, attach_enterprise_info, build_service_index, forecast_table, real_spend_by_enterprise,
+    resolve_enterprise_codes
+)
+from maintenance_plan import LEGACY_PICKLE, PlanConflictError, get_plan_store
+from warranty_periods import classify_warranty_period
+from timeseries import cumulative_series, monthly_columns, monthly_columns_series
+from profiling import SectionTimer, memory_table, state_frames
 
 
 # ================================
@@ -39,54 +48,308 @@ def converter_data(df, col_list):
             df[col] = pd.to_datetime(df[col], format='%d/%m/%Y', errors='coerce')
     return df
 
-def parse_month_year(col):
-    """
-    Identifica colunas como 'jan/25', 'fev/25', etc. (texto),
-    convertendo em datetime(2025,1,1), datetime(2025,2,1), etc.
-    Retorna None se não casar.
-    """
-    months_map = {
-        'jan': 1, 'fev': 2, 'mar': 3, 'abr': 4, 'mai': 5, 'jun': 6,
-        'jul': 7, 'ago': 8, 'set': 9, 'out': 10, 'nov': 11, 'dez': 12
-    }
-    match = re.match(r"^([a-zA-Z]{3})/(\d{2})$", col.strip().lower())
-    if match:
-        mon_str = match.group(1)
-        year_str = match.group(2)
-        mes = months_map.get(mon_str, None)
-        ano = 2000 + int(year_str)
-        if mes:
-            return datetime(ano, mes, 1)
-    return None
-
-def load_data():
+FRAMES = ("departamento", "engenharia", "grd_Listagem", "administrativo")
+DATE_COLUMNS = {
+    "departamento": ["Data Entrega de obra", "Data CVCO"],
+    "grd_Listagem": ["Data Documento"],
+    "administrativo": ["Previsão Data", "Admissão"],
+}
+
+def read_data(name):
     """
-    Carrega as abas “departamento”, “engenharia”, “grd_Listagem” e “administrativo”
-    do arquivo Excel "base2025.xlsx", aplicando os pré-processamentos:
+    Carrega a aba `name` (uma de FRAMES) do arquivo "base2025.xlsx", aplicando os pré-processamentos:
       - Remoção de espaços extras
       - Conversão de datas (DD/MM/YYYY) para datetime
       - Tratamento de valores em branco (nas abas administrativo e departamento)
       - Na aba grd_Listagem, ignora a primeira linha (células mescladas)
+      - Colunas datetime auxiliares (Entrega_dt, Previsao_dt, Data_Doc_dt)
+    As abas vêm dos snapshots Parquet (ver data_store.py), e não direto do Excel;
+    a engenharia já inclui as importações do portal (ver engenharia_store.py).
     """
-    xls = pd.ExcelFile("base2025.xlsx")
-    df_departamento = pd.read_excel(xls, sheet_name="departamento")
-    df_engenharia  = pd.read_excel(xls, sheet_name="engenharia")
-    df_grd         = pd.read_excel(xls, sheet_name="grd_Listagem", skiprows=1)  # ignora a primeira linha
-    df_admin       = pd.read_excel(xls, sheet_name="administrativo")
-    
-    df_departamento = clean_columns(df_departamento)
-    df_engenharia  = clean_columns(df_engenharia)
-    df_grd         = clean_columns(df_grd)
-    df_admin       = clean_columns(df_admin)
-    
-    df_departamento = converter_data(df_departamento, ["Data Entrega de obra", "Data CVCO"])
-    df_admin       = converter_data(df_admin, ["Previsão Data", "Admissão"])
-    df_grd         = converter_data(df_grd, ["Data Documento"])
-    
-    df_admin = df_admin.replace(r'^\s*$', np.nan, regex=True)
-    df_departamento = df_departamento.replace(r'^\s*$', np.nan, regex=True)
-    
-    return df_departamento, df_engenharia, df_grd, df_admin
+    df = load_engenharia() if name == "engenharia" else load_sheet(name)
+    df = clean_columns(df)
+    df = converter_data(df, DATE_COLUMNS.get(name, []))
+    if name in ("departamento", "administrativo"):
+        df = df.replace(r'^\s*$', np.nan, regex=True)
+
+    # Colunas datetime auxiliares
+    if name == "departamento":
+        df['Entrega_dt'] = pd.to_datetime(df['Data Entrega de obra'], format='%d/%m/%Y', errors='coerce')
+    elif name == "administrativo":
+        df['Previsao_dt'] = pd.to_datetime(df['Previsão Data'], errors='coerce')
+    elif name == "grd_Listagem":
+        df['Data_Doc_dt'] = pd.to_datetime(df['Data Documento'], errors='coerce')
+    return df
+
+def load_data(name):
+    """
+    Retorna uma cópia da aba `name` pré-processada por read_data(). Cada aba tem a
+    sua entrada no cache compartilhado entre sessões (só a aba pedida é copiada),
+    recarregada apenas quando o base2025.xlsx muda (ou quando há uma nova
+    importação do portal).
+    """
+    return shared_cache.get(f"financeiro:{name}", dataset_key(), lambda: read_data(name))
+
+# ================================
+# Cálculos por seção
+# ================================
+# Cada seção tem a sua função em cache, com a versão dos dados (snapshot) e os
+# filtros que ela usa como chave: mudar um filtro recalcula só a seção dele.
+
+@st.cache_data(show_spinner=False)
+def labor_series(snapshot):
+    """
+    Gasto de Mão de Obra por mês: Planejado (acumulado) x Real (mensal).
+    Retorna (final_df, aviso); o aviso é None quando há dados para o gráfico.
+    """
+    df_admin = load_data("administrativo")
+    empty = pd.DataFrame({'Month': pd.to_datetime([]), 'Planejado': [], 'Real': [], 'Month_str': []})
+
+    # Identifica colunas mensais de custo Real (ex.: 'jan/25', 'fev/25', etc.)
+    monthly_cols_info = monthly_columns(df_admin)
+
+    min_previsao = df_admin['Previsao_dt'].min()
+    max_previsao = df_admin['Previsao_dt'].max()
+    if pd.isna(min_previsao) or pd.isna(max_previsao):
+        return empty, "Não foi possível determinar datas para Planejado x Real (ou não há dados)."
+
+    min_allowed = datetime(2025, 1, 1)
+    start_date = max(min_previsao, min_allowed)
+    global_min = start_date
+    global_max = max_previsao
+    if monthly_cols_info:
+        min_real = monthly_cols_info[0][0]
+        max_real = monthly_cols_info[-1][0]
+        global_min = min(global_min, min_real)
+        global_max = max(global_max, max_real)
+    if pd.isna(global_min) or pd.isna(global_max) or global_min > global_max:
+        return empty, "Intervalo de datas inconsistente. Verifique os dados."
+
+    all_months = pd.date_range(start=global_min, end=global_max, freq='MS')
+
+    # Planejado (Acumulado) e Real (Mensal, não cumulativo)
+    planejado = cumulative_series(df_admin['Previsao_dt'], df_admin['Previsão Mão de Obra'], all_months)
+    real = monthly_columns_series(df_admin, grid=all_months)
+    final_df = pd.DataFrame({
+        'Month': all_months,
+        'Planejado': planejado.to_numpy(),
+        'Real': real.to_numpy()
+    })
+    final_df['Month_str'] = final_df['Month'].dt.strftime('%b/%y')
+    final_df = final_df[(final_df['Planejado'] != 0) | (final_df['Real'] != 0)]
+    if final_df.empty:
+        return final_df, "Não há dados para exibir no período calculado."
+    return final_df, None
+
+@st.cache_data(show_spinner=False)
+def labor_by_collaborator(snapshot):
+    """Salário Bruto por Colaborador e o percentual do total (None se faltarem as colunas)."""
+    df_admin = load_data("administrativo")
+    if "Colaborador" not in df_admin.columns or "Salário Bruto" not in df_admin.columns:
+        return None
+    df_colab = df_admin[df_admin["Salário Bruto"] > 0].groupby("Colaborador")["Salário Bruto"].sum().reset_index()
+    total_salario = df_colab["Salário Bruto"].sum()
+    df_colab["Percentual (%)"] = (df_colab["Salário Bruto"] / total_salario * 100).round(2)
+    return df_colab
+
+@st.cache_data(show_spinner=False)
+def future_hires(snapshot):
+    """Contratações previstas (coluna 'Admissão' vazia), com o mês da previsão em "Mes"."""
+    df_admin = load_data("administrativo")
+    df_future = df_admin[df_admin["Admissão"].isna()].copy()
+    df_future["Mes"] = df_future["Previsão Data"].dt.to_period("M").astype(str)
+    return df_future
+
+@st.cache_data(show_spinner=False)
+def maintenance_forecast(snapshot):
+    """Tabela de previsão de gastos (curva de garantia) e os anos previstos, a partir de 2025."""
+    df_departamento = load_data("departamento")
+
+    # Define Data_Entrega_Final (Data CVCO, se houver e for diferente da entrega) e Entrega_Year,
+    # direto sobre as colunas datetime64
+    cvco = df_departamento['Data CVCO']
+    entrega = df_departamento['Data Entrega de obra']
+    df_departamento['Data_Entrega_Final'] = cvco.where(cvco.notna() & (cvco != entrega), entrega)
+    df_departamento['Entrega_Year'] = df_departamento['Data_Entrega_Final'].dt.year
+
+    # Define forecast_years: considerar somente anos a partir de 2025
+    if not df_departamento['Entrega_Year'].dropna().empty:
+        max_year = int(df_departamento['Entrega_Year'].max())
+        forecast_years = [year for year in range(2025, max_year + 1)]
+    else:
+        forecast_years = []
+
+    # Monta a tabela de previsão (curva de garantia aplicada à matriz empreendimento x ano)
+    return forecast_table(df_departamento, forecast_years), forecast_years
+
+@st.cache_data(show_spinner=False)
+def real_spend_by_year(snapshot):
+    """Despesa real da grd_Listagem (sem ADM) por ano do documento, a partir de 2025."""
+    df_grd = load_data("grd_Listagem")
+    df_grd['Ano_Doc'] = df_grd['Data_Doc_dt'].dt.year
+    cond_exclude = df_grd["Cód. Alternativo Serviço"].astype(str).str.strip().str.upper() == "ADM"
+    df_grd_filtered = df_grd[~cond_exclude]
+    real_by_year = df_grd_filtered.groupby('Ano_Doc')['Valor Conv.'].sum().reset_index().rename(
+        columns={'Ano_Doc': 'Ano', 'Valor Conv.': 'Despesa Real'}
+    )
+    return real_by_year[real_by_year['Ano'] >= 2025]
+
+@st.cache_data(show_spinner=False)
+def enterprise_spend(snapshot, statuses):
+    """Despesa planejada x real por empreendimento, para os status selecionados."""
+    df_departamento, df_grd = load_data("departamento"), load_data("grd_Listagem")
+    df_filtered = df_departamento[df_departamento["Status"].isin(statuses)]
+    # Índice código de serviço -> empreendimento, montado uma vez por versão dos dados
+    service_index = shared_cache.get(
+        "indice_servicos", snapshot,
+        lambda: build_service_index(df_grd, df_departamento["Empreendimento"])
+    )
+    return pd.DataFrame({
+        'Empreendimento': df_filtered['Empreendimento'].to_numpy(),
+        'Despesa Planejada': (df_filtered['Custo de Construção'] * BUDGET_RATE).to_numpy(),
+        'Despesa Real': real_spend_by_enterprise(service_index, df_filtered['Empreendimento'])
+    })
+
+GRD_QUERY_COLS = ["Data Documento", "Documento", "Descrição Projeto", "Cód. Alternativo Serviço", "Descrição Grupo", "Descrição Item", "Valor Conv."]
+
+@st.cache_data(show_spinner=False)
+def grd_query(snapshot, search_term):
+    """grd_Listagem filtrada por Descrição Projeto, com as colunas renomeadas (None se faltarem colunas)."""
+    df_grd = load_data("grd_Listagem")
+    if not all(col in df_grd.columns for col in GRD_QUERY_COLS):
+        return None
+    df_grd_interativo = df_grd[GRD_QUERY_COLS].copy()
+    if search_term:
+        df_grd_interativo = df_grd_interativo[df_grd_interativo["Descrição Projeto"].str.contains(search_term, case=False, na=False)]
+    return df_grd_interativo.rename(columns={
+        "Documento": "NF",
+        "Descrição Projeto": "Projeto Mega",
+        "Cód. Alternativo Serviço": "Empreendimento",
+        "Valor Conv.": "Valor"
+    })
+
+@st.cache_data(show_spinner=False)
+def cost_metrics(snapshot):
+    """
+    Métricas de custo dos empreendimentos em "Fora de Garantia" / "Assistência Técnica":
+    totais (despesa, por unidade, por chamado) e as tabelas por empreendimento.
+    """
+    df_departamento, df_engenharia = load_data("departamento"), load_data("engenharia")
+    valid_status = ["Fora de Garantia", "Assistência Técnica"]
+    df_depto_filtered = df_departamento[df_departamento["Status"].isin(valid_status)]
+    if not df_depto_filtered.empty:
+        total_despesa = df_depto_filtered["Despesa Manutenção"].sum()
+        total_unidades = df_depto_filtered["N° Unidades"].sum()
+        custo_unidade_total = total_despesa / total_unidades if total_unidades != 0 else 0
+    else:
+        total_despesa = 0
+        custo_unidade_total = 0
+
+    valid_enterprises = df_depto_filtered["Empreendimento"].unique()
+    df_calls_filtered = df_engenharia[df_engenharia["Empreendimento"].isin(valid_enterprises)]
+    df_calls_filtered = df_calls_filtered.groupby("Empreendimento", observed=True)["N°"].count().reset_index().rename(columns={"N°": "Chamados"})
+    total_chamados = df_calls_filtered["Chamados"].sum()
+    custo_chamado_total = total_despesa / total_chamados if total_chamados != 0 else 0
+
+    df_depto_valid = df_depto_filtered.copy()
+    df_metrics_enterprise = None
+    if not df_depto_valid.empty:
+        df_depto_valid["Custo por Unidade"] = df_depto_valid.apply(lambda row: row["Despesa Manutenção"] / row["N° Unidades"] if row["N° Unidades"] != 0 else 0, axis=1)
+        df_metrics_enterprise = pd.merge(df_depto_valid, df_calls_filtered, on="Empreendimento", how="left")
+        df_metrics_enterprise["Chamados"] = df_metrics_enterprise["Chamados"].fillna(0)
+        df_metrics_enterprise["Custo por Chamado"] = df_metrics_enterprise.apply(lambda row: row["Despesa Manutenção"] / row["Chamados"] if row["Chamados"] > 0 else 0, axis=1)
+    return {
+        "total_despesa": total_despesa,
+        "custo_unidade_total": custo_unidade_total,
+        "custo_chamado_total": custo_chamado_total,
+        "df_depto_valid": df_depto_valid,
+        "df_metrics_enterprise": df_metrics_enterprise,
+    }
+
+@st.cache_data(show_spinner=False)
+def grd_with_periods(snapshot):
+    """
+    grd_Listagem com "Data_CVCO_Ref"/"Status_Depto" do empreendimento e o "Periodo Doc"
+    de cada documento, mais a lista de códigos sem empreendimento na aba departamento.
+    """
+    df_departamento, df_grd = load_data("departamento"), load_data("grd_Listagem")
+    # Código -> (Data CVCO, Status) resolvido uma vez por versão dos dados
+    enterprise_lookup, unresolved_codes = shared_cache.get(
+        "codigos_empreendimento", snapshot,
+        lambda: resolve_enterprise_codes(df_grd["Cód. Alternativo Serviço"], df_departamento)
+    )
+    df_grd = attach_enterprise_info(df_grd, enterprise_lookup)
+    df_grd["Periodo Doc"] = classify_warranty_period(df_grd["Data_CVCO_Ref"], df_grd["Data Documento"])
+    return df_grd, unresolved_codes
+
+@st.cache_data(show_spinner=False)
+def period_filter_options(snapshot):
+    """Códigos de serviço da grd_Listagem (opções do filtro) e os códigos sem empreendimento."""
+    df_grd, unresolved_codes = grd_with_periods(snapshot)
+    return df_grd["Cód. Alternativo Serviço"].unique().tolist(), unresolved_codes
+
+@st.cache_data(show_spinner=False)
+def period_spend(snapshot, periods, empreendimentos, statuses):
+    """Gasto por "Periodo Doc" (total e por empreendimento) para os filtros selecionados."""
+    df_grd_filtered_period = grd_with_periods(snapshot)[0]
+    if periods:
+        df_grd_filtered_period = df_grd_filtered_period[df_grd_filtered_period["Periodo Doc"].isin(periods)]
+    if empreendimentos:
+        df_grd_filtered_period = df_grd_filtered_period[df_grd_filtered_period["Cód. Alternativo Serviço"].isin(empreendimentos)]
+    if statuses:
+        df_grd_filtered_period = df_grd_filtered_period[df_grd_filtered_period["Status_Depto"].isin(statuses)]
+
+    df_period_sum = df_grd_filtered_period.groupby("Periodo Doc", observed=True)["Valor Conv."].sum().reset_index()
+    df_period_emp = df_grd_filtered_period.groupby(["Periodo Doc", "Cód. Alternativo Serviço"], observed=True)["Valor Conv."].sum().reset_index()
+    return df_period_sum, df_period_emp
+
+@st.cache_data(show_spinner=False)
+def break_even(snapshot, maint_df, statuses):
+    """
+    Ponto de equilíbrio por empreendimento a partir do plano de manutenção ajustado.
+    Retorna (resultado, aviso); resultado é None quando não há colunas de previsão.
+    """
+    forecast_cols = [col for col in maint_df.columns if col.startswith("Previsão (")]
+    if not forecast_cols:
+        return None, "Nenhuma coluna de previsão encontrada na Tabela Ajustada."
+    df_departamento = load_data("departamento")
+    maint_df = maint_df.copy()
+    maint_df["Soma Previsão"] = maint_df[forecast_cols].sum(axis=1)
+    resultado = maint_df[["Empreendimento", "Soma Previsão"]].copy()
+    extra_cols = ["Empreendimento", "Status", "Custo de Construção", "Despesa Manutenção"]
+    extra_data = df_departamento[extra_cols].copy()
+    resultado = resultado.merge(extra_data, on="Empreendimento", how="left")
+
+    resultado["(PE) Real por Obra"] = np.where(
+        resultado["Custo de Construção"] == 0,
+        0,
+        (resultado["Despesa Manutenção"] / resultado["Custo de Construção"]) * 100
+    )
+    resultado["(PE) Tendência"] = np.where(
+        resultado["Custo de Construção"] == 0,
+        0,
+        ((resultado["Soma Previsão"] + resultado["Despesa Manutenção"]) / resultado["Custo de Construção"]) * 100
+    )
+    resultado = resultado[resultado["Status"].isin(statuses)]
+    resultado = resultado.drop(columns=["Status", "Custo de Construção", "Despesa Manutenção"])
+    return resultado, None
+
+@st.cache_data(show_spinner=False)
+def sheet_memory(snapshot):
+    """Memória de cada aba com e sem os tipos de schema.py (painel de debug)."""
+    return sheet_memory_report()
+
+@st.cache_data(show_spinner=False)
+def sheet_copy_memory(snapshot):
+    """Memória de uma cópia de cada aba pré-processada por read_data() (painel de debug)."""
+    frames = {name: load_data(name) for name in FRAMES}
+    return memory_table(frames)
+
+SECTION_CACHES = [
+    labor_series, labor_by_collaborator, future_hires, maintenance_forecast, real_spend_by_year,
+    enterprise_spend, grd_query, cost_metrics, grd_with_periods, period_filter_options, period_spend, break_even,
+    sheet_memory, sheet_copy_memory,
+]
 
 # ================================
 # Função Principal
@@ -127,44 +390,14 @@ def main():
     st.markdown('<h1 style="color: orange;">Administrativo e Financeiro Pós Obras 💵</h1>', unsafe_allow_html=True)
     st.markdown('Acompanhamento do Quadro Administrativo e Financeiro do Setor de Pós Obra')
 
-    # Carrega os dados
-    df_departamento, df_engenharia, df_grd, df_admin = load_data()
-    
-    # Colunas datetime auxiliares
-    df_departamento['Entrega_dt'] = pd.to_datetime(df_departamento['Data Entrega de obra'], format='%d/%m/%Y', errors='coerce')
-    df_admin['Previsao_dt'] = pd.to_datetime(df_admin['Previsão Data'], errors='coerce')
-    df_grd['Data_Doc_dt'] = pd.to_datetime(df_grd['Data Documento'], errors='coerce')
-    
-    # ================================
-    # Cálculo da coluna "Periodo" para filtro (aba departamento)
-    # ================================
-    today = pd.Timestamp.today().to_pydatetime()
-    
-    def classify_period(cvco_date):
-        if pd.isnull(cvco_date):
-            return "Sem Data CVCO"
-        cvco_dt = pd.to_datetime(cvco_date).to_pydatetime()
-        delta = relativedelta(today, cvco_dt)
-        diff_months = delta.years * 12 + delta.months
-        if diff_months < 0:
-            return "Futuro"
-        if diff_months <= 3:
-            return "Despesas Pós Entrega"
-        elif diff_months <= 12:
-            return "Despesas 1° Ano"
-        elif diff_months <= 24:
-            return "Despesas 2° Ano"
-        elif diff_months <= 36:
-            return "Despesas 3° Ano"
-        elif diff_months <= 48:
-            return "Despesas 4° Ano"
-        elif diff_months <= 60:
-            return "Despesas 5° Ano"
-        else:
-            return "Despesas após 5 Anos"
-    
-    if "Data CVCO" in df_departamento.columns:
-        df_departamento["Periodo"] = df_departamento["Data CVCO"].apply(classify_period)
+    # Os dados vêm do cache compartilhado e cada seção tem o seu cache (ver "Cálculos por seção");
+    # o botão força a releitura de tudo
+    timer = SectionTimer()
+    if st.sidebar.button("🔄 Recarregar dados"):
+        shared_cache.invalidate()
+        for section_cache in SECTION_CACHES:
+            section_cache.clear()
+    snapshot = dataset_key()
     
     # Cria as 3 tabs
     tab_mao_obra, tab_manutencao, tab_equilibrio = st.tabs(["Mão de Obra", "Manutenção", "Ponto de Equilíbrio"])
@@ -174,92 +407,37 @@ def main():
     # ============================================================
     with tab_mao_obra:
         st.header("👷 Gasto de Mão de Obra (Planejado x Real)")
-                
-        # Identifica colunas mensais de custo Real (ex.: 'jan/25', 'fev/25', etc.)
-        monthly_cols_info = []
-        for col in df_admin.columns:
-            if isinstance(col, str):
-                dt_parsed = parse_month_year(col)
-                if dt_parsed:
-                    monthly_cols_info.append((dt_parsed, col))
-        monthly_cols_info.sort(key=lambda x: x[0])
-        
-        min_previsao = df_admin['Previsao_dt'].min()
-        max_previsao = df_admin['Previsao_dt'].max()
         
-        if pd.isna(min_previsao) or pd.isna(max_previsao):
-            st.warning("Não foi possível determinar datas para Planejado x Real (ou não há dados).")
+        final_df, aviso = labor_series(snapshot)
+        if aviso:
+            st.warning(aviso)
         else:
-            min_allowed = datetime(2025, 1, 1)
-            start_date = max(min_previsao, min_allowed)
-            global_min = start_date
-            global_max = max_previsao
-            if monthly_cols_info:
-                min_real = monthly_cols_info[0][0]
-                max_real = monthly_cols_info[-1][0]
-                global_min = min(global_min, min_real)
-                global_max = max(global_max, max_real)
-            
-            if pd.isna(global_min) or pd.isna(global_max) or global_min > global_max:
-                st.warning("Intervalo de datas inconsistente. Verifique os dados.")
-            else:
-                all_months = pd.date_range(start=global_min, end=global_max, freq='MS')
-                
-                # Planejado (Acumulado)
-                planejado_vals = []
-                for m in all_months:
-                    val = df_admin.loc[df_admin['Previsao_dt'] <= m, 'Previsão Mão de Obra'].fillna(0).sum()
-                    planejado_vals.append(val)
-                df_planejado = pd.DataFrame({'Month': all_months, 'Planejado': planejado_vals})
-                
-                # Real (Mensal, não cumulativo)
-                real_df_list = []
-                for dt_col, col_name in monthly_cols_info:
-                    col_sum = df_admin[col_name].fillna(0).sum()
-                    real_df_list.append({'Month': dt_col, 'Real': col_sum})
-                if len(real_df_list) == 0:
-                    df_real = pd.DataFrame({'Month': all_months, 'Real': [0]*len(all_months)}).set_index('Month')
-                else:
-                    df_real = pd.DataFrame(real_df_list).set_index('Month')
-                    df_real = df_real.reindex(all_months, fill_value=0)
-                
-                df_real.reset_index(inplace=True)
-                df_real.rename(columns={'index': 'Month'}, inplace=True)
-                
-                final_df = pd.merge(df_planejado, df_real, on='Month', how='outer').fillna(0)
-                final_df.sort_values(by='Month', inplace=True)
-                final_df['Month_str'] = final_df['Month'].dt.strftime('%b/%y')
-                
-                final_df = final_df[(final_df['Planejado'] != 0) | (final_df['Real'] != 0)]
-                
-                if final_df.empty:
-                    st.warning("Não há dados para exibir no período calculado.")
-                else:
-                    fig1 = go.Figure(data=[
-                        go.Bar(
-                            name='Planejado (Acumulado)',
-                            x=final_df['Month_str'],
-                            y=final_df['Planejado'],
-                            marker_color='lightgrey',
-                            marker_line_color='darkgrey',
-                            marker_line_width=1
-                        ),
-                        go.Bar(
-                            name='Real (Mensal)',
-                            x=final_df['Month_str'],
-                            y=final_df['Real'],
-                            marker_color='lightsalmon',
-                            marker_line_color='darkorange',
-                            marker_line_width=1
-                        )
-                    ])
-                    fig1.update_layout(
-                        barmode='group',
-                        xaxis_title='Período (Mês/Ano)',
-                        yaxis_title='Gasto (R$)',
-                        legend=dict(x=0, y=1.1, orientation='h')
-                    )
-                    st.plotly_chart(fig1, use_container_width=True, key="fig1")
+            fig1 = go.Figure(data=[
+                go.Bar(
+                    name='Planejado (Acumulado)',
+                    x=final_df['Month_str'],
+                    y=final_df['Planejado'],
+                    marker_color='lightgrey',
+                    marker_line_color='darkgrey',
+                    marker_line_width=1
+                ),
+                go.Bar(
+                    name='Real (Mensal)',
+                    x=final_df['Month_str'],
+                    y=final_df['Real'],
+                    marker_color='lightsalmon',
+                    marker_line_color='darkorange',
+                    marker_line_width=1
+                )
+            ])
+            fig1.update_layout(
+                barmode='group',
+                xaxis_title='Período (Mês/Ano)',
+                yaxis_title='Gasto (R$)',
+                legend=dict(x=0, y=1.1, orientation='h')
+            )
+            st.plotly_chart(fig1, use_container_width=True, key="fig1")
+        timer.lap("Mão de Obra: Planejado x Real")
         
         st.markdown('-----')
         
@@ -294,14 +472,13 @@ def main():
             st.metric(label="Delta (Real - Planejado)", value=f"R${delta:,.2f}")
         with c4:
             st.metric(label="% Atingimento", value=f"{perc:,.2f}%")
+        timer.lap("Mão de Obra: por ano")
         
         st.markdown('-----')
         # Distribuição de Custo de Mão de Obra por Colaborador
         st.header("💰 Distribuição de Custo de Mão de Obra por Colaborador")
-        if "Colaborador" in df_admin.columns and "Salário Bruto" in df_admin.columns:
-            df_colab = df_admin[df_admin["Salário Bruto"] > 0].groupby("Colaborador")["Salário Bruto"].sum().reset_index()
-            total_salario = df_colab["Salário Bruto"].sum()
-            df_colab["Percentual (%)"] = (df_colab["Salário Bruto"] / total_salario * 100).round(2)
+        df_colab = labor_by_collaborator(snapshot)
+        if df_colab is not None:
             st.subheader("Tabela de Custos")
             st.dataframe(df_colab.style.format({"Salário Bruto": "R${:,.2f}", "Percentual (%)": "{:.2f}%"}))
             st.subheader("Gráfico de Barras")
@@ -317,17 +494,16 @@ def main():
             st.plotly_chart(fig_pie, use_container_width=True)
         else:
             st.warning("As colunas 'Colaborador' e/ou 'Salário Bruto' não foram encontradas na aba administrativo.")
+        timer.lap("Mão de Obra: por colaborador")
         
         # -------------------------------
         # Calendário de Contratações Futuras – Alternativas de Visualização
         st.header("📅 Calendário de Contratações Futuras")
-        # Filtra os registros onde "Admissão" está vazia (previsões de contratação)
-        df_future = df_admin[df_admin["Admissão"].isna()].copy()
+        # Registros onde "Admissão" está vazia (previsões de contratação), com a coluna de mês
+        df_future = future_hires(snapshot)
         if df_future.empty:
             st.info("Não há contratações futuras previstas (coluna 'Admissão' vazia).")
         else:
-            # Garante que 'Previsão Data' esteja em datetime e cria coluna de mês
-            df_future["Mes"] = df_future["Previsão Data"].dt.to_period("M").astype(str)
             vis_option = st.selectbox("Escolha o tipo de visualização para contratações futuras", 
                                         options=["Timeline", "Bar Chart", "Heatmap"])
             if vis_option == "Timeline":
@@ -400,6 +576,7 @@ def main():
                 )
                 fig_heat.update_xaxes(side="top")
                 st.plotly_chart(fig_heat, use_container_width=True)
+        timer.lap("Mão de Obra: contratações futuras")
     
     # ============================================================
     # TAB MANUTENÇÃO
@@ -407,84 +584,71 @@ def main():
     with tab_manutencao:
         st.header("🗓️ Calendário de Previsão de Gastos de Manutenção")
         
-        # Define Data_Entrega_Final e Entrega_Year
-        df_departamento['Data_Entrega_Final'] = df_departamento.apply(
-            lambda row: row['Data CVCO'] if pd.notnull(row.get('Data CVCO')) and row.get('Data CVCO') != row.get('Data Entrega de obra')
-                        else row.get('Data Entrega de obra'), axis=1)
-        df_departamento['Entrega_Year'] = pd.to_datetime(
-            df_departamento['Data_Entrega_Final'], format='%d/%m/%Y', errors='coerce'
-        ).dt.year
-        
-        # Calcula Orçamento (1,5%)
-        df_departamento['Orçamento (1,5%)'] = df_departamento['Custo de Construção'] * 0.015
-        
-        # Define forecast_years: considerar somente anos a partir de 2025
-        if not df_departamento['Entrega_Year'].dropna().empty:
-            max_year = int(df_departamento['Entrega_Year'].max())
-            forecast_years = [year for year in range(2025, max_year + 1)]
-        else:
-            forecast_years = []
-        
-        # Monta a tabela de previsão
-        previsao_table = df_departamento[['Empreendimento', 'Custo de Construção', 'Entrega_Year']].copy()
-        for year in forecast_years:
-            diff = year - previsao_table['Entrega_Year']
-            conditions = [
-                (diff < 0),  
-                (diff <= 1),
-                (diff == 2),
-                (diff == 3),
-                (diff == 4),
-                (diff == 5),
-                (diff > 5)
-            ]
-            choices = [0, 0.5, 0.2, 0.1, 0.1, 0.1, 0.0]
-            fator = np.select(conditions, choices, default=0)
-            col_name = f'Previsão ({year})'
-            previsao_table[col_name] = df_departamento['Custo de Construção'] * 0.015 * fator
+        previsao_table, forecast_years = maintenance_forecast(snapshot)
         
         format_dict = {col: "R${:,.2f}" for col in previsao_table.columns if col not in ["Empreendimento", "Entrega_Year"]}
         with st.expander("Tabela de Previsão (Regra Aplicada)", expanded=True):
             st.dataframe(previsao_table.fillna(0).style.format(format_dict), use_container_width=True)
         
-        PERSISTENCE_FILE = "maintenance_data.pkl"
         with st.expander("Tabela Editável (Ajuste Manual)", expanded=True):
-            if os.path.exists(PERSISTENCE_FILE):
-                default_data = pd.read_pickle(PERSISTENCE_FILE)
-            else:
-                default_data = previsao_table.fillna(0).copy()
-            if "maintenance_data" not in st.session_state:
-                st.session_state["maintenance_data"] = default_data.copy()
+            plan_store = get_plan_store()
+
+            def initial_plan():
+                # Primeira execução: importa o antigo maintenance_data.pkl (ou parte da regra aplicada)
+                legacy_plan = resource_path(LEGACY_PICKLE)
+                return pd.read_pickle(legacy_plan) if os.path.exists(legacy_plan) else previsao_table.fillna(0)
+
+            plan_store.seed(initial_plan)
+
+            def reload_plan():
+                plan, row_versions, _ = plan_store.load()
+                previous = st.session_state.get("maintenance_plan", {}).get("editor", 0)
+                # "base" alimenta o editor; "saved" é o último estado gravado pela sessão
+                st.session_state["maintenance_plan"] = {
+                    "base": plan, "saved": plan, "versions": row_versions, "editor": previous + 1
+                }
+
+            if "maintenance_plan" not in st.session_state:
+                reload_plan()
             if st.button("Reset Ajustes", key="reset_button"):
-                st.session_state["maintenance_data"] = previsao_table.fillna(0).copy()
-                st.session_state["maintenance_data"].to_pickle(PERSISTENCE_FILE)
+                plan_store.replace(previsao_table.fillna(0))
+                reload_plan()
+            plan_state = st.session_state["maintenance_plan"]
             if hasattr(st, 'data_editor'):
                 edited_df = st.data_editor(
-                    st.session_state["maintenance_data"],
-                    key="maintenance_editor",
+                    plan_state["base"],
+                    key=f"maintenance_editor_{plan_state['editor']}",
                     use_container_width=True
                 )
+                # Grava só as células alteradas desde o último salvamento desta sessão
+                try:
+                    new_versions = plan_store.save_rows(plan_state["saved"], edited_df, plan_state["versions"])
+                except PlanConflictError as e:
+                    st.warning(f"O plano foi alterado por outro usuário (linhas {e.rows}); "
+                               "suas alterações nessas linhas não foram salvas.")
+                    if st.button("Recarregar plano", key="reload_plan_button"):
+                        reload_plan()
+                        st.rerun()
+                else:
+                    if new_versions:
+                        plan_state["versions"].update(new_versions)
+                        plan_state["saved"] = edited_df.copy()
                 st.session_state["maintenance_data"] = edited_df.copy()
-                st.session_state["maintenance_data"].to_pickle(PERSISTENCE_FILE)
             else:
                 st.warning("Atualize seu Streamlit para a versão que suporta edição interativa.")
+                st.session_state["maintenance_data"] = plan_state["base"].copy()
                 st.dataframe(st.session_state["maintenance_data"].style.format(format_dict), use_container_width=True)
             st.write("Tabela Ajustada conforme Planejamento Estratégico:")
             st.dataframe(st.session_state["maintenance_data"].style.format(format_dict), use_container_width=True)
+        timer.lap("Manutenção: previsão e plano editável")
         
         data_source = st.session_state.get("maintenance_data", previsao_table.fillna(0))
         forecast_summary = {year: data_source[f'Previsão ({year})'].sum() for year in forecast_years} if forecast_years else {}
         forecast_df = pd.DataFrame(list(forecast_summary.items()), columns=['Ano', 'Despesa Planejada'])
         
-        df_grd['Ano_Doc'] = df_grd['Data_Doc_dt'].dt.year
-        cond_exclude = df_grd["Cód. Alternativo Serviço"].astype(str).str.strip().str.upper() == "ADM"
-        df_grd_filtered = df_grd[~cond_exclude]
-        real_by_year = df_grd_filtered.groupby('Ano_Doc')['Valor Conv.'].sum().reset_index().rename(
-            columns={'Ano_Doc': 'Ano', 'Valor Conv.': 'Despesa Real'}
-        )
+        real_by_year = real_spend_by_year(snapshot)
         st.markdown('-----')
         st.header('🛒 Despesas em Manutenção (Anual)')
-        real_by_year = real_by_year[real_by_year['Ano'] >= 2025]
         despesa_df = pd.merge(forecast_df, real_by_year, on='Ano', how='outer').fillna(0)
         
         fig3 = go.Figure(data=[
@@ -517,6 +681,7 @@ def main():
             uniformtext_mode='hide'
         )
         st.plotly_chart(fig3, use_container_width=True, key="fig3")
+        timer.lap("Manutenção: anual")
         
         st.markdown('-----')
         st.header('🏘️ Despesas em Manutenção (por Empreendimento)')
@@ -525,25 +690,7 @@ def main():
         if not selected_status:
             selected_status = status_options
         
-        df_filtered = df_departamento[df_departamento["Status"].isin(selected_status)]
-        maintenance_list = []
-        for idx, row in df_filtered.iterrows():
-            empreendimento = row['Empreendimento']
-            planejado_val = row['Custo de Construção'] * 0.015
-            real_val = 0
-            for serv in df_grd["Cód. Alternativo Serviço"].dropna().unique():
-                serv_clean = serv.strip().upper()
-                if serv_clean == "ADM":
-                    continue
-                if serv_clean in empreendimento.upper():
-                    mask = df_grd["Cód. Alternativo Serviço"].astype(str).apply(lambda x: serv_clean in x.strip().upper())
-                    real_val += df_grd.loc[mask, "Valor Conv."].sum()
-            maintenance_list.append({
-                'Empreendimento': empreendimento,
-                'Despesa Planejada': planejado_val,
-                'Despesa Real': real_val
-            })
-        maintenance_df = pd.DataFrame(maintenance_list)
+        maintenance_df = enterprise_spend(snapshot, tuple(selected_status))
         
         fig4 = go.Figure(data=[
             go.Bar(
@@ -577,29 +724,22 @@ def main():
             yaxis=dict(dtick=100000, tickformat='R$,.2f')
         )
         st.plotly_chart(fig4, use_container_width=True, key="fig4")
+        timer.lap("Manutenção: por empreendimento")
         
         st.markdown('-----')
         st.header("🔎 Consulta Interativa - grd_Listagem")
-        cols_needed = ["Data Documento", "Documento", "Descrição Projeto", "Cód. Alternativo Serviço", "Descrição Grupo", "Descrição Item", "Valor Conv."]
-        if all(col in df_grd.columns for col in cols_needed):
-            df_grd_interativo = df_grd[cols_needed].copy()
+        df_grd_interativo = None
+        if grd_query(snapshot, "") is not None:
             search_term = st.text_input("Buscar em Descrição Projeto")
-            if search_term:
-                df_grd_interativo = df_grd_interativo[df_grd_interativo["Descrição Projeto"].str.contains(search_term, case=False, na=False)]
-            df_grd_interativo.rename(columns={
-                "Documento": "NF",
-                "Descrição Projeto": "Projeto Mega",
-                "Cód. Alternativo Serviço": "Empreendimento",
-                "Valor Conv.": "Valor"
-            }, inplace=True)
+            df_grd_interativo = grd_query(snapshot, search_term)
             st.dataframe(df_grd_interativo.style.format({"Valor": "R${:,.2f}"}), use_container_width=True)
         else:
             st.warning("Algumas colunas necessárias não foram encontradas na aba grd_Listagem.")
         
         st.markdown('-----')
         st.header("📊 Gráfico de Valor Conv. por Grupo")
-        if not df_grd_interativo.empty:
-            df_grouped = df_grd_interativo.groupby("Descrição Grupo")["Valor"].sum().reset_index()
+        if df_grd_interativo is not None and not df_grd_interativo.empty:
+            df_grouped = df_grd_interativo.groupby("Descrição Grupo", observed=True)["Valor"].sum().reset_index()
             fig_group = px.bar(
                 df_grouped,
                 x="Descrição Grupo",
@@ -613,37 +753,27 @@ def main():
             st.plotly_chart(fig_group, use_container_width=True)
         else:
             st.info("Sem dados para exibir o gráfico.")
+        timer.lap("Manutenção: consulta grd_Listagem")
         
         st.markdown('-----')
         st.header("💸 Métricas de Custo")
-        valid_status = ["Fora de Garantia", "Assistência Técnica"]
-        df_depto_filtered = df_departamento[df_departamento["Status"].isin(valid_status)]
-        if not df_depto_filtered.empty:
-            total_despesa = df_depto_filtered["Despesa Manutenção"].sum()
-            total_unidades = df_depto_filtered["N° Unidades"].sum()
-            custo_unidade_total = total_despesa / total_unidades if total_unidades != 0 else 0
-        else:
-            total_despesa = 0
-            custo_unidade_total = 0
+        metricas_custo = cost_metrics(snapshot)
+        total_despesa = metricas_custo["total_despesa"]
+        custo_unidade_total = metricas_custo["custo_unidade_total"]
+        custo_chamado_total = metricas_custo["custo_chamado_total"]
         
         col_metric1, col_metric2, col_metric3 = st.columns(3)
         with col_metric1:
             st.metric("Custo por Unidade (Total)", f"R${custo_unidade_total:,.2f}")
         with col_metric2:
             st.metric("Despesa Manutenção (Total)", f"R${total_despesa:,.2f}")
-        valid_enterprises = df_depto_filtered["Empreendimento"].unique()
-        df_calls_filtered = df_engenharia[df_engenharia["Empreendimento"].isin(valid_enterprises)]
-        df_calls_filtered = df_calls_filtered.groupby("Empreendimento")["N°"].count().reset_index().rename(columns={"N°": "Chamados"})
-        total_chamados = df_calls_filtered["Chamados"].sum()
-        custo_chamado_total = total_despesa / total_chamados if total_chamados != 0 else 0
         with col_metric3:
             st.metric("Custo por N° de Chamados (Total)", f"R${custo_chamado_total:,.2f}")
         
         st.markdown('-----')
         st.header("📊 Gráficos por Empreendimento")
-        df_depto_valid = df_depto_filtered.copy()
+        df_depto_valid = metricas_custo["df_depto_valid"]
         if not df_depto_valid.empty:
-            df_depto_valid["Custo por Unidade"] = df_depto_valid.apply(lambda row: row["Despesa Manutenção"] / row["N° Unidades"] if row["N° Unidades"] != 0 else 0, axis=1)
             fig_unidade = px.bar(
                 df_depto_valid,
                 x="Empreendimento",
@@ -657,11 +787,7 @@ def main():
             st.info("Dados insuficientes para calcular Custo por Unidade.")
         
         if not df_depto_valid.empty:
-            df_calls_filtered = df_engenharia[df_engenharia["Empreendimento"].isin(valid_enterprises)]
-            df_calls_filtered = df_calls_filtered.groupby("Empreendimento")["N°"].count().reset_index().rename(columns={"N°": "Chamados"})
-            df_metrics_enterprise = pd.merge(df_depto_valid, df_calls_filtered, on="Empreendimento", how="left")
-            df_metrics_enterprise["Chamados"].fillna(0, inplace=True)
-            df_metrics_enterprise["Custo por Chamado"] = df_metrics_enterprise.apply(lambda row: row["Despesa Manutenção"] / row["Chamados"] if row["Chamados"] > 0 else 0, axis=1)
+            df_metrics_enterprise = metricas_custo["df_metrics_enterprise"]
             fig_chamado = px.bar(
                 df_metrics_enterprise,
                 x="Empreendimento",
@@ -673,59 +799,22 @@ def main():
             st.plotly_chart(fig_chamado, use_container_width=True)
         else:
             st.info("Dados insuficientes para calcular Custo por N° de Chamados.")
+        timer.lap("Manutenção: métricas de custo")
         
         st.markdown('-----')
         st.header("⏱️ Filtro de Período e Gasto")
-        def get_enterprise_info(enterprise):
-            matches = df_departamento[df_departamento["Empreendimento"].str.upper().str.contains(enterprise.upper())]
-            if not matches.empty:
-                row = matches.iloc[0]
-                return row["Data CVCO"], row["Status"]
-            else:
-                return None, None
-
-        df_grd["Data_CVCO_Ref"], df_grd["Status_Depto"] = zip(*df_grd["Cód. Alternativo Serviço"].apply(get_enterprise_info))
-        
-        def classify_period_doc(cvco_date, doc_date):
-            if pd.isnull(cvco_date) or pd.isnull(doc_date):
-                return "Sem Data"
-            cvco_dt = pd.to_datetime(cvco_date).to_pydatetime()
-            doc_dt = pd.to_datetime(doc_date).to_pydatetime()
-            delta = relativedelta(doc_dt, cvco_dt)
-            diff_months = delta.years * 12 + delta.months
-            if diff_months < 0:
-                return "Antes de CVCO"
-            if diff_months <= 3:
-                return "Despesas Pós Entrega"
-            elif diff_months <= 12:
-                return "Despesas 1° Ano"
-            elif diff_months <= 24:
-                return "Despesas 2° Ano"
-            elif diff_months <= 36:
-                return "Despesas 3° Ano"
-            elif diff_months <= 48:
-                return "Despesas 4° Ano"
-            elif diff_months <= 60:
-                return "Despesas 5° Ano"
-            else:
-                return "Despesas após 5 Anos"
-
-        df_grd["Periodo Doc"] = df_grd.apply(lambda row: classify_period_doc(row["Data_CVCO_Ref"], row["Data Documento"]), axis=1)
+        codigos_servico, unresolved_codes = period_filter_options(snapshot)
+        if unresolved_codes:
+            st.caption("Códigos sem empreendimento correspondente na aba departamento: " + ", ".join(unresolved_codes))
         
         period_options = ["Despesas Pós Entrega", "Despesas 1° Ano", "Despesas 2° Ano", "Despesas 3° Ano", "Despesas 4° Ano", "Despesas 5° Ano", "Despesas após 5 Anos", "Antes de CVCO", "Sem Data"]
         selected_periods = st.multiselect("Selecione os Períodos", options=period_options, default=[])
-        selected_empreendimento_period = st.multiselect("Empreendimento (Filtro)", options=df_grd["Cód. Alternativo Serviço"].unique(), default=[])
+        selected_empreendimento_period = st.multiselect("Empreendimento (Filtro)", options=codigos_servico, default=[])
         selected_status_period = st.multiselect("Status (Filtro)", options=["Fora de Garantia", "Assistência Técnica"], default=[])
         
-        df_grd_filtered_period = df_grd.copy()
-        if selected_periods:
-            df_grd_filtered_period = df_grd_filtered_period[df_grd_filtered_period["Periodo Doc"].isin(selected_periods)]
-        if selected_empreendimento_period:
-            df_grd_filtered_period = df_grd_filtered_period[df_grd_filtered_period["Cód. Alternativo Serviço"].isin(selected_empreendimento_period)]
-        if selected_status_period:
-            df_grd_filtered_period = df_grd_filtered_period[df_grd_filtered_period["Status_Depto"].isin(selected_status_period)]
-        
-        df_period_sum = df_grd_filtered_period.groupby("Periodo Doc")["Valor Conv."].sum().reset_index()
+        df_period_sum, df_period_emp = period_spend(
+            snapshot, tuple(selected_periods), tuple(selected_empreendimento_period), tuple(selected_status_period)
+        )
         fig_period_doc = px.bar(
             df_period_sum,
             x="Periodo Doc",
@@ -739,7 +828,6 @@ def main():
             fig_period_doc.update_traces(texttemplate='%{text:.2f}', textposition='outside', marker_line_color='black', marker_line_width=1)
         st.plotly_chart(fig_period_doc, use_container_width=True)
         
-        df_period_emp = df_grd_filtered_period.groupby(["Periodo Doc", "Cód. Alternativo Serviço"])["Valor Conv."].sum().reset_index()
         fig_period_emp = px.bar(
             df_period_emp,
             x="Periodo Doc",
@@ -753,6 +841,7 @@ def main():
             fig_period_emp.update_layout(yaxis_range=[0, max_val_emp*1.2], barmode="group")
             fig_period_emp.update_traces(texttemplate='%{text:.2f}', textposition='outside', marker_line_color='black', marker_line_width=1)
         st.plotly_chart(fig_period_emp, use_container_width=True)
+        timer.lap("Manutenção: gasto por período")
     
     # ============================================================
     # TAB PONTO DE EQUILÍBRIO
@@ -777,29 +866,10 @@ def main():
         if maint_df.empty:
             st.warning("Não há dados de manutenção disponíveis para calcular a soma da previsão.")
         else:
-            forecast_cols = [col for col in maint_df.columns if col.startswith("Previsão (")]
-            if not forecast_cols:
-                st.warning("Nenhuma coluna de previsão encontrada na Tabela Ajustada.")
+            resultado, aviso = break_even(snapshot, maint_df, tuple(status_filter))
+            if aviso:
+                st.warning(aviso)
             else:
-                maint_df["Soma Previsão"] = maint_df[forecast_cols].sum(axis=1)
-                resultado = maint_df[["Empreendimento", "Soma Previsão"]].copy()
-                extra_cols = ["Empreendimento", "Status", "Custo de Construção", "Despesa Manutenção"]
-                extra_data = df_departamento[extra_cols].copy()
-                resultado = resultado.merge(extra_data, on="Empreendimento", how="left")
-                
-                resultado["(PE) Real por Obra"] = np.where(
-                    resultado["Custo de Construção"] == 0,
-                    0,
-                    (resultado["Despesa Manutenção"] / resultado["Custo de Construção"]) * 100
-                )
-                resultado["(PE) Tendência"] = np.where(
-                    resultado["Custo de Construção"] == 0,
-                    0,
-                    ((resultado["Soma Previsão"] + resultado["Despesa Manutenção"]) / resultado["Custo de Construção"]) * 100
-                )
-                resultado = resultado[resultado["Status"].isin(status_filter)]
-                resultado = resultado.drop(columns=["Status", "Custo de Construção", "Despesa Manutenção"])
-                
                 format_dict = {
                     "Soma Previsão": "{:,.2f}",
                     "(PE) Real por Obra": "{:,.2f}%",
@@ -843,66 +913,18 @@ def main():
                     height=600
                 )
                 st.plotly_chart(fig, use_container_width=True)
+        timer.lap("Ponto de Equilíbrio")
 
-# ================================
-# Funções auxiliares e load_data()
-# ================================
-def clean_columns(df):
-    """Remove espaços extras dos nomes das colunas, convertendo-os para string."""
-    df.columns = df.columns.astype(str).str.strip().str.replace(r'\s+', ' ', regex=True)
-    return df
-
-def converter_data(df, col_list):
-    """Converte as colunas de data para o formato DD/MM/YYYY (datetime)."""
-    for col in col_list:
-        if col in df.columns:
-            df[col] = pd.to_datetime(df[col], format='%d/%m/%Y', errors='coerce')
-    return df
-
-def parse_month_year(col):
-    """
-    Identifica colunas como 'jan/25', 'fev/25', etc. (texto),
-    convertendo em datetime(2025,1,1), datetime(2025,2,1), etc.
-    Retorna None se não casar.
-    """
-    months_map = {
-        'jan': 1, 'fev': 2, 'mar': 3, 'abr': 4, 'mai': 5, 'jun': 6,
-        'jul': 7, 'ago': 8, 'set': 9, 'out': 10, 'nov': 11, 'dez': 12
-    }
-    match = re.match(r"^([a-zA-Z]{3})/(\d{2})$", col.strip().lower())
-    if match:
-        mon_str = match.group(1)
-        year_str = match.group(2)
-        mes = months_map.get(mon_str, None)
-        ano = 2000 + int(year_str)
-        if mes:
-            return datetime(ano, mes, 1)
-    return None
-
-def load_data():
-    """
-    Carrega as abas “departamento”, “engenharia”, “grd_Listagem” e “administrativo”
-    do arquivo Excel "base2025.xlsx", aplicando os pré-processamentos.
-    """
-    xls = pd.ExcelFile("base2025.xlsx")
-    df_departamento = pd.read_excel(xls, sheet_name="departamento")
-    df_engenharia  = pd.read_excel(xls, sheet_name="engenharia")
-    df_grd         = pd.read_excel(xls, sheet_name="grd_Listagem", skiprows=1)
-    df_admin       = pd.read_excel(xls, sheet_name="administrativo")
-    
-    df_departamento = clean_columns(df_departamento)
-    df_engenharia  = clean_columns(df_engenharia)
-    df_grd         = clean_columns(df_grd)
-    df_admin       = clean_columns(df_admin)
-    
-    df_departamento = converter_data(df_departamento, ["Data Entrega de obra", "Data CVCO"])
-    df_admin       = converter_data(df_admin, ["Previsão Data", "Admissão"])
-    df_grd         = converter_data(df_grd, ["Data Documento"])
-    
-    df_admin = df_admin.replace(r'^\s*$', np.nan, regex=True)
-    df_departamento = df_departamento.replace(r'^\s*$', np.nan, regex=True)
-    
-    return df_departamento, df_engenharia, df_grd, df_admin
+    # Tempo de cada seção nesta execução (seções em cache aparecem com poucos ms) e memória dos dados
+    with st.expander("🐞 Debug: tempo por seção e memória", expanded=False):
+        st.dataframe(timer.table(), hide_index=True, use_container_width=True)
+        st.markdown("**Memória por aba** (uma cópia, com e sem os tipos declarados em schema.py)")
+        st.dataframe(sheet_memory(snapshot), hide_index=True, use_container_width=True,
+                     column_config={"Redução": st.column_config.NumberColumn(format="percent")})
+        st.markdown("**Memória de uma cópia das abas** (como load_data() entrega a cada seção)")
+        st.dataframe(sheet_copy_memory(snapshot), hide_index=True, use_container_width=True)
+        st.markdown("**Memória desta sessão** (DataFrames guardados em st.session_state, medidos agora)")
+        st.dataframe(memory_table(state_frames(st.session_state.to_dict())), hide_index=True, use_container_width=True)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
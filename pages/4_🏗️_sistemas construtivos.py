@@ -2,58 +2,24 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
-import random
-from datetime import date
 import sys
 import os
 from PIL import Image
 from utils import resource_path
+from data_store import load_sheet
+from engenharia_store import dataset_key, load_engenharia, refresh_open_days
+from palette import bar_colors  # cor fixa por item (hash do nome): a mesma a cada execução
+from pareto import abc_colors, classify_abc
+from reliability import reliability_metrics
+from warranty_parser import split_grupo_sistema
 
 # =========================================
-# Funções de Cores e Classificação ABC
+# Cores das Curvas ABC (em cache)
 # =========================================
-def random_color():
-    """Retorna uma cor aleatória no formato hexadecimal."""
-    return "#{:06x}".format(random.randint(0, 0xFFFFFF))
-
-def darken_color(hex_color, factor=0.7):
-    """Retorna uma versão mais escura da cor recebida."""
-    hex_color = hex_color.lstrip('#')
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
-    r = int(r * factor)
-    g = int(g * factor)
-    b = int(b * factor)
-    return "#{:02x}{:02x}{:02x}".format(r, g, b)
-
-def classify_abc(series):
-    """
-    Classifica os itens de uma série em categorias ABC com base na contribuição acumulada.
-    Categoria A: até 70%
-    Categoria B: de 70% até 90%
-    Categoria C: acima de 90%
-    """
-    s_sorted = series.sort_values(ascending=False)
-    total = s_sorted.sum()
-    cum_sum = s_sorted.cumsum()
-    categories = {}
-    for idx, value in s_sorted.items():
-        perc = cum_sum[idx] / total
-        if perc <= 0.7:
-            categories[idx] = "A"
-        elif perc <= 0.9:
-            categories[idx] = "B"
-        else:
-            categories[idx] = "C"
-    return categories
-
-# Cores para as categorias ABC
-abc_colors = {
-    "A": {"fill": "#ff9999", "line": "#cc0000"},  # vermelho claro / escuro
-    "B": {"fill": "#ffff99", "line": "#cccc00"},  # amarelo claro / escuro
-    "C": {"fill": "#99ff99", "line": "#009900"}   # verde claro / escuro
-}
+@st.cache_data(show_spinner=False)
+def abc_bar_colors(counts):
+    """Cores (preenchimento, borda) das barras de uma curva ABC, ver pareto.py."""
+    return abc_colors(classify_abc(counts))
 
 # =========================================
 # Configuração da Página e Exibição de Logos
@@ -81,15 +47,18 @@ st.markdown("Página em Construção. Volte mais tarde! 🚧")
 # Carregamento dos Dados (Planilhas)
 # =========================================
 @st.cache_data
-def load_data():
-    xls = pd.ExcelFile("base2025.xlsx")
-    df_eng = pd.read_excel(xls, sheet_name="engenharia")
-    df_dep = pd.read_excel(xls, sheet_name="departamento")
+def load_data(snapshot):
+    # "snapshot" (hash do base2025.xlsx + versão das importações) só serve para invalidar o cache
+    df_eng, df_dep = load_engenharia(), load_sheet("departamento")
     for df_ in [df_eng, df_dep]:
         df_.columns = df_.columns.str.strip()
+    # "Garantia Solicitada" -> "Grupo Construtivo" / "Sistema Construtivo" (categóricas), uma vez por versão
+    # (substitui a separação "Sistema Construtivo" / "Tipo de Falha" da Assistência Técnica)
+    df_eng = df_eng.drop(columns=["Tipo de Falha"])
+    df_eng[["Grupo Construtivo", "Sistema Construtivo"]] = split_grupo_sistema(df_eng["Garantia Solicitada"])
     return df_eng, df_dep
 
-df_eng, df_dep = load_data()
+df_eng, df_dep = load_data(dataset_key())
 
 # =========================================
 # Conversão de Datas (engenharia)
@@ -138,34 +107,11 @@ df_eng["Data CVCO"] = pd.to_datetime(df_eng["Data CVCO"], dayfirst=True, errors=
 # =========================================
 # Cálculos Iniciais (Tempo de Encerramento e Dias em Aberto)
 # =========================================
-df_eng["Tempo de Encerramento"] = (df_eng["Encerramento"] - df_eng["Data de Abertura"]).dt.days
-hoje = pd.to_datetime(date.today())
-df_eng["Dias em Aberto"] = np.where(
-    df_eng["Encerramento"].isna(),
-    (hoje - df_eng["Data de Abertura"]).dt.days,
-    df_eng["Tempo de Encerramento"]
-)
+# Já calculados no conjunto de engenharia (engenharia_store.py); "Dias em Aberto"
+# das solicitações abertas muda a cada dia
+df_eng = refresh_open_days(df_eng)
 total_solicitacoes = df_eng["N°"].count()
 
-# =========================================
-# Criação de Colunas Derivadas: Separação da "Garantia Solicitada"
-# =========================================
-def split_garantia(value):
-    """
-    Separa a coluna "Garantia Solicitada" em:
-      - Grupo Construtivo: tudo que estiver antes do "-" (ou a frase inteira, se não houver "-")
-      - Sistema Construtivo: tudo que estiver depois do "-", se existir.
-    """
-    if pd.isna(value):
-        return pd.Series([np.nan, np.nan])
-    if "-" in value:
-        parts = value.split("-", 1)
-        return pd.Series([parts[0].strip(), parts[1].strip()])
-    else:
-        return pd.Series([value.strip(), ""])
-
-df_eng[["Grupo Construtivo", "Sistema Construtivo"]] = df_eng["Garantia Solicitada"].apply(split_garantia)
-
 # =========================================
 # Interface de Filtros
 # =========================================
@@ -224,30 +170,20 @@ st.dataframe(df_filtered)
 # =========================================
 # Cálculo das Métricas (MTBF, MTTR e Disponibilidade)
 # =========================================
-def compute_metrics(group):
-    """
-    Calcula as métricas para o grupo (ou sistema) considerando:
-      - T_disponível: diferença entre a última "Data de Abertura" e a menor "Data CVCO", convertida para horas.
-      - T_parada: soma, em horas, de (Encerramento - Data de Abertura) para cada ocorrência.
-      - MTBF: (T_disponível - T_parada) / número de ocorrências.
-      - MTTR: T_parada / número de ocorrências.
-      - Disponibilidade: MTBF/(MTBF+MTTR)*100%.
-    """
-    available_hours = (group["Data de Abertura"].max() - group["Data CVCO"].min()).total_seconds() / 3600
-    downtime_hours = group.apply(lambda row: (row["Encerramento"] - row["Data de Abertura"]).total_seconds() / 3600, axis=1).sum()
-    occurrences = group.shape[0]
-    mtbf = (available_hours - downtime_hours) / occurrences
-    mttr = downtime_hours / occurrences
-    dispon = (mtbf / (mtbf + mttr)) * 100 if (mtbf + mttr) > 0 else np.nan
-    return pd.Series({"MTBF": mtbf, "MTTR": mttr, "Disponibilidade": dispon})
-
-# Recalcular métricas para cada grupo e sistema
-metrics_group = df_filtered.groupby("Grupo Construtivo").apply(compute_metrics)
-metrics_system = df_filtered.groupby("Sistema Construtivo").apply(compute_metrics)
+# Para cada grupo (ou sistema), ver reliability.reliability_metrics:
+#   - T_disponível: última "Data de Abertura" menos a menor "Data CVCO", em horas.
+#   - T_parada: soma, em horas, de (Encerramento - Data de Abertura).
+#   - MTBF: (T_disponível - T_parada) / ocorrências; MTTR: T_parada / ocorrências.
+#   - Disponibilidade: MTBF/(MTBF+MTTR)*100%.
+metrics_group = reliability_metrics(df_filtered, "Grupo Construtivo")
+metrics_system = reliability_metrics(df_filtered, "Sistema Construtivo")
 
 # Para curvas ABC, contagens de ocorrências
+# (colunas categóricas: descarta as categorias sem ocorrência após os filtros)
 contagem_group = df_filtered["Grupo Construtivo"].value_counts()
+contagem_group = contagem_group[contagem_group > 0]
 contagem_system = df_filtered["Sistema Construtivo"].value_counts()
+contagem_system = contagem_system[contagem_system > 0]
 
 def add_border(fig):
     for trace in fig.data:
@@ -274,9 +210,7 @@ fig1 = px.bar(
     labels={"x": "Grupo Construtivo", "y": "MTBF (horas)"},
     title="MTBF por Grupo Construtivo"
 )
-n_bars = len(mtbf_group_plot.index)
-colors = [random_color() for _ in range(n_bars)]
-line_colors = [darken_color(c) for c in colors]
+colors, line_colors = bar_colors(mtbf_group_plot.index)
 fig1.update_traces(marker_color=colors, marker_line_color=line_colors, marker_line_width=1)
 st.plotly_chart(fig1, use_container_width=True)
 
@@ -294,9 +228,7 @@ fig2 = px.bar(
     labels={"x": "Sistema Construtivo", "y": "MTBF (horas)"},
     title="MTBF por Sistema Construtivo"
 )
-n_bars = len(mtbf_system_plot.index)
-colors = [random_color() for _ in range(n_bars)]
-line_colors = [darken_color(c) for c in colors]
+colors, line_colors = bar_colors(mtbf_system_plot.index)
 fig2.update_traces(marker_color=colors, marker_line_color=line_colors, marker_line_width=1)
 st.plotly_chart(fig2, use_container_width=True)
 
@@ -317,9 +249,7 @@ fig3 = px.bar(
     title="MTTR por Grupo Construtivo"
 )
 fig3.update_traces(text=disp_group_plot.values, textposition='outside')
-n_bars = len(mttr_group_plot.index)
-colors = [random_color() for _ in range(n_bars)]
-line_colors = [darken_color(c) for c in colors]
+colors, line_colors = bar_colors(mttr_group_plot.index)
 fig3.update_traces(marker_color=colors, marker_line_color=line_colors, marker_line_width=1)
 st.plotly_chart(fig3, use_container_width=True)
 
@@ -340,9 +270,7 @@ fig4 = px.bar(
     title="MTTR por Sistema Construtivo"
 )
 fig4.update_traces(text=disp_system_plot.values, textposition='outside')
-n_bars = len(mttr_system_plot.index)
-colors = [random_color() for _ in range(n_bars)]
-line_colors = [darken_color(c) for c in colors]
+colors, line_colors = bar_colors(mttr_system_plot.index)
 fig4.update_traces(marker_color=colors, marker_line_color=line_colors, marker_line_width=1)
 st.plotly_chart(fig4, use_container_width=True)
 
@@ -360,9 +288,7 @@ fig5 = px.bar(
     labels={"x": "Grupo Construtivo", "y": "Contagem de Incidências"},
     title="Curva ABC por Grupo Construtivo"
 )
-abc_class_group = classify_abc(contagem_group_plot)
-colors = [abc_colors[abc_class_group[idx]]["fill"] for idx in contagem_group_plot.index]
-line_colors = [abc_colors[abc_class_group[idx]]["line"] for idx in contagem_group_plot.index]
+colors, line_colors = abc_bar_colors(contagem_group_plot)
 fig5.update_traces(marker_color=colors, marker_line_color=line_colors, marker_line_width=1)
 st.plotly_chart(fig5, use_container_width=True)
 
@@ -380,8 +306,6 @@ fig6 = px.bar(
     labels={"x": "Sistema Construtivo", "y": "Contagem de Incidências"},
     title="Curva ABC por Sistema Construtivo"
 )
-abc_class_system = classify_abc(contagem_system_plot)
-colors = [abc_colors[abc_class_system[idx]]["fill"] for idx in contagem_system_plot.index]
-line_colors = [abc_colors[abc_class_system[idx]]["line"] for idx in contagem_system_plot.index]
+colors, line_colors = abc_bar_colors(contagem_system_plot)
 fig6.update_traces(marker_color=colors, marker_line_color=line_colors, marker_line_width=1)
 st.plotly_chart(fig6, use_container_width=True)
@@ -8,6 +8,15 @@ import sys
 import os
 from PIL import Image
 from utils import resource_path
+from data_store import load_sheet
+from engenharia_store import dataset_key, load_engenharia, read_changelog, refresh_open_days
+from data_cache import shared_cache
+from filter_index import FilterIndex
+from olap_cube import build_cube, covers, mean_closing_time, rollup, slice_cube
+from rainfall import LAGS, correlation_table, lag_label, process_calendario_de_chuvas
+from palette import color_pair, discrete_map
+from aging import DEFAULT_EDGES, assign_buckets, bucket_counts, bucket_labels, load_edges
+from reliability import failure_metrics
 
 # =============================================================================
 # Função para normalizar os nomes das colunas (remove espaços extras)
@@ -19,48 +28,21 @@ def normalize_columns(df):
     df.columns = df.columns.str.strip().str.replace(r'\s+', ' ', regex=True)
     return df
 
-# =============================================================================
-# Função para processar a aba calendariodechuvas (formato wide para long)
-# =============================================================================
-def process_calendario_de_chuvas(df):
-    """
-    Transforma o DataFrame de calendariodechuvas, que está em formato wide,
-    para um formato long com as colunas: "ANO", "Mes", "Chuva" e "AnoMes".
-    """
-    month_columns = ["JAN", "FEV", "MAR", "ABR", "MAI", "JUN", "JUL", "AGO", "SET", "OUT", "NOV", "DEZ"]
-    df_long = pd.melt(df, id_vars=["ANO"], value_vars=month_columns, var_name="Mes", value_name="Chuva")
-    
-    # Substituir vírgula por ponto e traços por NaN e converter para numérico
-    df_long["Chuva"] = (
-        df_long["Chuva"]
-        .astype(str)
-        .str.replace(",", ".")
-        .replace("-", np.nan)
-    )
-    df_long["Chuva"] = pd.to_numeric(df_long["Chuva"], errors="coerce")
-    
-    # Mapeia as abreviações dos meses para números com 2 dígitos
-    month_map = {
-        "JAN": "01", "FEV": "02", "MAR": "03", "ABR": "04", "MAI": "05", "JUN": "06",
-        "JUL": "07", "AGO": "08", "SET": "09", "OUT": "10", "NOV": "11", "DEZ": "12"
-    }
-    df_long["AnoMes"] = df_long["ANO"].astype(str) + "-" + df_long["Mes"].map(month_map)
-    
-    return df_long
-
 # =============================================================================
 # Função de carregamento e pré-processamento dos dados
 # =============================================================================
 @st.cache_data
-def load_and_preprocess_data(filepath):
-    # Aba "engenharia"
-    df_eng = pd.read_excel(filepath, sheet_name="engenharia")
+def load_and_preprocess_data(snapshot):
+    # "snapshot" (hash do base2025.xlsx + versão das importações) só serve para invalidar o cache
+    # Aba "engenharia" com as importações do portal; já traz "Tempo de Encerramento",
+    # "Dias em Aberto", "Sistema Construtivo" e "Tipo de Falha" (ver engenharia_store.py)
+    df_eng = load_engenharia()
     df_eng = normalize_columns(df_eng)
     df_eng["Data de Abertura"] = pd.to_datetime(df_eng["Data de Abertura"], format="%d/%m/%Y", errors="coerce")
     df_eng["Encerramento"] = pd.to_datetime(df_eng["Encerramento"], format="%d/%m/%Y", errors="coerce")
     
     # Aba "departamento"
-    df_dep = pd.read_excel(filepath, sheet_name="departamento")
+    df_dep = load_sheet("departamento")
     df_dep = normalize_columns(df_dep)
     if "Data CVCO" in df_dep.columns:
         df_dep["Data CVCO"] = pd.to_datetime(df_dep["Data CVCO"], format="%d/%m/%Y", errors="coerce")
@@ -68,7 +50,7 @@ def load_and_preprocess_data(filepath):
         df_dep["Data Entrega de Obra"] = pd.to_datetime(df_dep["Data Entrega de Obra"], format="%d/%m/%Y", errors="coerce")
     
     # Aba "calendariodechuvas"
-    df_chuva = pd.read_excel(filepath, sheet_name="calendariodechuvas")
+    df_chuva = load_sheet("calendariodechuvas")
     df_chuva = normalize_columns(df_chuva)
     # Se estiver no formato wide (com a coluna "ANO"), processa para formato long:
     if "ANO" in df_chuva.columns:
@@ -104,36 +86,14 @@ st.markdown('Acompanhamento de Solicitações de Assistência Técnica')
 # =============================================================================
 # Carregamento dos dados
 # =============================================================================
-file_path = "base2025.xlsx"
-df_eng, df_dep, df_chuva = load_and_preprocess_data(file_path)
-
-# =============================================================================
-# Tratamento da coluna “Garantia Solicitada”
-# =============================================================================
-def tratamento_garantia(garantia):
-    if pd.isna(garantia):
-        return pd.Series([np.nan, np.nan])
-    # Substitui " - " por ": "
-    garantia = garantia.replace(" - ", ": ")
-    if ":" in garantia:
-        sistema, tipo = garantia.split(":", 1)
-        return pd.Series([sistema.strip(), tipo.strip()])
-    else:
-        return pd.Series([garantia.strip(), np.nan])
-
-# Cria as novas colunas "Sistema Construtivo" e "Tipo de Falha"
-df_eng[["Sistema Construtivo", "Tipo de Falha"]] = df_eng["Garantia Solicitada"].apply(tratamento_garantia)
+data_key = dataset_key()
+df_eng, df_dep, df_chuva = load_and_preprocess_data(data_key)
 
 # =============================================================================
 # Cálculos de Tempo e Métricas (antes dos filtros)
 # =============================================================================
-df_eng["Tempo de Encerramento"] = (df_eng["Encerramento"] - df_eng["Data de Abertura"]).dt.days
-hoje = pd.to_datetime(date.today())
-df_eng["Dias em Aberto"] = np.where(
-    df_eng["Encerramento"].isna(),
-    (hoje - df_eng["Data de Abertura"]).dt.days,
-    df_eng["Tempo de Encerramento"]
-)
+# "Dias em Aberto" das solicitações ainda abertas muda a cada dia
+df_eng = refresh_open_days(df_eng)
 total_solicitacoes = df_eng["N°"].count()
 df_concluidas = df_eng[df_eng["Encerramento"].notna()]
 if not df_concluidas.empty:
@@ -177,25 +137,35 @@ df_eng = df_eng.merge(
     suffixes=("", "_dep")
 )
 
-def compute_mtbf(group):
-    if group["Data CVCO"].isnull().all():
-        return np.nan
-    max_data_abertura = group["Data de Abertura"].max()
-    min_data_cvco = group["Data CVCO"].min()
-    op_hours = (max_data_abertura - min_data_cvco).total_seconds() / 3600
-    return op_hours / group.shape[0]
+# MTBF (horas de operação / ocorrências) e MTTR (horas até o encerramento / encerradas)
+metrics_garantia = failure_metrics(df_eng, "Garantia Solicitada")
+mtbf_series = metrics_garantia["MTBF"]
+mttr_series = metrics_garantia["MTTR"]
+disponibilidade_series = metrics_garantia["Disponibilidade"]
 
-mtbf_series = df_eng.groupby("Garantia Solicitada").apply(compute_mtbf)
+# =============================================================================
+# Índice de filtros (montado uma vez por versão da planilha)
+# =============================================================================
+FILTER_COLUMNS = ["N°", "Responsável", "FCR", "Empreendimento", "Unidade", "Bloco", "Status",
+                  "Garantia Solicitada", "Sistema Construtivo", "Tipo de Falha"]
 
-def compute_mttr(group):
-    closed = group[group["Encerramento"].notna()]
-    if closed.empty:
-        return np.nan
-    total_hours = closed["Tempo de Encerramento"].sum() * 24
-    return total_hours / closed.shape[0]
+def build_filter_index():
+    columns = {
+        "Ano": df_eng["Data de Abertura"].dt.year.astype("Int64"),
+        "Mês": df_eng["Data de Abertura"].dt.month.astype("Int64"),
+    }
+    for col in FILTER_COLUMNS:
+        if col in df_eng.columns:
+            columns[col] = df_eng[col]
+    return FilterIndex(columns)
+
+filter_index = shared_cache.get("filtros_assistencia", data_key, build_filter_index)
+
+# Cubo de contagens e tempos de encerramento (olap_cube.py), também uma vez por versão
+cube = shared_cache.get("cubo_assistencia", data_key, lambda: build_cube(df_eng))
 
-mttr_series = df_eng.groupby("Garantia Solicitada").apply(compute_mttr)
-disponibilidade_series = (mtbf_series / (mtbf_series + mttr_series)) * 100
+def filter_options(col):
+    return filter_index.options(col) if col in df_eng.columns else []
 
 # =============================================================================
 # Painel Administrativo – Filtros (integrados ao painel, default vazio)
@@ -203,7 +173,7 @@ disponibilidade_series = (mtbf_series / (mtbf_series + mttr_series)) * 100
 with st.expander("Filtros", expanded=True):
     # Primeira linha: 5 colunas
     col_ano, col_mes, col_chamado, col_resp, col_fcr = st.columns(5)
-    anos = sorted(df_eng["Data de Abertura"].dropna().dt.year.unique().tolist())
+    anos = sorted(filter_index.options("Ano"))
     selected_anos = col_ano.multiselect("Filtro por Ano", options=anos, default=[])
     
     month_options = list(range(1, 13))
@@ -213,81 +183,82 @@ with st.expander("Filtros", expanded=True):
     selected_meses = col_mes.multiselect("Filtro por Mês", options=month_options, default=[], 
                                          format_func=lambda x: month_names[x])
     
-    chamados = df_eng["N°"].dropna().unique().tolist()
+    chamados = filter_options("N°")
     selected_chamados = col_chamado.multiselect("N° do Chamado", options=chamados, default=[])
     
-    responsaveis = df_eng["Responsável"].dropna().unique().tolist()
+    responsaveis = filter_options("Responsável")
     selected_responsaveis = col_resp.multiselect("Responsável", options=responsaveis, default=[])
     
     if "FCR" in df_eng.columns:
-        fcr_values = df_eng["FCR"].dropna().unique().tolist()
+        fcr_values = filter_options("FCR")
         selected_fcr = col_fcr.multiselect("FCR", options=fcr_values, default=[])
     else:
         selected_fcr = []
     
     # Segunda linha: 4 colunas
     col_empre, col_unidade, col_bloco, col_status = st.columns(4)
-    empreendimentos = df_eng["Empreendimento"].dropna().unique().tolist()
+    empreendimentos = filter_options("Empreendimento")
     selected_empre = col_empre.multiselect("Empreendimento", options=empreendimentos, default=[])
     
-    unidades = df_eng["Unidade"].dropna().unique().tolist()
+    unidades = filter_options("Unidade")
     selected_unidade = col_unidade.multiselect("Unidade", options=unidades, default=[])
     
-    blocos = df_eng["Bloco"].dropna().unique().tolist()
+    blocos = filter_options("Bloco")
     selected_bloco = col_bloco.multiselect("Bloco", options=blocos, default=[])
     
-    statuses = df_eng["Status"].dropna().unique().tolist()
+    statuses = filter_options("Status")
     selected_status = col_status.multiselect("Status", options=statuses, default=[])
     
     # Terceira linha: 3 colunas
     col_garantia, col_sistema, col_tipo = st.columns(3)
-    garantias = df_eng["Garantia Solicitada"].dropna().unique().tolist()
+    garantias = filter_options("Garantia Solicitada")
     selected_garantia = col_garantia.multiselect("Garantia Solicitada", options=garantias, default=[])
     
-    sistemas = df_eng["Sistema Construtivo"].dropna().unique().tolist()
+    sistemas = filter_options("Sistema Construtivo")
     selected_sistema = col_sistema.multiselect("Sistema Construtivo", options=sistemas, default=[])
     
-    tipos = df_eng["Tipo de Falha"].dropna().unique().tolist()
+    tipos = filter_options("Tipo de Falha")
     selected_tipo = col_tipo.multiselect("Tipo de Falha", options=tipos, default=[])
 
 # =============================================================================
-# Aplicação dos filtros (usando .isin para cada coluna)
+# Aplicação dos filtros (uma única máscara combinada a partir do índice)
 # =============================================================================
-df_filtered = df_eng.copy()
-if selected_anos:
-    df_filtered = df_filtered[df_filtered["Data de Abertura"].dt.year.isin(selected_anos)]
-if selected_meses:
-    df_filtered = df_filtered[df_filtered["Data de Abertura"].dt.month.isin(selected_meses)]
-if selected_chamados:
-    df_filtered = df_filtered[df_filtered["N°"].astype(str).isin([str(x) for x in selected_chamados])]
-if selected_responsaveis:
-    df_filtered = df_filtered[df_filtered["Responsável"].isin(selected_responsaveis)]
-if selected_fcr:
-    df_filtered = df_filtered[df_filtered["FCR"].isin(selected_fcr)]
-if selected_empre:
-    df_filtered = df_filtered[df_filtered["Empreendimento"].isin(selected_empre)]
-if selected_unidade:
-    df_filtered = df_filtered[df_filtered["Unidade"].isin(selected_unidade)]
-if selected_bloco:
-    df_filtered = df_filtered[df_filtered["Bloco"].isin(selected_bloco)]
-if selected_status:
-    df_filtered = df_filtered[df_filtered["Status"].isin(selected_status)]
-if selected_garantia:
-    df_filtered = df_filtered[df_filtered["Garantia Solicitada"].isin(selected_garantia)]
-if selected_sistema:
-    df_filtered = df_filtered[df_filtered["Sistema Construtivo"].isin(selected_sistema)]
-if selected_tipo:
-    df_filtered = df_filtered[df_filtered["Tipo de Falha"].isin(selected_tipo)]
+selections = {
+    "Ano": selected_anos,
+    "Mês": selected_meses,
+    "N°": selected_chamados,
+    "Responsável": selected_responsaveis,
+    "FCR": selected_fcr,
+    "Empreendimento": selected_empre,
+    "Unidade": selected_unidade,
+    "Bloco": selected_bloco,
+    "Status": selected_status,
+    "Garantia Solicitada": selected_garantia,
+    "Sistema Construtivo": selected_sistema,
+    "Tipo de Falha": selected_tipo,
+}
+df_filtered = filter_index.apply(df_eng, selections)
+
+# Os gráficos saem do cubo fatiado; filtros fora das dimensões do cubo (N°, Unidade,
+# Bloco, Garantia Solicitada) exigem montar o cubo a partir das linhas filtradas
+if covers(cube, selections):
+    cube_filtered = slice_cube(cube, selections)
+else:
+    cube_filtered = build_cube(df_filtered)
 
 # =============================================================================
 # Re-cálculo das Métricas (baseado nos dados filtrados)
 # =============================================================================
-metrica_1 = df_filtered[(df_filtered["Dias em Aberto"] >= 0) & (df_filtered["Dias em Aberto"] <= 15)].shape[0]
-metrica_2 = df_filtered[(df_filtered["Dias em Aberto"] > 15) & (df_filtered["Dias em Aberto"] <= 30)].shape[0]
-metrica_3 = df_filtered[(df_filtered["Dias em Aberto"] > 30) & (df_filtered["Dias em Aberto"] <= 45)].shape[0]
-metrica_4 = df_filtered[(df_filtered["Dias em Aberto"] > 45) & (df_filtered["Dias em Aberto"] <= 60)].shape[0]
-metrica_5 = df_filtered[df_filtered["Dias em Aberto"] > 60].shape[0]
-metrica_6 = df_filtered["N°"].count()
+# Faixa de aging de cada solicitação, calculada uma vez (bordas em aging_buckets.json)
+try:
+    aging_edges = load_edges()
+except ValueError as e:
+    st.warning(f"{e}. Usando as faixas padrão.")
+    aging_edges = DEFAULT_EDGES
+aging_labels = bucket_labels(aging_edges)
+aging_codes = assign_buckets(df_filtered["Dias em Aberto"], aging_edges)
+aging_counts = bucket_counts(aging_codes, aging_edges)
+total_filtrado = df_filtered["N°"].count()
 
 st.markdown("---")
 
@@ -296,36 +267,20 @@ st.markdown("---")
 # =============================================================================
 st.markdown('### Acompanhamento das Solicitações')
 with st.container():
-    col_m1, col_m2, col_m3, col_m4, col_m5, col_m6 = st.columns(6)
-    col_m1.metric("Solicitações entre 0-15 dias", metrica_1)
-    col_m2.metric("Solicitações entre 15-30 dias", metrica_2)
-    col_m3.metric("Solicitações entre 30-45 dias", metrica_3)
-    col_m4.metric("Solicitações entre 45-60 dias", metrica_4)
-    col_m5.metric("Solicitações >60 dias", metrica_5)
-    col_m6.metric("Total Solicitações", metrica_6)
+    metric_cols = st.columns(len(aging_labels) + 1)
+    for col, label, count in zip(metric_cols, aging_labels, aging_counts):
+        titulo = f"Solicitações {label} dias" if label.startswith(">") else f"Solicitações entre {label} dias"
+        col.metric(titulo, int(count))
+    metric_cols[-1].metric("Total Solicitações", total_filtrado)
 
 with st.container():
-    col_cb1, col_cb2, col_cb3, col_cb4, col_cb5, col_cb6 = st.columns(6)
-    show_m1 = col_cb1.checkbox("Exibir Solicitações 0-15")
-    show_m2 = col_cb2.checkbox("Exibir Solicitações 15-30")
-    show_m3 = col_cb3.checkbox("Exibir Solicitações 30-45")
-    show_m4 = col_cb4.checkbox("Exibir Solicitações 45-60")
-    show_m5 = col_cb5.checkbox("Exibir Solicitações >60")
-
-if show_m1:
-    st.write("Dados Métrica 1 (0-15 dias)",
-             df_filtered[(df_filtered["Dias em Aberto"] >= 0) & (df_filtered["Dias em Aberto"] <= 15)])
-if show_m2:
-    st.write("Dados Métrica 2 (15-30 dias)",
-             df_filtered[(df_filtered["Dias em Aberto"] > 15) & (df_filtered["Dias em Aberto"] <= 30)])
-if show_m3:
-    st.write("Dados Métrica 3 (30-45 dias)",
-             df_filtered[(df_filtered["Dias em Aberto"] > 30) & (df_filtered["Dias em Aberto"] <= 45)])
-if show_m4:
-    st.write("Dados Métrica 4 (45-60 dias)",
-             df_filtered[(df_filtered["Dias em Aberto"] > 45) & (df_filtered["Dias em Aberto"] <= 60)])
-if show_m5:
-    st.write("Dados Métrica 5 (>60 dias)", df_filtered[df_filtered["Dias em Aberto"] > 60])
+    checkbox_cols = st.columns(len(aging_labels) + 1)
+    show_buckets = [col.checkbox(f"Exibir Solicitações {label}")
+                    for col, label in zip(checkbox_cols, aging_labels)]
+
+for k, (label, show) in enumerate(zip(aging_labels, show_buckets)):
+    if show:
+        st.write(f"Dados Métrica {k + 1} ({label} dias)", df_filtered[aging_codes == k])
 
 st.markdown("---")
 
@@ -335,8 +290,7 @@ st.markdown("---")
 
 # 1 – Gráfico de Solicitações ao Longo do Tempo (Anos e Meses)
 st.markdown('### 🏗️Solicitações de Assistência Técnica')
-df_filtered["AnoMes"] = df_filtered["Data de Abertura"].dt.to_period("M").astype(str)
-df_chart2 = df_filtered.groupby("AnoMes").size().reset_index(name="Count")
+df_chart2 = rollup(cube_filtered, "AnoMes").reset_index(name="Count")
 fig1 = px.bar(
     df_chart2,
     x="AnoMes",
@@ -364,11 +318,8 @@ st.plotly_chart(fig1, use_container_width=True)
 st.markdown("---")
 
 # 2 - Gráfico de Pirâmide (por ano)
-# Extraímos o ano da "Data Abertura" e agrupamos para obter a contagem
-df_pyramid = df_filtered.copy()
-df_pyramid["Ano"] = df_pyramid["Data de Abertura"].dt.year
-df_pyramid_grouped = df_pyramid.groupby("Ano").size().reset_index(name="Count")
-df_pyramid_grouped = df_pyramid_grouped.sort_values("Ano", ascending=True)
+# Contagem por ano da "Data de Abertura" (já em ordem crescente)
+df_pyramid_grouped = rollup(cube_filtered, "Ano").reset_index(name="Count")
 
 # Criação do gráfico de barras horizontais (pirâmide)
 fig2 = px.bar(
@@ -406,8 +357,7 @@ fig2.update_layout(
 )
 
 # 3 - Gráfico de Solicitações por Empreendimento
-# Agrupamos por "Empreendimento"
-df_empreendimento = df_filtered.groupby("Empreendimento").size().reset_index(name="Count")
+df_empreendimento = rollup(cube_filtered, "Empreendimento").reset_index(name="Count")
 fig3 = px.bar(
     df_empreendimento,
     x="Empreendimento",
@@ -432,8 +382,8 @@ fig3.update_layout(
 
 # 4 - Gráfico de Rosca para Status (Improcedente vs Concluída)
 # Filtramos os status de interesse e agrupamos
-df_status_pie = df_filtered[df_filtered["Status"].isin(["Improcedente", "Concluída"])] \
-    .groupby("Status").size().reset_index(name="Count")
+df_status_pie = rollup(cube_filtered[cube_filtered["Status"].isin(["Improcedente", "Concluída"])], "Status") \
+    .reset_index(name="Count")
 
 # Definindo as cores para cada status
 pie_colors = []
@@ -470,8 +420,8 @@ fig4.update_layout(
 # 5 - Gráfico de Barras Horizontais para Status
 # Consideramos os status de interesse
 statuses_interested = ["Improcedente", "Concluída", "Em andamento", "Nova"]
-df_status_bar = df_filtered[df_filtered["Status"].isin(statuses_interested)] \
-    .groupby("Status").size().reset_index(name="Count")
+df_status_bar = rollup(cube_filtered[cube_filtered["Status"].isin(statuses_interested)], "Status") \
+    .reset_index(name="Count")
 
 # Mapeamento de cores para cada status
 color_map = {
@@ -532,8 +482,7 @@ with st.container():
 
 # 6 – Gráfico Combinado: Solicitações + Acumulado de Chuva
 st.markdown("### 🧮 Solicitações ❌ Acumulado de Chuva ⛈️")
-df_bar = df_filtered.groupby("AnoMes").size().reset_index(name="Count")
-df_combo = pd.merge(df_bar, df_chuva, on="AnoMes", how="left")
+df_combo = pd.merge(df_chart2, df_chuva, on="AnoMes", how="left")
 
 # Criar o gráfico de barras com cores ajustadas
 fig6 = px.bar(
@@ -578,6 +527,44 @@ fig6.update_layout(
 )
 
 st.plotly_chart(fig6, use_container_width=True)
+
+# 6.1 – Correlação entre a chuva e as solicitações (defasagem de 0 a 3 meses, rainfall.py)
+RAIN_GROUPS = ["Sistema Construtivo", "Empreendimento"]
+
+def build_rain_tables():
+    tables = {by: correlation_table(cube, df_chuva, by) for by in RAIN_GROUPS if by in cube.columns}
+    tables["Total"] = correlation_table(cube.assign(Total="Todas as solicitações"), df_chuva, "Total")
+    return tables
+
+st.markdown("### 🌧️ Correlação Chuva × Solicitações")
+st.caption("Correlação de Pearson entre a chuva do mês e as solicitações abertas no mesmo mês "
+           "e nos 3 meses seguintes, calculada sobre toda a base (os filtros acima não se aplicam).")
+rain_tables = shared_cache.get("correlacao_chuva", data_key, build_rain_tables)
+lag_columns = [lag_label(lag) for lag in LAGS]
+if rain_tables["Total"].empty:
+    st.info("Sem solicitações com data de abertura para comparar com a chuva.")
+else:
+    total_corr = rain_tables["Total"].iloc[0]
+    for col, lag_col in zip(st.columns(len(lag_columns)), lag_columns):
+        col.metric(f"Todas as solicitações: {lag_col.lower()}", f"{total_corr[lag_col]:.2f}")
+
+    rain_by = st.radio("Agrupar por", [by for by in RAIN_GROUPS if by in rain_tables], horizontal=True)
+    rain_table = rain_tables[rain_by]
+    # Mapa de calor dos grupos com mais solicitações (tabela completa logo abaixo)
+    fig_rain = px.imshow(
+        rain_table[lag_columns].head(15),
+        text_auto=".2f",
+        aspect="auto",
+        zmin=-1,
+        zmax=1,
+        color_continuous_scale="RdBu_r",
+        labels={"x": "", "y": "", "color": "Correlação"},
+    )
+    fig_rain.update_xaxes(side="top")
+    st.plotly_chart(fig_rain, use_container_width=True)
+    with st.expander(f"Tabela de correlação por {rain_by}"):
+        format_dict = {col: "{:.2f}" for col in lag_columns + ["Maior correlação"]}
+        st.dataframe(rain_table.style.format(format_dict, na_rep="-"), use_container_width=True)
 st.markdown("---")
 
 # 7 – MTTC – Tempo Médio de Conclusão (Por Obra)
@@ -585,31 +572,22 @@ st.write("### ⚒️ MTTC - Tempo Médio de Conclusão (Por Obra)")
 st.metric("MTTC Geral", f"{mttc:.2f} dias")
 
 # Calcular o MTTC por empreendimento
-mttc_por_obra = df_filtered[df_filtered["Encerramento"].notna()] \
-    .groupby("Empreendimento")["Tempo de Encerramento"].mean() \
-    .reset_index(name="MTTC")
-
-# Criar esquema de cores pastel
-cores_principais = px.colors.qualitative.Pastel1  
-
-# Definir bordas um pouco mais escuras para as colunas
-bordas_escurecidas = ["#D4A373", "#A3C4BC", "#9A8C98", "#E9C46A", "#F4A261", "#E76F51", 
-                      "#6D6875", "#4A4E69", "#9B5DE5", "#E63946"]  
+mttc_por_obra = mean_closing_time(cube_filtered, "Empreendimento").reset_index(name="MTTC")
 
-# Criar gráfico
+# Cor fixa por empreendimento (palette.py): não muda com os filtros nem entre execuções
 fig_mttc = px.bar(
     mttc_por_obra,
     x="Empreendimento",
     y="MTTC",
     color="Empreendimento",
-    color_discrete_sequence=cores_principais,
+    color_discrete_map=discrete_map(mttc_por_obra["Empreendimento"]),
     text=mttc_por_obra["MTTC"].apply(lambda x: f"{x:.2f}")  # Rótulo com 2 casas decimais
 )
 
-# Aplicar bordas escuras manualmente
-for trace, border_color in zip(fig_mttc.data, bordas_escurecidas):
+# Bordas mais escuras, da mesma cor de cada empreendimento
+for trace in fig_mttc.data:
     trace.marker.line.width = 1.5
-    trace.marker.line.color = border_color
+    trace.marker.line.color = color_pair(trace.name)[1]
 
 # Ajustar layout para remover grid, labels e posicionar a legenda à direita
 fig_mttc.update_layout(
@@ -633,3 +611,13 @@ fig_mttc.update_layout(
 )
 
 st.plotly_chart(fig_mttc, use_container_width=True)
+
+# =============================================================================
+# Histórico das importações do portal Pós Obra (pos_obra_import.py)
+# =============================================================================
+with st.expander("📝 Histórico de importações do portal", expanded=False):
+    changelog = read_changelog()
+    if changelog.empty:
+        st.info("Nenhuma importação registrada.")
+    else:
+        st.dataframe(changelog, hide_index=True, use_container_width=True)
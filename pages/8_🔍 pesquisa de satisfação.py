@@ -4,6 +4,7 @@ import sys
 import os
 from PIL import Image
 from utils import resource_path
+from data_store import load_sheet
 
 # Configurando Página
 st.set_page_config(
@@ -48,8 +49,8 @@ def custom_progress_bar(value, height=20, bar_color="orange"):
     """
     return bar_html
 
-# Lê o arquivo Excel "base2025.xlsx", aba "nps"
-df = pd.read_excel("base2025.xlsx", sheet_name="NPS")
+# Aba "NPS": a importada do portal (nps_import.py) ou, se não houver, a do "base2025.xlsx" (snapshot)
+df = load_sheet("NPS")
 
 # Converter a coluna "Nota" para float (tratando valores inválidos)
 df["Nota"] = pd.to_numeric(df["Nota"], errors="coerce")
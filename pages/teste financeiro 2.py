@@ -7,6 +7,7 @@ import re
 import os
 from datetime import datetime
 from dateutil.relativedelta import relativedelta  # ADIÇÃO: para cálculo de diferença em meses
+from data_store import load_sheets
 
 # ================================
 # Autenticação Simples
@@ -78,11 +79,9 @@ def load_data():
       - Tratamento de valores em branco (nas abas administrativo e departamento)
       - Na aba grd_Listagem, ignora a primeira linha (células mescladas)
     """
-    xls = pd.ExcelFile("base2025.xlsx")
-    df_departamento = pd.read_excel(xls, sheet_name="departamento")
-    df_engenharia  = pd.read_excel(xls, sheet_name="engenharia")
-    df_grd         = pd.read_excel(xls, sheet_name="grd_Listagem", skiprows=1)  # ignora a primeira linha
-    df_admin       = pd.read_excel(xls, sheet_name="administrativo")
+    df_departamento, df_engenharia, df_grd, df_admin = load_sheets(
+        "departamento", "engenharia", "grd_Listagem", "administrativo"
+    )
     
     df_departamento = clean_columns(df_departamento)
     df_engenharia  = clean_columns(df_engenharia)
@@ -7,6 +7,7 @@ import re
 import os
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
+from data_store import load_sheets
 
 # ================================
 # Autenticação Simples
@@ -84,11 +85,9 @@ def load_data():
       - Conversão de datas
       - Tratamento de valores em branco
     """
-    xls = pd.ExcelFile("base2025.xlsx")
-    df_departamento = pd.read_excel(xls, sheet_name="departamento")
-    df_engenharia  = pd.read_excel(xls, sheet_name="engenharia")
-    df_grd         = pd.read_excel(xls, sheet_name="grd_Listagem", skiprows=1)
-    df_admin       = pd.read_excel(xls, sheet_name="administrativo")
+    df_departamento, df_engenharia, df_grd, df_admin = load_sheets(
+        "departamento", "engenharia", "grd_Listagem", "administrativo"
+    )
     
     df_departamento = clean_columns(df_departamento)
     df_engenharia  = clean_columns(df_engenharia)
@@ -633,7 +632,7 @@ def main():
         st.markdown('-----')
         st.header("📊 Gráfico de Valor Conv. por Grupo")
         if not df_grd_interativo.empty:
-            df_grouped = df_grd_interativo.groupby("Descrição Grupo")["Valor"].sum().reset_index()
+            df_grouped = df_grd_interativo.groupby("Descrição Grupo", observed=True)["Valor"].sum().reset_index()
             fig_group = px.bar(
                 df_grouped,
                 x="Descrição Grupo",
@@ -667,7 +666,7 @@ def main():
             st.metric("Despesa Manutenção (Total)", f"R${total_despesa:,.2f}")
         valid_enterprises = df_depto_filtered["Empreendimento"].unique()
         df_calls_filtered = df_engenharia[df_engenharia["Empreendimento"].isin(valid_enterprises)]
-        df_calls_filtered = df_calls_filtered.groupby("Empreendimento")["N°"].count().reset_index().rename(columns={"N°": "Chamados"})
+        df_calls_filtered = df_calls_filtered.groupby("Empreendimento", observed=True)["N°"].count().reset_index().rename(columns={"N°": "Chamados"})
         total_chamados = df_calls_filtered["Chamados"].sum()
         custo_chamado_total = total_despesa / total_chamados if total_chamados != 0 else 0
         with col_metric3:
@@ -692,7 +691,7 @@ def main():
         
         if not df_depto_valid.empty:
             df_calls_filtered = df_engenharia[df_engenharia["Empreendimento"].isin(valid_enterprises)]
-            df_calls_filtered = df_calls_filtered.groupby("Empreendimento")["N°"].count().reset_index().rename(columns={"N°": "Chamados"})
+            df_calls_filtered = df_calls_filtered.groupby("Empreendimento", observed=True)["N°"].count().reset_index().rename(columns={"N°": "Chamados"})
             df_metrics_enterprise = pd.merge(df_depto_valid, df_calls_filtered, on="Empreendimento", how="left")
             df_metrics_enterprise["Chamados"].fillna(0, inplace=True)
             df_metrics_enterprise["Custo por Chamado"] = df_metrics_enterprise.apply(lambda row: row["Despesa Manutenção"] / row["Chamados"] if row["Chamados"] > 0 else 0, axis=1)
@@ -718,7 +717,7 @@ def main():
             else:
                 return None, None
 
-        df_grd["Data_CVCO_Ref"], df_grd["Status_Depto"] = zip(*df_grd["Cód. Alternativo Serviço"].apply(get_enterprise_info))
+        df_grd["Data_CVCO_Ref"], df_grd["Status_Depto"] = zip(*df_grd["Cód. Alternativo Serviço"].astype(str).apply(get_enterprise_info))
         
         def classify_period_doc(cvco_date, doc_date):
             if pd.isnull(cvco_date) or pd.isnull(doc_date):
@@ -759,7 +758,7 @@ def main():
         if selected_status_period:
             df_grd_filtered_period = df_grd_filtered_period[df_grd_filtered_period["Status_Depto"].isin(selected_status_period)]
         
-        df_period_sum = df_grd_filtered_period.groupby("Periodo Doc")["Valor Conv."].sum().reset_index()
+        df_period_sum = df_grd_filtered_period.groupby("Periodo Doc", observed=True)["Valor Conv."].sum().reset_index()
         fig_period_doc = px.bar(
             df_period_sum,
             x="Periodo Doc",
@@ -773,7 +772,7 @@ def main():
             fig_period_doc.update_traces(texttemplate='%{text:.2f}', textposition='outside', marker_line_color='black', marker_line_width=1)
         st.plotly_chart(fig_period_doc, use_container_width=True)
         
-        df_period_emp = df_grd_filtered_period.groupby(["Periodo Doc", "Cód. Alternativo Serviço"])["Valor Conv."].sum().reset_index()
+        df_period_emp = df_grd_filtered_period.groupby(["Periodo Doc", "Cód. Alternativo Serviço"], observed=True)["Valor Conv."].sum().reset_index()
         fig_period_emp = px.bar(
             df_period_emp,
             x="Periodo Doc",
@@ -918,11 +917,9 @@ def load_data():
     Carrega as abas “departamento”, “engenharia”, “grd_Listagem” e “administrativo”
     do arquivo Excel "base2025.xlsx", aplicando os pré-processamentos.
     """
-    xls = pd.ExcelFile("base2025.xlsx")
-    df_departamento = pd.read_excel(xls, sheet_name="departamento")
-    df_engenharia  = pd.read_excel(xls, sheet_name="engenharia")
-    df_grd         = pd.read_excel(xls, sheet_name="grd_Listagem", skiprows=1)
-    df_admin       = pd.read_excel(xls, sheet_name="administrativo")
+    df_departamento, df_engenharia, df_grd, df_admin = load_sheets(
+        "departamento", "engenharia", "grd_Listagem", "administrativo"
+    )
     
     df_departamento = clean_columns(df_departamento)
     df_engenharia  = clean_columns(df_engenharia)
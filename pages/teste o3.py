@@ -2,54 +2,18 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
-import random
 from datetime import date
+from data_store import load_sheets, snapshot_key
+from palette import bar_colors  # cor fixa por item (hash do nome): a mesma a cada execução
+from pareto import abc_colors, classify_abc
 
 # =========================================
-# Funções de Cores e Classificação ABC
+# Cores das Curvas ABC (em cache)
 # =========================================
-def random_color():
-    """Retorna uma cor aleatória no formato hexadecimal."""
-    return "#{:06x}".format(random.randint(0, 0xFFFFFF))
-
-def darken_color(hex_color, factor=0.7):
-    """Retorna uma versão mais escura da cor recebida."""
-    hex_color = hex_color.lstrip('#')
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
-    r = int(r * factor)
-    g = int(g * factor)
-    b = int(b * factor)
-    return "#{:02x}{:02x}{:02x}".format(r, g, b)
-
-def classify_abc(series):
-    """
-    Classifica os itens de uma série em categorias ABC com base na contribuição acumulada.
-    Categoria A: até 70%
-    Categoria B: de 70% até 90%
-    Categoria C: acima de 90%
-    """
-    s_sorted = series.sort_values(ascending=False)
-    total = s_sorted.sum()
-    cum_sum = s_sorted.cumsum()
-    categories = {}
-    for idx, value in s_sorted.items():
-        perc = cum_sum[idx] / total
-        if perc <= 0.7:
-            categories[idx] = "A"
-        elif perc <= 0.9:
-            categories[idx] = "B"
-        else:
-            categories[idx] = "C"
-    return categories
-
-# Cores para as categorias ABC
-abc_colors = {
-    "A": {"fill": "#ff9999", "line": "#cc0000"},  # vermelho claro / escuro
-    "B": {"fill": "#ffff99", "line": "#cccc00"},  # amarelo claro / escuro
-    "C": {"fill": "#99ff99", "line": "#009900"}   # verde claro / escuro
-}
+@st.cache_data(show_spinner=False)
+def abc_bar_colors(counts):
+    """Cores (preenchimento, borda) das barras de uma curva ABC, ver pareto.py."""
+    return abc_colors(classify_abc(counts))
 
 # =========================================
 # Configuração da Página e Exibição de Logos
@@ -72,15 +36,13 @@ st.markdown("Página em Construção. Volte mais tarde! 🚧")
 # Carregamento dos Dados (Planilhas)
 # =========================================
 @st.cache_data
-def load_data():
-    xls = pd.ExcelFile("base2025.xlsx")
-    df_eng = pd.read_excel(xls, sheet_name="engenharia")
-    df_dep = pd.read_excel(xls, sheet_name="departamento")
+def load_data(snapshot):
+    df_eng, df_dep = load_sheets("engenharia", "departamento")
     for df_ in [df_eng, df_dep]:
         df_.columns = df_.columns.str.strip()
     return df_eng, df_dep
 
-df_eng, df_dep = load_data()
+df_eng, df_dep = load_data(snapshot_key())
 
 # =========================================
 # Conversão de Datas (engenharia)
@@ -156,7 +118,7 @@ def split_garantia(value):
     else:
         return pd.Series([value.strip(), ""])
 
-df_eng[["Grupo Construtivo", "Sistema Construtivo"]] = df_eng["Garantia Solicitada"].apply(split_garantia)
+df_eng[["Grupo Construtivo", "Sistema Construtivo"]] = df_eng["Garantia Solicitada"].astype(object).apply(split_garantia)
 
 # =========================================
 # Interface de Filtros
@@ -251,8 +213,8 @@ def compute_metrics(group):
     return pd.Series({"MTBF": mtbf, "MTTR": mttr, "Disponibilidade": dispon})
 
 # Recalcular métricas para cada grupo e sistema
-metrics_group = df_filtered.groupby("Grupo Construtivo").apply(compute_metrics)
-metrics_system = df_filtered.groupby("Sistema Construtivo").apply(compute_metrics)
+metrics_group = df_filtered.groupby("Grupo Construtivo", observed=True).apply(compute_metrics)
+metrics_system = df_filtered.groupby("Sistema Construtivo", observed=True).apply(compute_metrics)
 
 # Para curvas ABC, contagens de ocorrências
 contagem_group = df_filtered["Grupo Construtivo"].value_counts()
@@ -284,9 +246,7 @@ fig1 = px.bar(
     labels={"x": "Grupo Construtivo", "y": "MTBF (horas)"},
     title="MTBF por Grupo Construtivo"
 )
-n_bars = len(mtbf_group_plot.index)
-colors = [random_color() for _ in range(n_bars)]
-line_colors = [darken_color(c) for c in colors]
+colors, line_colors = bar_colors(mtbf_group_plot.index)
 fig1.update_traces(marker_color=colors, marker_line_color=line_colors, marker_line_width=1)
 st.plotly_chart(fig1, use_container_width=True)
 
@@ -304,9 +264,7 @@ fig2 = px.bar(
     labels={"x": "Sistema Construtivo", "y": "MTBF (horas)"},
     title="MTBF por Sistema Construtivo"
 )
-n_bars = len(mtbf_system_plot.index)
-colors = [random_color() for _ in range(n_bars)]
-line_colors = [darken_color(c) for c in colors]
+colors, line_colors = bar_colors(mtbf_system_plot.index)
 fig2.update_traces(marker_color=colors, marker_line_color=line_colors, marker_line_width=1)
 st.plotly_chart(fig2, use_container_width=True)
 
@@ -327,9 +285,7 @@ fig3 = px.bar(
     title="MTTR por Grupo Construtivo"
 )
 fig3.update_traces(text=disp_group_plot.values, textposition='outside')
-n_bars = len(mttr_group_plot.index)
-colors = [random_color() for _ in range(n_bars)]
-line_colors = [darken_color(c) for c in colors]
+colors, line_colors = bar_colors(mttr_group_plot.index)
 fig3.update_traces(marker_color=colors, marker_line_color=line_colors, marker_line_width=1)
 st.plotly_chart(fig3, use_container_width=True)
 
@@ -350,9 +306,7 @@ fig4 = px.bar(
     title="MTTR por Sistema Construtivo"
 )
 fig4.update_traces(text=disp_system_plot.values, textposition='outside')
-n_bars = len(mttr_system_plot.index)
-colors = [random_color() for _ in range(n_bars)]
-line_colors = [darken_color(c) for c in colors]
+colors, line_colors = bar_colors(mttr_system_plot.index)
 fig4.update_traces(marker_color=colors, marker_line_color=line_colors, marker_line_width=1)
 st.plotly_chart(fig4, use_container_width=True)
 
@@ -371,9 +325,7 @@ fig5 = px.bar(
     labels={"x": "Grupo Construtivo", "y": "Contagem de Incidências"},
     title="Curva ABC por Grupo Construtivo"
 )
-abc_class_group = classify_abc(contagem_group_plot)
-colors = [abc_colors[abc_class_group[idx]]["fill"] for idx in contagem_group_plot.index]
-line_colors = [abc_colors[abc_class_group[idx]]["line"] for idx in contagem_group_plot.index]
+colors, line_colors = abc_bar_colors(contagem_group_plot)
 fig5.update_traces(marker_color=colors, marker_line_color=line_colors, marker_line_width=1)
 st.plotly_chart(fig5, use_container_width=True)
 
@@ -391,8 +343,6 @@ fig6 = px.bar(
     labels={"x": "Sistema Construtivo", "y": "Contagem de Incidências"},
     title="Curva ABC por Sistema Construtivo"
 )
-abc_class_system = classify_abc(contagem_system_plot)
-colors = [abc_colors[abc_class_system[idx]]["fill"] for idx in contagem_system_plot.index]
-line_colors = [abc_colors[abc_class_system[idx]]["line"] for idx in contagem_system_plot.index]
+colors, line_colors = abc_bar_colors(contagem_system_plot)
 fig6.update_traces(marker_color=colors, marker_line_color=line_colors, marker_line_width=1)
 st.plotly_chart(fig6, use_container_width=True)
@@ -0,0 +1,45 @@
+"""
+Cores estáveis para os gráficos (Grupo/Sistema Construtivo, empreendimentos...).
+
+A cor de cada item vem de um hash do seu nome: o mesmo item tem sempre a mesma
+cor, em qualquer gráfico, sessão ou execução, e o JSON das figuras não muda
+entre execuções quando os dados não mudam (o navegador não precisa redesenhar).
+O par (preenchimento, borda) de cada nome é calculado uma única vez por processo.
+"""
+import colorsys
+import hashlib
+from functools import lru_cache
+
+FILL_LIGHTNESS = 0.72
+FILL_SATURATION = 0.65
+BORDER_FACTOR = 0.7
+
+
+def darken_color(hex_color, factor=BORDER_FACTOR):
+    """Retorna uma versão mais escura da cor recebida."""
+    hex_color = hex_color.lstrip('#')
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+    r = int(r * factor)
+    g = int(g * factor)
+    b = int(b * factor)
+    return "#{:02x}{:02x}{:02x}".format(r, g, b)
+
+@lru_cache(maxsize=4096)
+def color_pair(key):
+    """(preenchimento, borda) em hexadecimal para `key`; o tom vem do hash do nome."""
+    digest = hashlib.blake2b(str(key).encode("utf-8"), digest_size=4).digest()
+    hue = int.from_bytes(digest, "big") / 2 ** 32
+    r, g, b = colorsys.hls_to_rgb(hue, FILL_LIGHTNESS, FILL_SATURATION)
+    fill = "#{:02x}{:02x}{:02x}".format(round(r * 255), round(g * 255), round(b * 255))
+    return fill, darken_color(fill)
+
+def bar_colors(keys):
+    """Listas (preenchimento, borda) para as barras, na ordem de `keys`."""
+    pairs = [color_pair(key) for key in keys]
+    return [fill for fill, _ in pairs], [line for _, line in pairs]
+
+def discrete_map(keys):
+    """{item: preenchimento}, para o color_discrete_map do plotly express."""
+    return {key: color_pair(key)[0] for key in keys}
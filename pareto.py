@@ -0,0 +1,76 @@
+"""
+Classificação ABC (curva de Pareto) de contagens ou valores.
+
+Os itens são ordenados do maior para o menor e a participação acumulada de cada
+um é comparada com os limites (padrão 70% e 90%) por `np.searchsorted`:
+  - A: participação acumulada até 70%
+  - B: de 70% até 90%
+  - C: acima de 90%
+Serve tanto para contagens de incidências (value_counts) quanto para custos
+(ex.: soma de "Valor Conv." da grd_Listagem por serviço).
+"""
+import numpy as np
+import pandas as pd
+
+ABC_THRESHOLDS = (0.7, 0.9)
+ABC_CLASSES = ("A", "B", "C")
+
+# Cores dos gráficos de curva ABC
+ABC_COLORS = {
+    "A": {"fill": "#ff9999", "line": "#cc0000"},  # vermelho claro / escuro
+    "B": {"fill": "#ffff99", "line": "#cccc00"},  # amarelo claro / escuro
+    "C": {"fill": "#99ff99", "line": "#009900"}   # verde claro / escuro
+}
+
+
+def cumulative_share(values):
+    """Participação acumulada (0 a 1) de cada item na ordem decrescente, alinhada ao índice de `values`."""
+    values = pd.Series(values, dtype=float)
+    order = np.argsort(-values.to_numpy(), kind="stable")
+    cum = values.to_numpy()[order].cumsum()
+    total = cum[-1] if cum.size else 0.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        shares = cum / total
+    result = np.empty_like(shares)
+    result[order] = shares
+    return pd.Series(result, index=values.index)
+
+def classify_abc(values, thresholds=ABC_THRESHOLDS):
+    """
+    Classe ABC de cada item de `values` (Series de contagens ou valores), como
+    categórica ordenada (A < B < C) alinhada ao índice de entrada.
+    `thresholds` são os limites superiores de participação acumulada de A e B.
+    """
+    shares = cumulative_share(values)
+    # side="left": participação exatamente igual ao limite fica na classe de menor letra;
+    # total zero (participação NaN) cai em C
+    codes = np.searchsorted(np.asarray(thresholds, dtype=float), shares.to_numpy(), side="left")
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=list(ABC_CLASSES), ordered=True),
+        index=shares.index,
+    )
+
+def abc_table(df, by, value_col=None, thresholds=ABC_THRESHOLDS):
+    """
+    Tabela de Pareto por `by`: contagem de linhas (sem `value_col`) ou soma de
+    `value_col`, em ordem decrescente, com participação, participação acumulada e classe.
+    """
+    grouped = df.groupby(by, observed=True)
+    totals = grouped.size() if value_col is None else grouped[value_col].sum()
+    totals = totals.sort_values(ascending=False, kind="stable")
+    total = totals.sum()
+    table = pd.DataFrame({
+        "Valor": totals,
+        "Participação": totals / total if total else np.nan,
+        "Participação Acumulada": cumulative_share(totals),
+        "Classe": classify_abc(totals, thresholds),
+    })
+    table.index.name = by
+    return table
+
+def abc_colors(classes, palette=ABC_COLORS):
+    """Listas (preenchimento, borda) de cores para as barras, na ordem de `classes`."""
+    classes = pd.Series(classes).astype(object)
+    fill = classes.map({k: v["fill"] for k, v in palette.items()})
+    line = classes.map({k: v["line"] for k, v in palette.items()})
+    return fill.tolist(), line.tolist()
@@ -0,0 +1,76 @@
+"""
+Acesso ao portal Pós Obra pelo Selenium (Chrome), comum aos importadores
+(pos_obra_import.py e nps_import.py).
+
+O Selenium só é importado quando o navegador é realmente usado, para que a
+leitura de páginas salvas funcione sem ele.
+"""
+import re
+
+PORTAL_URL = "https://posobravalorreal.com.br/admin/"
+DEFAULT_USER = "lucas"
+DEFAULT_PASSWORD = "55365883"
+
+
+def new_driver(headless=True):
+    """Chrome (sem janela, por padrão)."""
+    from selenium import webdriver
+
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    return webdriver.Chrome(options=options)
+
+def login(driver, wait, usuario=DEFAULT_USER, senha=DEFAULT_PASSWORD):
+    """Abre o portal e envia o login."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support import expected_conditions as EC
+
+    driver.get(PORTAL_URL)
+    print("[INFO] Página de login aberta.")
+    username_input = wait.until(EC.presence_of_element_located(
+        (By.XPATH, "//input[@type='text' or @name='usuario' or contains(@id, 'user')]")
+    ))
+    password_input = wait.until(EC.presence_of_element_located(
+        (By.XPATH, "//input[@type='password' or @name='senha' or contains(@id, 'pass')]")
+    ))
+    username_input.send_keys(usuario)
+    password_input.send_keys(senha)
+    password_input.send_keys(Keys.RETURN)
+    print("[INFO] Login enviado.")
+
+def show_all_rows(wait, table_id):
+    """
+    Seleciona "Todos" no seletor de registros do DataTables `table_id` e espera o
+    rodapé indicar que todos os registros estão na tela. Retorna False se não
+    for possível confirmar dentro do tempo de espera.
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import Select
+
+    select_element = wait.until(EC.presence_of_element_located((By.XPATH, f"//select[@name='{table_id}_length']")))
+    Select(select_element).select_by_value("-1")  # "Todos"
+    print("[INFO] Filtro 'Todos' aplicado.")
+    try:
+        wait.until(all_rows_shown(table_id))
+        return True
+    except TimeoutException:
+        print("[AVISO] Não foi possível confirmar que todos os registros foram exibidos.")
+        return False
+
+def all_rows_shown(table_id):
+    """Condição de espera: o rodapé do DataTables mostra todos os registros."""
+    from selenium.webdriver.common.by import By
+
+    def condition(driver):
+        info = driver.find_elements(By.ID, f"{table_id}_info")
+        if not info:
+            return False
+        # Ex.: "Mostrando de 1 até 554 de 554 registros"
+        numbers = re.findall(r"\d+", info[0].text.replace(".", ""))
+        return len(numbers) >= 3 and numbers[-2] == numbers[-1]
+    return condition
@@ -0,0 +1,152 @@
+"""
+Importação das solicitações de assistência do portal Pós Obra (tabela tabsolics).
+
+O navegador é usado apenas para login e para exibir a tabela com "Todos" os
+registros; o HTML da página é lido uma única vez (page_source) e interpretado
+com lxml. A situação da pesquisa vem do próprio HTML (ícone de check na 10ª
+coluna), sem esperar linha a linha pelo ícone.
+
+As solicitações importadas são aplicadas ao conjunto de engenharia como
+upsert pelo N° (ver engenharia_store.py): entram as novas e as que mudaram, e o
+changelog registra cada alteração. Por padrão a tabela lida inteira é aplicada,
+para que mudanças em solicitações antigas (status, encerramento, pesquisa)
+também entrem; com --desde-ultimo entram só as solicitações com N° maior que o
+último importado, como no modo incremental anterior.
+
+Uso pela linha de comando:
+    python pos_obra_import.py                        # acessa o portal
+    python pos_obra_import.py --html pagina.html     # usa uma página salva
+    python pos_obra_import.py --excel engenharia.xlsx  # também exporta a tabela lida
+    python pos_obra_import.py --desde-ultimo         # só as solicitações novas
+"""
+import argparse
+import time
+
+import pandas as pd
+from lxml import html as lxml_html
+
+from engenharia_store import apply_import, load_engenharia
+from portal import DEFAULT_PASSWORD, DEFAULT_USER, login, new_driver, show_all_rows
+
+COLUMNS = [
+    "N°", "Empreendimento", "Unidade", "Bloco", "Responsável",
+    "Data de Abertura", "Encerramento",
+    "Status", "Pesquisa", "Garantia Solicitada"
+]
+SURVEY_DONE = "Pesquisa Realizada"
+SURVEY_PENDING = "Pesquisa Não Realizada"
+CLOSED_STATUSES = ("concluída", "improcedente")  # só estas têm data de encerramento
+
+_ROWS_XPATH = "//table[@id='tabsolics']//tbody/tr"
+# Ícone de pesquisa realizada: <svg> após o Font Awesome renderizar, <i> no HTML original
+_SURVEY_ICON_XPATH = ".//*[contains(@class, 'fa-check') and contains(@class, 'text-success')]"
+
+
+# ================================
+# Leitura do HTML
+# ================================
+def _text(cell):
+    """Texto da célula com os espaços normalizados (como o .text do Selenium)."""
+    return " ".join(cell.text_content().split())
+
+def parse_solicitacoes(page_html):
+    """
+    Extrai as solicitações da tabela tabsolics de uma página HTML completa.
+    Linhas com menos de 9 colunas (ex.: "Nenhum registro encontrado") são ignoradas.
+    """
+    tree = lxml_html.fromstring(page_html)
+    dados = []
+    for linha in tree.xpath(_ROWS_XPATH):
+        colunas = linha.xpath("./td")
+        if len(colunas) < 9:
+            continue
+
+        unidade = _text(colunas[2]).replace("Comum", "Área Comum")
+        bloco = _text(colunas[3]) if unidade != "Área Comum" else "Área Comum"
+        status = _text(colunas[7])
+        encerramento = _text(colunas[6]) if status.lower() in CLOSED_STATUSES else ""
+        realizada = len(colunas) > 9 and bool(colunas[9].xpath(_SURVEY_ICON_XPATH))
+
+        dados.append([
+            _text(colunas[0]), _text(colunas[1]), unidade, bloco, _text(colunas[4]),
+            _text(colunas[5]), encerramento,
+            status, SURVEY_DONE if realizada else SURVEY_PENDING, _text(colunas[8])
+        ])
+
+    df = pd.DataFrame(dados, columns=COLUMNS)
+    df["N°"] = pd.to_numeric(df["N°"], errors="coerce").astype("Int64")
+    return df
+
+
+# ================================
+# Importação
+# ================================
+def last_imported_number(existing):
+    """Maior N° já importado (None se o conjunto estiver vazio)."""
+    numbers = pd.to_numeric(existing["N°"], errors="coerce").dropna() if "N°" in existing else pd.Series()
+    return int(numbers.max()) if not numbers.empty else None
+
+def only_new(existing, scraped):
+    """Solicitações de `scraped` com N° maior que o último de `existing`."""
+    last = last_imported_number(existing)
+    return scraped if last is None else scraped[scraped["N°"] > last]
+
+def import_solicitacoes(page_html, excel_path=None, desde_ultimo=False):
+    """
+    Interpreta a página e aplica as solicitações ao conjunto de engenharia.
+    Retorna o changelog da importação; `excel_path` também grava a tabela lida em Excel.
+    Com `desde_ultimo`, aplica só as solicitações com N° maior que o último importado
+    (alterações em solicitações antigas ficam de fora).
+    """
+    scraped = parse_solicitacoes(page_html)
+    if excel_path:
+        scraped.to_excel(excel_path, index=False)
+    if desde_ultimo:
+        scraped = only_new(load_engenharia(), scraped)
+    return apply_import(scraped)
+
+
+# ================================
+# Acesso ao portal
+# ================================
+def fetch_page(usuario=DEFAULT_USER, senha=DEFAULT_PASSWORD, headless=True, timeout=30):
+    """Faz login, seleciona "Todos" na tabela de solicitações e devolve o HTML da página."""
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    driver = new_driver(headless)
+    wait = WebDriverWait(driver, timeout)
+    try:
+        login(driver, wait, usuario, senha)
+        show_all_rows(wait, "tabsolics")
+        return driver.page_source
+    finally:
+        driver.quit()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Importa as solicitações do portal Pós Obra para o conjunto de engenharia.")
+    parser.add_argument("--html", help="usa uma página HTML salva em vez de acessar o portal")
+    parser.add_argument("--excel", default=None, help="também grava a tabela lida nesta planilha")
+    parser.add_argument("--usuario", default=DEFAULT_USER)
+    parser.add_argument("--senha", default=DEFAULT_PASSWORD)
+    parser.add_argument("--desde-ultimo", action="store_true",
+                        help="importa só as solicitações com N° maior que o último importado")
+    parser.add_argument("--com-janela", action="store_true", help="mostra a janela do Chrome")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    if args.html:
+        with open(args.html, encoding="utf-8") as f:
+            page_html = f.read()
+    else:
+        page_html = fetch_page(args.usuario, args.senha, headless=not args.com_janela)
+    changelog = import_solicitacoes(page_html, args.excel, args.desde_ultimo)
+    novas = int((changelog["Alteração"] == "Nova").sum())
+    alteradas = changelog.loc[changelog["Alteração"] == "Alterada", "N°"].nunique()
+    print(f"[INFO] {novas} solicitações novas e {alteradas} alteradas em {time.perf_counter() - inicio:.2f} s.")
+    alteracoes = changelog.loc[changelog["Alteração"] == "Alterada", ["N°", "Coluna", "Antes", "Depois"]]
+    for numero, coluna, antes, depois in alteracoes.fillna("(vazio)").to_numpy():
+        print(f"  N° {numero}: {coluna}: {antes} -> {depois}")
+
+
+if __name__ == "__main__":
+    main()
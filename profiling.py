@@ -0,0 +1,60 @@
+"""
+Medição do tempo de cada seção de uma página e da memória dos DataFrames, para o painel de debug.
+
+Uso (cada `lap` fecha a seção que começou no `lap` anterior):
+    timer = SectionTimer()
+    ...  # seção 1
+    timer.lap("Mão de Obra")
+    ...  # seção 2
+    timer.lap("Manutenção")
+    st.dataframe(timer.table())
+"""
+import time
+
+import pandas as pd
+
+
+class SectionTimer:
+    """Acumula o tempo (em ms) gasto em cada seção, na ordem em que aparecem."""
+
+    def __init__(self):
+        self.timings = {}
+        self._last = time.perf_counter()
+
+    def lap(self, name):
+        """Atribui a `name` o tempo decorrido desde o último lap (ou desde a criação)."""
+        now = time.perf_counter()
+        self.timings[name] = self.timings.get(name, 0.0) + (now - self._last) * 1000
+        self._last = now
+
+    def total(self):
+        return sum(self.timings.values())
+
+    def table(self):
+        """DataFrame com "Seção" e "Tempo (ms)", mais a linha de total."""
+        rows = list(self.timings.items()) + [("Total", self.total())]
+        return pd.DataFrame(rows, columns=["Seção", "Tempo (ms)"]).round({"Tempo (ms)": 1})
+
+
+def memory_table(frames):
+    """DataFrame com "Tabela", "Linhas" e "Memória (MB)" de cada DataFrame de `frames` (dict), mais o total."""
+    rows = [(name, len(df), df.memory_usage(deep=True).sum() / 1e6) for name, df in frames.items()]
+    table = pd.DataFrame(rows, columns=["Tabela", "Linhas", "Memória (MB)"])
+    table.loc[len(table)] = ["Total", table["Linhas"].sum(), table["Memória (MB)"].sum()]
+    return table.round({"Memória (MB)": 3})
+
+def state_frames(state, prefix="", _seen=None):
+    """
+    DataFrames guardados em `state` (ex.: st.session_state), inclusive dentro de dicts,
+    como {"chave" ou "chave.subchave": DataFrame}. Um mesmo objeto aparece só uma vez.
+    """
+    seen = set() if _seen is None else _seen
+    frames = {}
+    for key, value in state.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, pd.DataFrame) and id(value) not in seen:
+            seen.add(id(value))
+            frames[name] = value
+        elif isinstance(value, dict):
+            frames.update(state_frames(value, f"{name}.", seen))
+    return frames
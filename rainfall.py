@@ -0,0 +1,117 @@
+"""
+Chuva × solicitações de assistência técnica.
+
+A aba "calendariodechuvas" (um ano por linha, um mês por coluna) vira uma série
+mensal de chuva acumulada, que é comparada com o volume mensal de solicitações
+de cada grupo (Sistema Construtivo, Empreendimento...) pela correlação de Pearson
+com defasagens de 0 a 3 meses: na defasagem k, a chuva do mês t - k é comparada
+com as solicitações do mês t (a chuva vem antes das solicitações).
+
+As contagens mensais saem do cubo de olap_cube.py e a correlação é calculada
+para todos os grupos de uma vez, com operações de matriz (meses × grupos).
+"""
+import numpy as np
+import pandas as pd
+
+MONTH_COLUMNS = ["JAN", "FEV", "MAR", "ABR", "MAI", "JUN", "JUL", "AGO", "SET", "OUT", "NOV", "DEZ"]
+LAGS = (0, 1, 2, 3)
+
+
+def process_calendario_de_chuvas(df):
+    """
+    Transforma o DataFrame de calendariodechuvas, que está em formato wide,
+    para um formato long com as colunas: "ANO", "Mes", "Chuva" e "AnoMes".
+    """
+    df_long = pd.melt(df, id_vars=["ANO"], value_vars=MONTH_COLUMNS, var_name="Mes", value_name="Chuva")
+
+    # Substituir vírgula por ponto e traços por NaN e converter para numérico
+    df_long["Chuva"] = (
+        df_long["Chuva"]
+        .astype(str)
+        .str.replace(",", ".")
+        .replace("-", np.nan)
+    )
+    df_long["Chuva"] = pd.to_numeric(df_long["Chuva"], errors="coerce")
+
+    # Mapeia as abreviações dos meses para números com 2 dígitos
+    month_map = {
+        "JAN": "01", "FEV": "02", "MAR": "03", "ABR": "04", "MAI": "05", "JUN": "06",
+        "JUL": "07", "AGO": "08", "SET": "09", "OUT": "10", "NOV": "11", "DEZ": "12"
+    }
+    df_long["AnoMes"] = df_long["ANO"].astype(str) + "-" + df_long["Mes"].map(month_map)
+
+    return df_long
+
+def rain_by_month(df_chuva):
+    """Chuva acumulada por mês (Series indexada por Period mensal, sem meses vazios)."""
+    rain = df_chuva.dropna(subset=["Chuva"])
+    return pd.Series(rain["Chuva"].to_numpy(dtype=float),
+                     index=pd.PeriodIndex(rain["AnoMes"], freq="M")).sort_index()
+
+def monthly_counts(cube, by):
+    """
+    Solicitações por mês (linhas) e valor de `by` (colunas), a partir do cubo,
+    com todos os meses entre a primeira e a última solicitação (meses sem solicitação = 0).
+    """
+    cube = cube[(cube["AnoMes"] != "NaT") & cube[by].notna()]
+    if cube.empty:
+        return pd.DataFrame(dtype=float)
+    months = pd.PeriodIndex(cube["AnoMes"], freq="M")
+    wide = cube.groupby([months, cube[by]], observed=True)["Solicitações"].sum().unstack(fill_value=0)
+    full = pd.period_range(wide.index.min(), wide.index.max(), freq="M")
+    return wide.reindex(full, fill_value=0)
+
+def lagged_correlation(counts, rain, lags=LAGS):
+    """
+    Correlação de Pearson entre a chuva defasada e cada coluna de `counts`
+    (DataFrame mensal de monthly_counts), para cada defasagem de `lags`.
+    Retorna (correlações, meses): DataFrames grupos × defasagens; a correlação
+    é NaN quando o grupo ou a chuva não variam nos meses comparados.
+    """
+    months = counts.index
+    max_lag = max(lags)
+    # Chuva desde max_lag meses antes do primeiro mês de solicitações
+    rain_ext = rain.reindex(pd.period_range(months[0] - max_lag, months[-1], freq="M")).to_numpy()
+    values = counts.to_numpy(dtype=float)
+
+    corr = np.full((values.shape[1], len(lags)), np.nan)
+    n_months = np.zeros((values.shape[1], len(lags)), dtype=np.int64)
+    for j, lag in enumerate(lags):
+        r = rain_ext[max_lag - lag:max_lag - lag + len(months)]
+        valid = ~np.isnan(r)
+        n_months[:, j] = valid.sum()
+        if valid.sum() < 2:
+            continue
+        x = values[valid] - values[valid].mean(axis=0)
+        rc = r[valid] - r[valid].mean()
+        den = np.sqrt((x ** 2).sum(axis=0)) * np.sqrt((rc ** 2).sum())
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr[:, j] = np.where(den > 0, rc @ x / den, np.nan)
+
+    columns = [lag_label(lag) for lag in lags]
+    return (pd.DataFrame(corr, index=counts.columns, columns=columns),
+            pd.DataFrame(n_months, index=counts.columns, columns=columns))
+
+def lag_label(lag):
+    """Nome da coluna da defasagem `lag` (em meses)."""
+    return "Mesmo mês" if lag == 0 else f"{lag} {'mês' if lag == 1 else 'meses'} depois"
+
+def correlation_table(cube, df_chuva, by, lags=LAGS):
+    """
+    Tabela por valor de `by` com o total de solicitações, a correlação em cada
+    defasagem, a defasagem de maior correlação e o número de meses comparados.
+    Ordenada do maior para o menor volume de solicitações.
+    """
+    counts = monthly_counts(cube, by)
+    if counts.empty:
+        return pd.DataFrame()
+    corr, n_months = lagged_correlation(counts, rain_by_month(df_chuva), lags)
+    table = corr.copy()
+    table.insert(0, "Solicitações", counts.sum())
+    best = corr.fillna(-np.inf).to_numpy().argmax(axis=1)
+    has_corr = corr.notna().any(axis=1)
+    table["Maior correlação"] = corr.max(axis=1)
+    table["Defasagem (meses)"] = pd.Series(np.asarray(lags)[best], index=corr.index).where(has_corr).astype("Int64")
+    table["Meses comparados"] = n_months.min(axis=1)
+    table.index.name = by
+    return table.sort_values("Solicitações", ascending=False, kind="stable")
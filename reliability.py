@@ -0,0 +1,80 @@
+"""
+Métricas de confiabilidade das solicitações de assistência técnica
+(MTBF, MTTR e Disponibilidade), por qualquer coluna de agrupamento.
+
+O tempo de parada de cada solicitação é a diferença vetorizada entre as colunas
+de encerramento e abertura, e os totais de cada grupo saem de um único
+`groupby.agg` (máximo, mínimo, soma e contagens).
+"""
+import numpy as np
+import pandas as pd
+
+OPENED_COL = "Data de Abertura"
+CLOSED_COL = "Encerramento"
+START_COL = "Data CVCO"
+
+
+def aggregate_downtime(df, by, opened_col=OPENED_COL, closed_col=CLOSED_COL, start_col=START_COL,
+                       whole_days=False):
+    """
+    Totais por grupo usados nas métricas:
+      - "Horas Disponíveis": última abertura do grupo menos a menor data de início (CVCO), em horas
+      - "Horas Paradas": soma de (encerramento - abertura), em horas (solicitações abertas não somam)
+      - "Ocorrências": número de solicitações do grupo
+      - "Encerradas": número de solicitações com data de encerramento
+    Com `whole_days=True` a parada é contada em dias inteiros (x 24 h), como a
+    coluna "Tempo de Encerramento".
+    """
+    delta = df[closed_col] - df[opened_col]
+    downtime = delta.dt.days * 24 if whole_days else delta.dt.total_seconds() / 3600
+    work = pd.DataFrame({
+        "_key": df[by],
+        "_opened": df[opened_col],
+        "_start": df[start_col],
+        "_downtime": downtime,
+        "_closed": df[closed_col].notna(),
+    })
+    totals = work.groupby("_key", observed=True).agg(
+        max_opened=("_opened", "max"),
+        min_start=("_start", "min"),
+        downtime=("_downtime", "sum"),
+        occurrences=("_downtime", "size"),
+        closed=("_closed", "sum"),
+    )
+    totals.index.name = by
+    return pd.DataFrame({
+        "Horas Disponíveis": (totals["max_opened"] - totals["min_start"]).dt.total_seconds() / 3600,
+        "Horas Paradas": totals["downtime"].astype(float),
+        "Ocorrências": totals["occurrences"],
+        "Encerradas": totals["closed"].astype(int),
+    })
+
+def _with_availability(mtbf, mttr):
+    total = mtbf + mttr
+    dispon = np.where(total > 0, mtbf / total.where(total != 0) * 100, np.nan)
+    return pd.DataFrame({"MTBF": mtbf, "MTTR": mttr, "Disponibilidade": dispon}, index=mtbf.index)
+
+def reliability_metrics(df, by, **kwargs):
+    """
+    MTBF, MTTR e Disponibilidade (horas / %) por `by`, considerando todas as ocorrências:
+      - MTBF: (horas disponíveis - horas paradas) / ocorrências
+      - MTTR: horas paradas / ocorrências
+      - Disponibilidade: MTBF / (MTBF + MTTR) * 100
+    """
+    totals = aggregate_downtime(df, by, **kwargs)
+    mtbf = (totals["Horas Disponíveis"] - totals["Horas Paradas"]) / totals["Ocorrências"]
+    mttr = totals["Horas Paradas"] / totals["Ocorrências"]
+    return _with_availability(mtbf, mttr)
+
+def failure_metrics(df, by, **kwargs):
+    """
+    Variante do painel de Assistência Técnica:
+      - MTBF: horas disponíveis / ocorrências (sem descontar as paradas)
+      - MTTR: horas paradas (dias inteiros x 24) / solicitações encerradas
+      - Disponibilidade: MTBF / (MTBF + MTTR) * 100
+    """
+    kwargs.setdefault("whole_days", True)
+    totals = aggregate_downtime(df, by, **kwargs)
+    mtbf = totals["Horas Disponíveis"] / totals["Ocorrências"]
+    mttr = totals["Horas Paradas"] / totals["Encerradas"].where(totals["Encerradas"] > 0)
+    return _with_availability(mtbf, mttr)
@@ -0,0 +1,73 @@
+"""
+Tipos declarados de cada aba (registro de esquemas), aplicados ao carregar os dados.
+
+Textos muito repetidos (empreendimento, status, responsável, garantia...) viram
+categóricas, contagens viram inteiros de 32 bits e datas ficam em datetime64.
+Como cada sessão do Streamlit recebe as suas cópias dos DataFrames (ver
+data_cache.py), isso reduz a memória de todas as sessões de uma vez.
+
+Colunas que não estão no esquema (ou não existem na aba) ficam como estão.
+A grd_Listagem não aparece aqui: ela já vem tipada da leitura em streaming
+(ver data_store.SHEET_COLUMNS).
+"""
+import pandas as pd
+
+DATE = "datetime64[us]"
+
+# Nome lógico da aba (data_store.SHEETS) -> {coluna: tipo}
+SCHEMAS = {
+    "departamento": {
+        "Status": "category",
+        "Data CVCO": DATE,
+        "Data Entrega de obra": DATE,
+        "N° Unidades": "int32",
+    },
+    # Conjunto de engenharia_store.load_engenharia (aba + importações + colunas derivadas)
+    "engenharia": {
+        "Empreendimento": "category",
+        "Unidade": "category",
+        "Bloco": "category",
+        "Responsável": "category",
+        "Data de Abertura": DATE,
+        "Encerramento": DATE,
+        "Status": "category",
+        "Pesquisa": "category",
+        "Garantia Solicitada": "category",
+        "FCR": "category",
+        "Sistema Construtivo": "category",
+        "Tipo de Falha": "category",
+    },
+    "administrativo": {
+        "Modelo": "category",
+        "Previsão Data": DATE,
+        "Admissão": DATE,
+    },
+    "calendariodechuvas": {
+        "ANO": "int32",
+    },
+    "home": {
+        "OBJETIVOS": "category",
+        "DESCRIÇÃO": "category",
+        "MÊS": "category",
+        "ANO": "int32",
+    },
+}
+
+
+def _convert(col, dtype):
+    if dtype == "category":
+        return col.astype("category")
+    if dtype.startswith("datetime64"):
+        return pd.to_datetime(col, errors="coerce").astype(dtype)
+    values = pd.to_numeric(col, errors="coerce")
+    if dtype.startswith("int") and values.isna().any():
+        return values.astype(dtype.capitalize())  # inteiro com vazios: Int32
+    return values.astype(dtype)
+
+def apply_schema(name, df):
+    """Converte as colunas de `df` para os tipos declarados em SCHEMAS[name] (sem esquema: inalterado)."""
+    schema = SCHEMAS.get(name, {})
+    for col, dtype in schema.items():
+        if col in df.columns and str(df[col].dtype) != dtype:
+            df[col] = _convert(df[col], dtype)
+    return df
@@ -0,0 +1,27 @@
+"""
+Formatação das tabelas exibidas nas páginas (camada de apresentação).
+
+Os DataFrames mantêm os tipos nativos (datas em datetime64); o formato
+brasileiro (dd/mm/aaaa) é aplicado só na tabela renderizada, pelo column_config
+do st.dataframe, ou no texto exibido. Assim as datas não vão para texto e voltam
+(o que custava uma releitura e podia trocar o dia pelo mês).
+"""
+import pandas as pd
+import streamlit as st
+
+DATE_FORMAT = "DD/MM/YYYY"  # formato do column_config (Streamlit)
+DATE_STRFTIME = "%d/%m/%Y"  # mesmo formato, para textos e exportações
+
+
+def date_column_config(df, fmt=DATE_FORMAT):
+    """column_config com DateColumn no formato `fmt` para cada coluna datetime64 de `df`."""
+    return {
+        col: st.column_config.DateColumn(format=fmt)
+        for col in df.columns
+        if pd.api.types.is_datetime64_any_dtype(df[col])
+    }
+
+def format_date(value, empty="-"):
+    """Data como texto dd/mm/aaaa (`empty` para datas vazias)."""
+    value = pd.to_datetime(value)
+    return empty if pd.isna(value) else value.strftime(DATE_STRFTIME)
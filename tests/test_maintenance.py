@@ -0,0 +1,93 @@
+"""
+Regressão da despesa real por empreendimento (aba Manutenção da página financeira).
+
+Compara o laço original da página com maintenance.build_service_index +
+real_spend_by_enterprise numa grd_Listagem pequena em memória, cobrindo grafias
+diferentes do mesmo código, códigos contidos em outros, vazios, códigos em
+branco e o código ADM.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from maintenance import build_service_index, real_spend_by_enterprise
+
+
+def legacy_real_spend(df_departamento, df_grd):
+    """
+    Cópia do cálculo original da página financeira. O `.map(str)` reproduz o
+    astype(str) do pandas 2, em que os vazios viravam texto ("nan"/"None").
+    """
+    result = []
+    for _, row in df_departamento.iterrows():
+        empreendimento = row['Empreendimento']
+        real_val = 0
+        for serv in df_grd["Cód. Alternativo Serviço"].dropna().unique():
+            serv_clean = serv.strip().upper()
+            if serv_clean == "ADM":
+                continue
+            if serv_clean in empreendimento.upper():
+                mask = df_grd["Cód. Alternativo Serviço"].map(str).apply(lambda x: serv_clean in x.strip().upper())
+                real_val += df_grd.loc[mask, "Valor Conv."].sum()
+        result.append(real_val)
+    return np.array(result, dtype=float)
+
+def departamento(*names):
+    return pd.DataFrame({"Empreendimento": list(names)})
+
+def grd(*rows):
+    return pd.DataFrame(rows, columns=["Cód. Alternativo Serviço", "Valor Conv."])
+
+def new_real_spend(df_departamento, df_grd):
+    index = build_service_index(df_grd, df_departamento["Empreendimento"])
+    return real_spend_by_enterprise(index, df_departamento["Empreendimento"])
+
+
+CASES = {
+    # " porto belo " e "PORTO BELO" são o mesmo código: o laço original soma uma vez por grafia
+    "grafias": (
+        departamento("RESIDENCIAL PORTO BELO", "RESIDENCIAL SOLAR"),
+        grd(("PORTO BELO", 100.0), (" porto belo ", 50.0), ("SOLAR", 30.0), ("SOLAR", 20.0)),
+    ),
+    # "PORTO BELO" está contido em "PORTO BELO II": o código curto soma os dois
+    "contencao": (
+        departamento("RESIDENCIAL PORTO BELO", "RESIDENCIAL PORTO BELO II", "SEM LANÇAMENTOS"),
+        grd(("PORTO BELO", 100.0), ("PORTO BELO II", 40.0), ("BELO", 7.0)),
+    ),
+    # Vazios (None/NaN) não são código de nenhum empreendimento; valor vazio soma 0
+    "vazios": (
+        departamento("RESIDENCIAL PORTO BELO", "RESIDENCIAL SOLAR"),
+        grd(("PORTO BELO", 100.0), (None, 999.0), (np.nan, 15.0), ("SOLAR", np.nan), ("SOLAR", 8.0)),
+    ),
+    # Código em branco vira "", que está contido em todos os nomes e em todos os códigos
+    "brancos": (
+        departamento("RESIDENCIAL PORTO BELO", "RESIDENCIAL SOLAR"),
+        grd(("PORTO BELO", 100.0), ("", 5.0), ("   ", 3.0), ("SOLAR", 30.0)),
+    ),
+    # ADM nunca entra, nem em empreendimento com "ADM" no nome; as outras grafias de ADM também não
+    "adm": (
+        departamento("EDIFÍCIO ADMIRAL", "RESIDENCIAL SOLAR"),
+        grd(("ADM", 500.0), (" adm", 80.0), ("SOLAR", 30.0), ("ADMIRAL", 12.0)),
+    ),
+}
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_real_spend_matches_legacy_loop(case):
+    df_departamento, df_grd = CASES[case]
+    expected = legacy_real_spend(df_departamento, df_grd)
+    np.testing.assert_allclose(new_real_spend(df_departamento, df_grd), expected, rtol=1e-12)
+
+def test_totals_by_enterprise():
+    df_departamento, df_grd = CASES["grafias"]
+    # PORTO BELO: (100 + 50) x 2 grafias; SOLAR: 30 + 20 com uma grafia
+    np.testing.assert_allclose(new_real_spend(df_departamento, df_grd), [300.0, 50.0])
+
+def test_enterprise_without_code_is_zero():
+    df_departamento, df_grd = CASES["contencao"]
+    assert new_real_spend(df_departamento, df_grd)[-1] == 0.0
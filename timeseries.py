@@ -0,0 +1,81 @@
+"""
+Agregações de séries temporais mensais usadas nos gráficos de OKR
+(ex.: Gasto de Mão de Obra Planejado x Real).
+"""
+import re
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+MONTHS_MAP = {
+    'jan': 1, 'fev': 2, 'mar': 3, 'abr': 4, 'mai': 5, 'jun': 6,
+    'jul': 7, 'ago': 8, 'set': 9, 'out': 10, 'nov': 11, 'dez': 12
+}
+
+
+def parse_month_year(col):
+    """
+    Identifica colunas como 'jan/25', 'fev/25', etc. (texto),
+    convertendo em datetime(2025,1,1), datetime(2025,2,1), etc.
+    Retorna None se não casar.
+    """
+    match = re.match(r"^([a-zA-Z]{3})/(\d{2})$", col.strip().lower())
+    if match:
+        mon_str = match.group(1)
+        year_str = match.group(2)
+        mes = MONTHS_MAP.get(mon_str, None)
+        ano = 2000 + int(year_str)
+        if mes:
+            return datetime(ano, mes, 1)
+    return None
+
+def cumulative_series(dates, values, grid):
+    """
+    Para cada data de `grid`, soma de `values` cujas `dates` são <= a data
+    (datas vazias são ignoradas e valores vazios contam como 0).
+    Uma ordenação + cumsum + searchsorted, em vez de uma soma filtrada por ponto.
+    Retorna uma Series indexada por `grid`.
+    """
+    grid = pd.DatetimeIndex(grid)
+    dates = pd.to_datetime(pd.Series(dates), errors="coerce").to_numpy("datetime64[ns]")
+    values = pd.to_numeric(pd.Series(values), errors="coerce").fillna(0).to_numpy(dtype=float)
+
+    valid = ~np.isnat(dates)
+    order = np.argsort(dates[valid], kind="stable")
+    sorted_dates = dates[valid][order]
+    cumulative = np.concatenate(([0.0], np.cumsum(values[valid][order])))
+
+    positions = np.searchsorted(sorted_dates, grid.to_numpy("datetime64[ns]"), side="right")
+    return pd.Series(cumulative[positions], index=grid)
+
+def monthly_columns(df, parser=parse_month_year):
+    """
+    Colunas mensais do DataFrame (ex.: 'jan/25') reconhecidas por `parser`,
+    como lista ordenada de (data, nome da coluna).
+    """
+    found = []
+    for col in df.columns:
+        if isinstance(col, str):
+            dt_parsed = parser(col)
+            if dt_parsed:
+                found.append((dt_parsed, col))
+    found.sort(key=lambda x: x[0])
+    return found
+
+def monthly_columns_series(df, grid=None, parser=parse_month_year):
+    """
+    Total mensal das colunas reconhecidas por `parser`, somadas de uma só vez.
+    Retorna uma Series indexada pela data do mês; se `grid` for informado,
+    é reindexada nele (meses sem coluna ficam com 0).
+    """
+    found = monthly_columns(df, parser)
+    if found:
+        month_dates, cols = zip(*found)
+        totals = df[list(cols)].apply(pd.to_numeric, errors="coerce").fillna(0).sum().to_numpy()
+        series = pd.Series(totals, index=pd.DatetimeIndex(month_dates)).groupby(level=0).sum()
+    else:
+        series = pd.Series(dtype=float, index=pd.DatetimeIndex([]))
+    if grid is not None:
+        series = series.reindex(pd.DatetimeIndex(grid), fill_value=0)
+    return series
@@ -0,0 +1,68 @@
+"""
+Separação da coluna "Garantia Solicitada" da aba engenharia.
+
+O texto é interpretado uma única vez por valor distinto (as categorias), com
+operações vetorizadas de texto, e o resultado é expandido para as linhas pelos
+códigos da categoria. As colunas geradas são categóricas, o que deixa filtros e
+agrupamentos posteriores baratos.
+
+Duas convenções coexistem no painel:
+  - Sistemas Construtivos: "Grupo Construtivo - Sistema Construtivo"
+  - Assistência Técnica:   "Sistema Construtivo - Tipo de Falha" (ou com ":")
+"""
+import numpy as np
+import pandas as pd
+
+
+def _expand(values, parse_categories):
+    """
+    Aplica `parse_categories` (que recebe os valores distintos como Series de texto e
+    devolve um DataFrame alinhado a eles) e expande o resultado para todas as linhas.
+    """
+    values = pd.Series(values)
+    cat = values.astype("category")
+    categories = pd.Series(cat.cat.categories.astype(str))
+    parsed = parse_categories(categories)
+    codes = cat.cat.codes.to_numpy()
+
+    columns = {}
+    for col in parsed.columns:
+        col_codes, uniques = pd.factorize(parsed[col], sort=True)
+        # código -1 (valor vazio) aponta para o último elemento, que também é -1
+        row_codes = np.append(col_codes, -1)[codes]
+        columns[col] = pd.Categorical.from_codes(row_codes, categories=uniques)
+    return pd.DataFrame(columns, index=values.index)
+
+def _split_first(texts, sep):
+    """Divide no primeiro `sep`; a segunda parte fica vazia (NaN) quando não há separador."""
+    if texts.empty:
+        return texts, texts
+    parts = texts.str.partition(sep)
+    after = parts[2].str.strip().where(parts[1] != "")
+    return parts[0].str.strip(), after
+
+def split_grupo_sistema(values):
+    """
+    Convenção de Sistemas Construtivos:
+      - Grupo Construtivo: tudo antes do primeiro "-" (ou o texto inteiro, se não houver "-")
+      - Sistema Construtivo: tudo depois do primeiro "-" ("" se não houver)
+    Valores vazios geram vazios nas duas colunas.
+    """
+    def parse(texts):
+        grupo, sistema = _split_first(texts, "-")
+        return pd.DataFrame({
+            "Grupo Construtivo": grupo,
+            "Sistema Construtivo": sistema.fillna(""),
+        })
+    return _expand(values, parse)
+
+def split_sistema_falha(values):
+    """
+    Convenção da Assistência Técnica (" - " é tratado como ":"):
+      - Sistema Construtivo: tudo antes do primeiro ":" (ou o texto inteiro)
+      - Tipo de Falha: tudo depois do primeiro ":" (vazio se não houver)
+    """
+    def parse(texts):
+        sistema, tipo = _split_first(texts.str.replace(" - ", ": ", regex=False), ":")
+        return pd.DataFrame({"Sistema Construtivo": sistema, "Tipo de Falha": tipo})
+    return _expand(values, parse)
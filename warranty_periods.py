@@ -0,0 +1,88 @@
+"""
+Classificação de períodos de garantia (Pós Entrega, 1° ao 5° Ano, após 5 Anos).
+
+O número de meses decorridos segue exatamente a regra do
+`relativedelta(fim, inicio)` (anos * 12 + meses), mas é calculado de uma vez
+sobre arrays int64 de datas, sem criar objetos datetime linha a linha.
+"""
+import numpy as np
+import pandas as pd
+
+# Limites superiores (inclusivos) de meses decorridos de cada faixa
+PERIOD_EDGES = np.array([3, 12, 24, 36, 48, 60])
+PERIOD_LABELS = [
+    "Despesas Pós Entrega",
+    "Despesas 1° Ano",
+    "Despesas 2° Ano",
+    "Despesas 3° Ano",
+    "Despesas 4° Ano",
+    "Despesas 5° Ano",
+    "Despesas após 5 Anos",
+]
+
+_NS_PER_DAY = np.int64(86_400_000_000_000)
+
+
+def _to_datetime64(values, size):
+    """Converte Series/array/escalar de datas em array datetime64[ns] com `size` posições."""
+    if isinstance(values, (pd.Series, pd.Index, np.ndarray, list)):
+        arr = pd.to_datetime(pd.Series(values), errors="coerce").to_numpy("datetime64[ns]")
+    else:
+        scalar = pd.to_datetime(values, errors="coerce")
+        arr = np.full(size, np.datetime64("NaT", "ns") if pd.isnull(scalar) else scalar.to_datetime64(), dtype="datetime64[ns]")
+    return arr
+
+def _add_months(month_start, day_offset_ns, months):
+    """
+    Soma `months` ao mês de `month_start` (datetime64[M]) mantendo o dia/horário
+    (`day_offset_ns` desde o início do mês) e limitando o dia ao fim do mês,
+    como faz o relativedelta.
+    """
+    target = month_start + months.astype("timedelta64[M]")
+    days_in_month = ((target + np.timedelta64(1, "M")).astype("datetime64[D]")
+                     - target.astype("datetime64[D]")).astype(np.int64)
+    day = np.minimum(day_offset_ns // _NS_PER_DAY, days_in_month - 1)
+    time_of_day = day_offset_ns % _NS_PER_DAY
+    return target.astype("datetime64[ns]").astype(np.int64) + day * _NS_PER_DAY + time_of_day
+
+def elapsed_months(start, end):
+    """
+    Meses inteiros decorridos de `start` até `end` (negativo se `end` for anterior),
+    idêntico a `relativedelta(end, start).years * 12 + relativedelta(end, start).months`.
+    Aceita Series/arrays ou escalares (ex.: a data de hoje). Retorna float64 com NaN
+    onde alguma das datas estiver vazia.
+    """
+    size = max(len(v) if isinstance(v, (pd.Series, pd.Index, np.ndarray, list)) else 1 for v in (start, end))
+    start = _to_datetime64(start, size)
+    end = _to_datetime64(end, size)
+    valid = ~(np.isnat(start) | np.isnat(end))
+    start = np.where(valid, start, np.datetime64(0, "ns"))
+    end = np.where(valid, end, np.datetime64(0, "ns"))
+
+    start_month = start.astype("datetime64[M]")
+    end_month = end.astype("datetime64[M]")
+    start_offset = start.astype(np.int64) - start_month.astype("datetime64[ns]").astype(np.int64)
+    months = (end_month - start_month).astype(np.int64)
+
+    # Ajuste quando a data "início + meses" passa do fim (mesma correção do relativedelta)
+    shifted = _add_months(start_month, start_offset, months)
+    end_ns = end.astype(np.int64)
+    forward = end_ns >= start.astype(np.int64)
+    months = months - (forward & (end_ns < shifted)) + (~forward & (end_ns > shifted))
+
+    return np.where(valid, months, np.nan)
+
+def classify_warranty_period(start, end, before_label="Antes de CVCO", missing_label="Sem Data"):
+    """
+    Classifica o intervalo `start` -> `end` nas faixas de PERIOD_LABELS
+    (até 3 meses, até 12, 24, 36, 48, 60 e acima de 60 meses).
+    Intervalos negativos recebem `before_label`; datas vazias, `missing_label`.
+    Retorna um array de textos alinhado às entradas.
+    """
+    months = elapsed_months(start, end)
+    missing = np.isnan(months)
+    bucket = np.searchsorted(PERIOD_EDGES, np.where(missing, 0, months), side="left")
+    labels = np.array(PERIOD_LABELS, dtype=object)[bucket]
+    labels[months < 0] = before_label
+    labels[missing] = missing_label
+    return labels